@@ -32,6 +32,7 @@ from open_inwoner.openklant.wrap import (
     fetch_klantcontactmomenten,
     get_fetch_parameters,
     get_kcm_answer_mapping,
+    mark_kcm_answer_seen,
 )
 from open_inwoner.openzaak.clients import MultiZgwClientProxy
 from open_inwoner.openzaak.models import ZGWApiGroupConfig
@@ -187,14 +188,11 @@ class KlantContactMomentListView(
                 if glom(item, "contactmoment.kanaal") not in exclude_range
             ]
 
+        local_kcm_mapping = get_kcm_answer_mapping(
+            [kcm.contactmoment for kcm in kcms], self.request.user
+        )
         ctx["contactmomenten"] = [
-            self.get_kcm_data(
-                kcm,
-                local_kcm_mapping=get_kcm_answer_mapping(
-                    [kcm.contactmoment for kcm in kcms], self.request.user
-                ),
-            )
-            for kcm in kcms
+            self.get_kcm_data(kcm, local_kcm_mapping=local_kcm_mapping) for kcm in kcms
         ]
         paginator_dict = self.paginate_with_context(ctx["contactmomenten"])
         ctx.update(paginator_dict)
@@ -228,12 +226,7 @@ class KlantContactMomentDetailView(KlantContactMomentBaseView):
         if not kcm:
             raise Http404()
 
-        local_kcm, is_created = KlantContactMomentAnswer.objects.get_or_create(  # noqa
-            user=self.request.user, contactmoment_url=kcm.contactmoment.url
-        )
-        if not local_kcm.is_seen:
-            local_kcm.is_seen = True
-            local_kcm.save()
+        mark_kcm_answer_seen(kcm.contactmoment, self.request.user)
 
         zaak = None
         case_url = None
@@ -1,6 +1,13 @@
+from io import BytesIO
+from unittest.mock import patch
+
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 
+from open_inwoner.apimock.views import DocumentenMockListView
+from open_inwoner.utils.files import MultipartFileStream
+
 
 class APIMockTest(TestCase):
     def test_basic_response(self):
@@ -37,3 +44,84 @@ class APIMockTest(TestCase):
         response = self.client.get(url)
         # status 403 if we get blocked on directory traversal
         self.assertEqual(response.status_code, 403)
+
+
+class DocumentenMockTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def upload_part(self, part: dict, lock: str, file, offset: int):
+        body = MultipartFileStream(
+            {"lock": lock},
+            "inhoud",
+            file,
+            filename="document.txt",
+            offset=offset,
+            length=part["omvang"],
+        )
+        return self.client.put(
+            part["url"], data=b"".join(body), content_type=body.content_type
+        )
+
+    @patch.object(DocumentenMockListView, "part_size", 4)
+    def test_upload_in_parts(self):
+        file = BytesIO(b"some content")
+        response = self.client.post(
+            reverse("apimock:documenten_list"),
+            data={"titel": "document", "inhoud": None, "bestandsomvang": 12},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+
+        document = response.json()
+        self.assertTrue(document["locked"])
+        self.assertEqual(
+            [part["omvang"] for part in document["bestandsdelen"]], [4, 4, 4]
+        )
+
+        # incomplete
+        response = self.client.post(
+            f"{document['url']}/unlock",
+            data={"lock": document["lock"]},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+        for index, part in enumerate(document["bestandsdelen"]):
+            response = self.upload_part(part, document["lock"], file, index * 4)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.json()["voltooid"])
+
+        response = self.client.post(
+            f"{document['url']}/unlock",
+            data={"lock": document["lock"]},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 204)
+
+        response = self.client.get(document["url"])
+        self.assertFalse(response.json()["locked"])
+
+    @patch.object(DocumentenMockListView, "part_size", 4)
+    def test_upload_part_with_invalid_lock_or_size(self):
+        response = self.client.post(
+            reverse("apimock:documenten_list"),
+            data={"titel": "document", "inhoud": None, "bestandsomvang": 6},
+            content_type="application/json",
+        )
+        document = response.json()
+        file = BytesIO(b"some content")
+
+        response = self.upload_part(
+            document["bestandsdelen"][0], "bad-lock", file, offset=0
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = self.upload_part(
+            {**document["bestandsdelen"][1], "omvang": 3},
+            document["lock"],
+            file,
+            offset=4,
+        )
+        self.assertEqual(response.status_code, 400)
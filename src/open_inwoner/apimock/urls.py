@@ -1,10 +1,36 @@
 from django.urls import path
 
-from open_inwoner.apimock.views import APIMockView
+from open_inwoner.apimock.views import (
+    APIMockView,
+    DocumentenMockBestandsdeelView,
+    DocumentenMockDetailView,
+    DocumentenMockListView,
+    DocumentenMockUnlockView,
+)
 
 app_name = "apimock"
 
 urlpatterns = [
+    path(
+        "documenten/enkelvoudiginformatieobjecten",
+        DocumentenMockListView.as_view(),
+        name="documenten_list",
+    ),
+    path(
+        "documenten/enkelvoudiginformatieobjecten/<uuid:uuid>",
+        DocumentenMockDetailView.as_view(),
+        name="documenten_detail",
+    ),
+    path(
+        "documenten/enkelvoudiginformatieobjecten/<uuid:uuid>/unlock",
+        DocumentenMockUnlockView.as_view(),
+        name="documenten_unlock",
+    ),
+    path(
+        "documenten/bestandsdelen/<uuid:uuid>",
+        DocumentenMockBestandsdeelView.as_view(),
+        name="documenten_bestandsdeel",
+    ),
     path(
         "<slug:set_name>/<slug:api_name>/<path:endpoint>",
         APIMockView.as_view(),
@@ -1,9 +1,16 @@
 import json
+import math
+import uuid
 from pathlib import Path
 
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
-from django.http import Http404, HttpRequest, JsonResponse
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.http.multipartparser import MultiPartParser
+from django.urls import reverse
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 
 
 def inject_filter_parameter_values(request: HttpRequest, data: dict) -> dict:
@@ -69,6 +76,129 @@ class APIMockView(View):
             return JsonResponse(data, safe=False)
 
 
+class DocumentenMockMixin:
+    """
+    stateful stand-in for the upload of documents in parts ("bestandsdelen") of the
+    Documenten API, to develop and test without a Documenten API
+
+    the documents are kept in the cache, the content of the parts is not stored
+    """
+
+    part_size = 1024 * 1024
+    timeout = 60 * 60
+
+    @staticmethod
+    def get_document_key(document_uuid) -> str:
+        return f"apimock:documenten:{document_uuid}"
+
+    @staticmethod
+    def get_part_key(part_uuid) -> str:
+        return f"apimock:documenten:bestandsdeel:{part_uuid}"
+
+    def get_document_state(self, document_uuid) -> dict:
+        if not (state := cache.get(self.get_document_key(document_uuid))):
+            raise Http404("unknown document")
+        return state
+
+    def set_document_state(self, state: dict):
+        cache.set(
+            self.get_document_key(state["document"]["uuid"]),
+            state,
+            timeout=self.timeout,
+        )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class DocumentenMockListView(DocumentenMockMixin, View):
+    def post(self, request, *args, **kwargs):
+        data = json.loads(request.body)
+        size = data.get("bestandsomvang") or 0
+        if data.get("inhoud") or not size:
+            return JsonResponse(
+                {"detail": "only uploads in parts are supported"}, status=400
+            )
+
+        document_uuid = str(uuid.uuid4())
+        lock = uuid.uuid4().hex
+        parts = []
+        for index in range(math.ceil(size / self.part_size)):
+            part_uuid = str(uuid.uuid4())
+            cache.set(self.get_part_key(part_uuid), document_uuid, timeout=self.timeout)
+            parts.append(
+                {
+                    "url": request.build_absolute_uri(
+                        reverse(
+                            "apimock:documenten_bestandsdeel",
+                            kwargs={"uuid": part_uuid},
+                        )
+                    ),
+                    "volgnummer": index + 1,
+                    "omvang": min(self.part_size, size - index * self.part_size),
+                    "voltooid": False,
+                    "lock": lock,
+                }
+            )
+
+        document = {
+            **data,
+            "url": request.build_absolute_uri(
+                reverse("apimock:documenten_detail", kwargs={"uuid": document_uuid})
+            ),
+            "uuid": document_uuid,
+            "locked": True,
+            "bestandsdelen": parts,
+        }
+        self.set_document_state({"document": document, "lock": lock})
+
+        return JsonResponse({**document, "lock": lock}, status=201)
+
+
+class DocumentenMockDetailView(DocumentenMockMixin, View):
+    def get(self, request, *args, **kwargs):
+        return JsonResponse(self.get_document_state(kwargs["uuid"])["document"])
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class DocumentenMockBestandsdeelView(DocumentenMockMixin, View):
+    def put(self, request, *args, **kwargs):
+        if not (document_uuid := cache.get(self.get_part_key(kwargs["uuid"]))):
+            raise Http404("unknown bestandsdeel")
+        state = self.get_document_state(document_uuid)
+
+        data, files = MultiPartParser(
+            request.META, request, request.upload_handlers, request.encoding
+        ).parse()
+        if data.get("lock") != state["lock"]:
+            return JsonResponse({"detail": "invalid lock"}, status=400)
+
+        part = next(
+            part
+            for part in state["document"]["bestandsdelen"]
+            if part["url"].endswith(f"/{kwargs['uuid']}")
+        )
+        if not (inhoud := files.get("inhoud")) or inhoud.size != part["omvang"]:
+            return JsonResponse({"detail": "invalid size"}, status=400)
+
+        part["voltooid"] = True
+        self.set_document_state(state)
+        return JsonResponse(part)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class DocumentenMockUnlockView(DocumentenMockMixin, View):
+    def post(self, request, *args, **kwargs):
+        state = self.get_document_state(kwargs["uuid"])
+
+        if json.loads(request.body).get("lock") != state["lock"]:
+            return JsonResponse({"detail": "invalid lock"}, status=400)
+        if not all(part["voltooid"] for part in state["document"]["bestandsdelen"]):
+            return JsonResponse({"detail": "incomplete upload"}, status=400)
+
+        state["document"]["locked"] = False
+        self.set_document_state(state)
+        return HttpResponse(status=204)
+
+
 def process_urls(data, prefix, url_replacers):
     """
     recursive replace URL prefixes
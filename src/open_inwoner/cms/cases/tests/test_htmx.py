@@ -391,12 +391,6 @@ class CasesPlaywrightTests(
                 f"{ZAKEN_ROOT}rollen?zaak={self.zaak['url']}",
                 json=paginated_response([self.user_role]),
             ),
-            m.get(
-                f"{ZAKEN_ROOT}rollen?zaak={self.zaak['url']}&omschrijvingGeneriek={RolOmschrijving.initiator}",
-                # Taiga #961 this is not an accurate OpenZaak response as it has a 'behandelaar' even when we filter on 'initiator'
-                # but eSuite doesn't filter the response in the API, so we use filtering in Python to remove the not-initiator
-                json=paginated_response([self.user_role]),
-            ),
             # upload
             m.post(
                 f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten",
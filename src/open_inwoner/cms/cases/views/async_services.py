@@ -0,0 +1,272 @@
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+from typing import Awaitable, Callable
+
+from django.conf import settings
+from django.http import HttpRequest
+
+import httpx
+from asgiref.sync import async_to_sync
+
+from open_inwoner.openzaak.api_models import Zaak
+from open_inwoner.openzaak.async_clients import (
+    AsyncCatalogiClient,
+    AsyncZakenClient,
+    ConcurrencyBudget,
+)
+from open_inwoner.openzaak.models import OpenZaakConfig, ZGWApiGroupConfig
+from open_inwoner.openzaak.utils import get_user_fetch_parameters, is_zaak_visible
+from open_inwoner.utils.circuit_breaker import is_circuit_open
+
+from .services import CaseListService, CaseResolver, ZaakWithApiGroup
+
+logger = logging.getLogger(__name__)
+
+GroupClients = tuple[AsyncZakenClient, AsyncCatalogiClient]
+
+
+class AsyncCaseResolver:
+    """
+    asyncio-based alternative to the thread pools of `CaseListService`
+
+    All API groups, cases and resolvers are fetched as a single set of tasks, limited
+    by one `ConcurrencyBudget` (`ZGW_ASYNC_MAX_CONCURRENCY` requests in total and
+    `ZGW_ASYNC_MAX_CONCURRENCY_PER_BACKEND` per service) instead of nested thread pools.
+
+    Database access is not allowed in the event loop, so the configuration is read
+    before, and the cases are filtered and matched with their configs after running it.
+    """
+
+    timeouts = {
+        "zgw_api_groups": 60,
+        "resolve_case_instance": 15,
+    }
+    # custom httpx transport for the clients (e.g. for testing)
+    transport: httpx.AsyncBaseTransport | None = None
+
+    def __init__(
+        self,
+        request: HttpRequest,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.request = request
+        if transport:
+            self.transport = transport
+        self.fetch_parameters = get_user_fetch_parameters(request)
+
+    def _build_clients(self, groups: list[ZGWApiGroupConfig]) -> dict:
+        config = OpenZaakConfig.get_solo()
+        budget = ConcurrencyBudget(
+            settings.ZGW_ASYNC_MAX_CONCURRENCY,
+            settings.ZGW_ASYNC_MAX_CONCURRENCY_PER_BACKEND,
+        )
+        return {
+            group: (
+                AsyncZakenClient(
+                    group.zrc_service,
+                    budget,
+                    zaak_max_confidentiality=config.zaak_max_confidentiality,
+                    transport=self.transport,
+                ),
+                AsyncCatalogiClient(
+                    group.ztc_service, budget, transport=self.transport
+                ),
+            )
+            for group in groups
+        }
+
+    def _run(
+        self,
+        groups: list[ZGWApiGroupConfig],
+        func: Callable[[ZGWApiGroupConfig, GroupClients], Awaitable[list[Zaak]]],
+    ) -> dict[ZGWApiGroupConfig, list[Zaak]]:
+        """
+        Run `func` for every API group in one event loop, failing groups are skipped
+        """
+        clients = self._build_clients(groups)
+
+        async def run_all():
+            async with AsyncExitStack() as stack:
+                for zaken_client, catalogi_client in clients.values():
+                    await stack.enter_async_context(zaken_client)
+                    await stack.enter_async_context(catalogi_client)
+
+                results = await asyncio.gather(
+                    *(
+                        asyncio.wait_for(
+                            func(group, clients[group]),
+                            timeout=self.timeouts["zgw_api_groups"],
+                        )
+                        for group in groups
+                    ),
+                    return_exceptions=True,
+                )
+
+            cases_by_group = {}
+            for group, result in zip(groups, results):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "Error while fetching and pre-processing cases for API group %s",
+                        group,
+                        exc_info=result,
+                    )
+                    continue
+                cases_by_group[group] = result
+            return cases_by_group
+
+        return async_to_sync(run_all)()
+
+    def get_cases(self, lazy: bool = False) -> list[ZaakWithApiGroup]:
+        """
+        Equivalent of `CaseListService.get_cases()`
+        """
+        all_api_groups = [
+            group
+            for group in ZGWApiGroupConfig.objects.select_related(
+                "zrc_service", "ztc_service"
+            )
+            if not is_circuit_open(group.zrc_service)
+        ]
+
+        async def get_cases_for_api_group(group, clients):
+            zaken_client, catalogi_client = clients
+            cases = await zaken_client.fetch_cases(**self.fetch_parameters)
+            if lazy:
+                return await self._resolve_case_types(cases, catalogi_client)
+            return await self._resolve_cases(cases, zaken_client, catalogi_client)
+
+        cases_by_group = self._run(all_api_groups, get_cases_for_api_group)
+
+        cases_with_api_group = []
+        for group in all_api_groups:
+            group_cases = cases_by_group.get(group, [])
+            if not lazy:
+                for case in group_cases:
+                    CaseListService.resolve_case_configs(case)
+
+            filtered_cases = [
+                case for case in group_cases if case.status and is_zaak_visible(case)
+            ]
+            filtered_cases.sort(key=lambda case: case.startdatum, reverse=True)
+            cases_with_api_group += [
+                ZaakWithApiGroup(zaak=case, api_group=group) for case in filtered_cases
+            ]
+
+        return cases_with_api_group
+
+    def resolve_cases(self, cases_by_group: dict[ZGWApiGroupConfig, list[Zaak]]):
+        """
+        Equivalent of `CaseListService.resolve_cases()` for multiple API groups
+
+        The cases are resolved in place.
+        """
+
+        async def resolve_cases_for_api_group(group, clients):
+            return await self._resolve_cases(cases_by_group[group], *clients)
+
+        resolved_cases_by_group = self._run(
+            list(cases_by_group), resolve_cases_for_api_group
+        )
+        for group_cases in resolved_cases_by_group.values():
+            for case in group_cases:
+                CaseListService.resolve_case_configs(case)
+
+    #
+    # resolvers
+    #
+
+    @staticmethod
+    async def _resolve_case_types(
+        cases: list[Zaak], client: AsyncCatalogiClient
+    ) -> list[Zaak]:
+        case_type_urls = list(
+            {case.zaaktype for case in cases if isinstance(case.zaaktype, str)}
+        )
+        results = await asyncio.gather(
+            *(client.fetch_single_case_type(url) for url in case_type_urls),
+            return_exceptions=True,
+        )
+
+        case_types = {}
+        for url, result in zip(case_type_urls, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Error while resolving zaaktype %s with client %s",
+                    url,
+                    client,
+                    exc_info=result,
+                )
+                continue
+            case_types[url] = result
+
+        return CaseListService.apply_case_types(cases, case_types)
+
+    async def _resolve_cases(
+        self,
+        cases: list[Zaak],
+        zaken_client: AsyncZakenClient,
+        catalogi_client: AsyncCatalogiClient,
+    ) -> list[Zaak]:
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    self._resolve_case(case, zaken_client, catalogi_client),
+                    timeout=self.timeouts["resolve_case_instance"],
+                )
+                for case in cases
+            ),
+            return_exceptions=True,
+        )
+
+        resolved_cases = []
+        for case, result in zip(cases, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Error while resolving case %s with client %s",
+                    case,
+                    zaken_client,
+                    exc_info=result,
+                )
+                continue
+            resolved_cases.append(result)
+        return resolved_cases
+
+    async def _resolve_case(
+        self,
+        case: Zaak,
+        zaken_client: AsyncZakenClient,
+        catalogi_client: AsyncCatalogiClient,
+    ) -> Zaak:
+        logger.debug("Resolving case %s", case.identificatie)
+
+        results = await asyncio.gather(
+            *(
+                self._run_case_resolver(resolver, zaken_client, catalogi_client)
+                for resolver in CaseListService.get_case_resolvers(case)
+            ),
+            return_exceptions=True,
+        )
+        for update_case in results:
+            if isinstance(update_case, BaseException):
+                logger.error("Error in resolving case", exc_info=update_case)
+            elif update_case is not None:
+                update_case(case)
+
+        return case
+
+    @staticmethod
+    async def _run_case_resolver(
+        resolver: CaseResolver,
+        zaken_client: AsyncZakenClient,
+        catalogi_client: AsyncCatalogiClient,
+    ) -> Callable[[Zaak], None] | None:
+        """
+        Async equivalent of `run_case_resolver()`
+        """
+        try:
+            fetch = next(resolver)
+            while True:
+                fetch = resolver.send(await fetch(zaken_client, catalogi_client))
+        except StopIteration as stop:
+            return stop.value
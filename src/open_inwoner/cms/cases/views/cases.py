@@ -71,7 +71,8 @@ class InnerCaseListView(
 
         # update ctx with open submissions and cases (possibly fitered)
         open_submissions: Sequence[UniformCase] = case_service.get_submissions()
-        preprocessed_cases: Sequence[UniformCase] = case_service.get_cases()
+        # cases are only fully resolved after pagination (see below)
+        preprocessed_cases: Sequence[UniformCase] = case_service.get_cases(lazy=True)
 
         if config.zaken_filter_enabled:
             case_status_frequencies = case_service.get_case_status_frequencies()
@@ -109,6 +110,7 @@ class InnerCaseListView(
         paginator_dict = self.paginate_with_context(
             [*open_submissions, *preprocessed_cases]
         )
+        case_service.resolve_cases_for_page(paginator_dict["object_list"])
         case_dicts = [case.process_data() for case in paginator_dict["object_list"]]
 
         context["cases"] = case_dicts
@@ -117,6 +119,7 @@ class InnerCaseListView(
         self.log_access_cases(case_dicts)
 
         # other data
+        context["unavailable_api_groups"] = case_service.get_unavailable_api_groups()
         context["hxget"] = reverse("cases:cases_content")
         context["title_text"] = config.title_text
 
@@ -1,3 +1,4 @@
+import copy
 import logging
 
 from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin
@@ -5,9 +6,16 @@ from django.template.response import TemplateResponse
 from django.utils.translation import gettext_lazy as _
 
 from open_inwoner.kvk.branches import get_kvk_branch_number
+from open_inwoner.openzaak.api_models import Rol
+from open_inwoner.openzaak.clients import (
+    filter_roles_for_bsn,
+    filter_roles_for_kvk_or_rsin,
+    filter_roles_for_vestigingsnummer,
+)
 from open_inwoner.openzaak.models import OpenZaakConfig, ZGWApiGroupConfig
 from open_inwoner.openzaak.types import UniformCase
 from open_inwoner.openzaak.utils import is_zaak_visible
+from open_inwoner.utils.request_cache import get_request_cache
 from open_inwoner.utils.views import LogMixin
 
 logger = logging.getLogger(__name__)
@@ -64,13 +72,22 @@ class CaseAccessMixin(AccessMixin):
         if is_retrieving_case:
             api_group = ZGWApiGroupConfig.objects.get(pk=api_group_id)
             client = api_group.zaken_client
-            self.case = client.fetch_single_case(object_id)
+            # the case is memoized for the request, but copied because we resolve
+            # the zaaktype on it below
+            self.case = copy.copy(
+                get_request_cache(request).get_or_set(
+                    ("zaken:single_case", api_group.pk, str(object_id)),
+                    lambda: client.fetch_single_case(object_id),
+                )
+            )
             if self.case:
+                # load the roles once for the request, the role checks below and
+                # the views use the same roles
+                case_roles = self.get_case_roles(api_group, self.case.url)
+
                 # check if we have a role in this case
                 if request.user.bsn:
-                    if not client.fetch_roles_for_case_and_bsn(
-                        self.case.url, request.user.bsn
-                    ):
+                    if not filter_roles_for_bsn(case_roles, request.user.bsn):
                         logger.debug(
                             f"CaseAccessMixin - permission denied: no role for the case {self.case.url}"
                         )
@@ -82,20 +99,15 @@ class CaseAccessMixin(AccessMixin):
                         identifier = self.request.user.rsin
 
                     vestigingsnummer = get_kvk_branch_number(self.request.session)
-                    if (
-                        vestigingsnummer
-                        and not client.fetch_roles_for_case_and_vestigingsnummer(
-                            self.case.url, vestigingsnummer
-                        )
+                    if vestigingsnummer and not filter_roles_for_vestigingsnummer(
+                        case_roles, vestigingsnummer
                     ):
                         logger.debug(
                             f"CaseAccessMixin - permission denied: no role for the case {self.case.url}"
                         )
                         return self.handle_no_permission()
 
-                    if not client.fetch_roles_for_case_and_kvk_or_rsin(
-                        self.case.url, identifier
-                    ):
+                    if not filter_roles_for_kvk_or_rsin(case_roles, identifier):
                         logger.debug(
                             f"CaseAccessMixin - permission denied: no role for the case {self.case.url}"
                         )
@@ -121,6 +133,15 @@ class CaseAccessMixin(AccessMixin):
 
         return super().dispatch(request, *args, **kwargs)
 
+    def get_case_roles(self, api_group: ZGWApiGroupConfig, case_url: str) -> list[Rol]:
+        """
+        Return all roles of the case, memoized for the request
+        """
+        return get_request_cache(self.request).get_or_set(
+            ("zaken:case_roles", api_group.pk, case_url),
+            lambda: api_group.zaken_client.fetch_case_roles(case_url),
+        )
+
     def handle_no_permission(self):
         if self.request.user.is_authenticated:
             return TemplateResponse(self.request, "pages/cases/403.html")
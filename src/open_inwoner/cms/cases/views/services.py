@@ -3,8 +3,9 @@ import enum
 import functools
 import logging
 from dataclasses import dataclass
-from typing import Callable, TypedDict
+from typing import Any, Callable, Generator, Iterable, TypedDict
 
+from django.conf import settings
 from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
 
@@ -12,12 +13,16 @@ from zgw_consumers.concurrent import parallel
 
 from open_inwoner.openzaak.api_models import OpenSubmission, Zaak
 from open_inwoner.openzaak.clients import CatalogiClient, ZakenClient
+from open_inwoner.openzaak.config_registry import zgw_config_registry
 from open_inwoner.openzaak.models import (
     ZaakTypeConfig,
     ZaakTypeStatusTypeConfig,
     ZGWApiGroupConfig,
 )
+from open_inwoner.openzaak.types import UniformCase
 from open_inwoner.openzaak.utils import get_user_fetch_parameters, is_zaak_visible
+from open_inwoner.utils.circuit_breaker import is_circuit_open
+from open_inwoner.utils.request_cache import RequestCache, get_request_cache
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +59,24 @@ class SubmissionWithApiGroup:
         return {**self.submission.process_data(), "api_group": self.api_group}
 
 
+# A case resolver yields the fetches it needs, as functions of the Zaken and Catalogi
+# clients, and returns a function to update the case with the results (or `None`).
+# Running the fetches is up to the caller, so the resolvers are shared with the async
+# engine (see `AsyncCaseResolver`).
+CaseResolver = Generator[Callable[[Any, Any], Any], Any, Callable[[Zaak], None] | None]
+
+
+def run_case_resolver(
+    resolver: CaseResolver, zaken_client: ZakenClient, catalogi_client: CatalogiClient
+) -> Callable[[Zaak], None] | None:
+    try:
+        fetch = next(resolver)
+        while True:
+            fetch = resolver.send(fetch(zaken_client, catalogi_client))
+    except StopIteration as stop:
+        return stop.value
+
+
 class ThreadLimits(TypedDict):
     zgw_api_groups: int
     resolve_case_list: int
@@ -62,11 +85,14 @@ class ThreadLimits(TypedDict):
 
 class CaseListService:
     request: HttpRequest
+    _request_cache: RequestCache
     _thread_limits: ThreadLimits
     _thread_timeouts: ThreadLimits
 
     def __init__(self, request: HttpRequest):
         self.request = request
+        # fetched and resolved listings are shared by all services for this request
+        self._request_cache = get_request_cache(request)
         self._thread_timeouts = {
             "zgw_api_groups": 60,
             "resolve_case_instance": 15,
@@ -109,6 +135,11 @@ class CaseListService:
         )
 
     def get_submissions(self) -> list[SubmissionWithApiGroup]:
+        return self._request_cache.get_or_set(
+            ("cases:submissions",), self._get_submissions
+        )
+
+    def _get_submissions(self) -> list[SubmissionWithApiGroup]:
         all_api_groups = list(
             ZGWApiGroupConfig.objects.exclude(form_service__isnull=True)
         )
@@ -147,7 +178,9 @@ class CaseListService:
         return CaseFilterFormOption.OPEN_CASE
 
     def get_case_status_frequencies(self) -> dict[CaseFilterFormOption, int]:
-        cases = self.get_cases()
+        # the filter status only depends on raw case data, so there is no need
+        # to resolve statuses and results for the frequencies
+        cases = self.get_cases(lazy=True)
         submissions = self.get_submissions()
 
         case_statuses = [self.get_case_filter_status(case.zaak) for case in cases]
@@ -159,12 +192,38 @@ class CaseListService:
             status: case_statuses.count(status) for status in list(CaseFilterFormOption)
         }
 
-    def get_cases(self) -> list[ZaakWithApiGroup]:
-        all_api_groups = list(ZGWApiGroupConfig.objects.all())
+    def get_cases(self, lazy: bool = False) -> list[ZaakWithApiGroup]:
+        """
+        Fetch the cases for the user from all API groups
+
+        :param lazy: if `True`, only the case types are resolved (which are needed to
+            determine visibility). The remaining resolution (status, resultaat,
+            configs) is postponed until `resolve_cases_for_page()` is called with
+            the cases that are actually displayed.
+
+        Note: the result is memoized for the duration of the request.
+        """
+        return self._request_cache.get_or_set(
+            ("cases:cases", lazy), functools.partial(self._get_cases, lazy=lazy)
+        )
+
+    def _get_cases(self, lazy: bool = False) -> list[ZaakWithApiGroup]:
+        if settings.ZGW_ASYNC_ENGINE_ENABLED:
+            from .async_services import AsyncCaseResolver
+
+            return AsyncCaseResolver(self.request).get_cases(lazy=lazy)
+
+        # skip the groups that are known to be unavailable instead of waiting for them
+        # (see `get_unavailable_api_groups()`)
+        all_api_groups = [
+            group
+            for group in ZGWApiGroupConfig.objects.all()
+            if not is_circuit_open(group.zrc_service)
+        ]
 
         with parallel(max_workers=self._thread_limits["zgw_api_groups"]) as executor:
             futures = [
-                executor.submit(self._get_cases_for_api_group, group)
+                executor.submit(self._get_cases_for_api_group, group, lazy=lazy)
                 for group in all_api_groups
             ]
 
@@ -190,11 +249,33 @@ class CaseListService:
 
         return cases_with_api_group
 
-    def _get_cases_for_api_group(self, group: ZGWApiGroupConfig) -> list[Zaak]:
+    @staticmethod
+    def get_unavailable_api_groups() -> list[ZGWApiGroupConfig]:
+        """
+        Return the API groups whose cases cannot be (completely) shown, because the
+        circuit breaker of their Zaken or Catalogi API is open
+        """
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return []
+
+        return [
+            group
+            for group in ZGWApiGroupConfig.objects.select_related(
+                "zrc_service", "ztc_service"
+            )
+            if is_circuit_open(group.zrc_service) or is_circuit_open(group.ztc_service)
+        ]
+
+    def _get_cases_for_api_group(
+        self, group: ZGWApiGroupConfig, lazy: bool = False
+    ) -> list[Zaak]:
         raw_cases = group.zaken_client.fetch_cases(
             **get_user_fetch_parameters(self.request)
         )
-        resolved_cases = self.resolve_cases(raw_cases, group)
+        if lazy:
+            resolved_cases = self.resolve_case_types(raw_cases, group)
+        else:
+            resolved_cases = self.resolve_cases(raw_cases, group)
 
         filtered_cases = [
             case for case in resolved_cases if case.status and is_zaak_visible(case)
@@ -235,32 +316,103 @@ class CaseListService:
 
         return resolved_cases
 
+    def resolve_case_types(
+        self,
+        cases: list[Zaak],
+        group: ZGWApiGroupConfig,
+    ) -> list[Zaak]:
+        """
+        Resolve only `case.zaaktype` for `cases`, fetching each distinct case type once
+
+        Cases for which the case type cannot be resolved are dropped, as their
+        visibility cannot be determined.
+        """
+        case_type_urls = list(
+            {case.zaaktype for case in cases if isinstance(case.zaaktype, str)}
+        )
+
+        case_types = {}
+        catalogi_client = group.catalogi_client
+        with catalogi_client:
+            with parallel(
+                max_workers=self._thread_limits["resolve_case_list"]
+            ) as executor:
+                futures = {
+                    executor.submit(catalogi_client.fetch_single_case_type, url): url
+                    for url in case_type_urls
+                }
+
+                for task in concurrent.futures.as_completed(
+                    futures,
+                    timeout=self._thread_timeouts["resolve_case_list"],
+                ):
+                    url = futures[task]
+                    try:
+                        case_types[url] = task.result()
+                    except BaseException:
+                        logger.exception(
+                            "Error while resolving zaaktype %s with API group %s",
+                            url,
+                            group,
+                        )
+
+        return self.apply_case_types(cases, case_types)
+
+    @staticmethod
+    def apply_case_types(cases: list[Zaak], case_types: dict) -> list[Zaak]:
+        """
+        Set the resolved `case_types` (by URL) on `cases`, dropping the cases for which
+        the case type could not be resolved
+        """
+        resolved_cases = []
+        for case in cases:
+            if isinstance(case.zaaktype, str):
+                if not (case_type := case_types.get(case.zaaktype)):
+                    logger.error(
+                        "Unable to resolve zaaktype for url: %s", case.zaaktype
+                    )
+                    continue
+                case.zaaktype = case_type
+            resolved_cases.append(case)
+
+        return resolved_cases
+
+    def resolve_cases_for_page(self, cases: Iterable[UniformCase]) -> None:
+        """
+        Fully resolve the (lazily fetched) cases in `cases`, e.g. a single page
+
+        Submissions are ignored, and cases are resolved in place.
+        """
+        cases_by_group: dict[ZGWApiGroupConfig, list[Zaak]] = {}
+        for case in cases:
+            if isinstance(case, ZaakWithApiGroup):
+                cases_by_group.setdefault(case.api_group, []).append(case.zaak)
+
+        if settings.ZGW_ASYNC_ENGINE_ENABLED:
+            from .async_services import AsyncCaseResolver
+
+            AsyncCaseResolver(self.request).resolve_cases(cases_by_group)
+            return
+
+        for group, group_cases in cases_by_group.items():
+            self.resolve_cases(group_cases, group)
+
     def resolve_case(self, case: Zaak, group: ZGWApiGroupConfig) -> Zaak:
         logger.debug("Resolving case %s with group %s", case.identificatie, group)
 
-        functions = [
-            functools.partial(
-                self._resolve_resultaat_and_resultaat_type,
-                zaken_client=group.zaken_client,
-                catalogi_client=group.catalogi_client,
-            ),
-            functools.partial(
-                self._resolve_status_and_status_type,
-                zaken_client=group.zaken_client,
-                catalogi_client=group.catalogi_client,
-            ),
-            functools.partial(
-                self._resolve_zaak_type,
-                client=group.catalogi_client,
-            ),
-        ]
+        zaken_client, catalogi_client = group.zaken_client, group.catalogi_client
 
         # use contextmanager to ensure the `requests.Session` is reused
-        with group.catalogi_client, group.zaken_client:
+        with catalogi_client, zaken_client:
             with parallel(
                 max_workers=self._thread_limits["resolve_case_instance"]
             ) as executor:
-                futures = [executor.submit(func, case) for func in functions]
+                futures = [
+                    executor.submit(
+                        run_case_resolver, resolver, zaken_client, catalogi_client
+                    )
+                    for resolver in self.get_case_resolvers(case)
+                ]
 
             for task in concurrent.futures.as_completed(
                 futures,
@@ -273,19 +425,27 @@ class CaseListService:
                 except BaseException:
                     logger.exception("Error in resolving case", stack_info=True)
 
+        self.resolve_case_configs(case)
+        return case
+
+    @staticmethod
+    def resolve_case_configs(case: Zaak) -> None:
+        """
+        Set `case.zaaktype_config` and `case.statustype_config` for a resolved case
+        """
         try:
-            zaaktype_config = ZaakTypeConfig.objects.filter_case_type(
-                case.zaaktype
-            ).get()
+            zaaktype_config = zgw_config_registry.get_zaaktype_config(case.zaaktype)
+            if not zaaktype_config:
+                raise ZaakTypeConfig.DoesNotExist
 
             case.zaaktype_config = zaaktype_config
 
-            if zaaktype_config:
-                statustype_config = ZaakTypeStatusTypeConfig.objects.get(
-                    zaaktype_config=zaaktype_config,
-                    statustype_url=case.status.statustype.url,
-                )
-                case.statustype_config = statustype_config
+            statustype_config = zgw_config_registry.get_statustype_config(
+                zaaktype_config, case.status.statustype.url
+            )
+            if not statustype_config:
+                raise ZaakTypeStatusTypeConfig.DoesNotExist
+            case.statustype_config = statustype_config
         except (
             ZaakTypeConfig.DoesNotExist,
             AttributeError,
@@ -297,12 +457,16 @@ class CaseListService:
                 exc_info=True,
             )
 
-        return case
+    @staticmethod
+    def get_case_resolvers(case: Zaak) -> list["CaseResolver"]:
+        return [
+            CaseListService._resolve_resultaat_and_resultaat_type(case),
+            CaseListService._resolve_status_and_status_type(case),
+            CaseListService._resolve_zaak_type(case),
+        ]
 
     @staticmethod
-    def _resolve_zaak_type(
-        case: Zaak, *, client: CatalogiClient
-    ) -> Callable[[Zaak], None] | None:
+    def _resolve_zaak_type(case: Zaak) -> "CaseResolver":
         """
         Resolve `case.zaaktype` (`str`) to a `ZaakType(ZGWModel)` object
 
@@ -313,7 +477,9 @@ class CaseListService:
             logger.debug("Case %s already has a resolved zaaktype", case.identificatie)
             return
 
-        case_type = client.fetch_single_case_type(case.zaaktype)
+        case_type = yield lambda zaken, catalogi: catalogi.fetch_single_case_type(
+            case.zaaktype
+        )
         if not case_type:
             logger.error("Unable to resolve zaaktype for url: %s", case.zaaktype)
             return
@@ -324,9 +490,7 @@ class CaseListService:
         return setter
 
     @staticmethod
-    def _resolve_status_and_status_type(
-        case: Zaak, *, zaken_client: ZakenClient, catalogi_client: CatalogiClient
-    ) -> Callable[[Zaak], None] | None:
+    def _resolve_status_and_status_type(case: Zaak) -> "CaseResolver":
         if not isinstance(case.status, str):
             logger.error(
                 "`case.status` for case %s is not a str but %s",
@@ -335,7 +499,7 @@ class CaseListService:
             )
             return
 
-        status = zaken_client.fetch_single_status(case.status)
+        status = yield lambda zaken, catalogi: zaken.fetch_single_status(case.status)
         if not status:
             logger.error(
                 "Unable to resolve status %s for case %s",
@@ -344,7 +508,9 @@ class CaseListService:
             )
             return None
 
-        status_type = catalogi_client.fetch_single_status_type(status.statustype)
+        status_type = yield lambda zaken, catalogi: catalogi.fetch_single_status_type(
+            status.statustype
+        )
         if not status_type:
             logger.error(
                 "Unable to resolve status_type %s for case %s",
@@ -360,9 +526,7 @@ class CaseListService:
         return setter
 
     @staticmethod
-    def _resolve_resultaat_and_resultaat_type(
-        case: Zaak, *, zaken_client: ZakenClient, catalogi_client: CatalogiClient
-    ) -> Callable[[Zaak], None] | None:
+    def _resolve_resultaat_and_resultaat_type(case: Zaak) -> "CaseResolver":
         if case.resultaat is None:
             return
 
@@ -374,13 +538,15 @@ class CaseListService:
             )
             return
 
-        resultaat = zaken_client.fetch_single_result(case.resultaat)
+        resultaat = yield lambda zaken, catalogi: zaken.fetch_single_result(
+            case.resultaat
+        )
         if not resultaat:
             logger.error("Unable to fetch resultaat for %s", case)
             return
 
-        resultaattype = catalogi_client.fetch_single_resultaat_type(
-            resultaat.resultaattype
+        resultaattype = yield lambda zaken, catalogi: (
+            catalogi.fetch_single_resultaat_type(resultaat.resultaattype)
         )
         if not resultaattype:
             logger.error(
@@ -6,10 +6,11 @@ from datetime import datetime
 
 from django.conf import settings
 from django.contrib import messages
-from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
+from django.core.exceptions import PermissionDenied
 from django.http import (
     Http404,
     HttpRequest,
+    HttpResponse,
     HttpResponseRedirect,
     StreamingHttpResponse,
 )
@@ -23,8 +24,10 @@ from django_htmx.http import HttpResponseClientRedirect
 from mail_editor.helpers import find_template
 from view_breadcrumbs import BaseBreadcrumbMixin
 from zgw_consumers.api_models.constants import RolOmschrijving
+from zgw_consumers.concurrent import parallel
 
 from open_inwoner.mail.service import send_contact_confirmation_mail
+from open_inwoner.openklant.api_models import ContactMoment
 from open_inwoner.openklant.clients import (
     build_contactmomenten_client,
     build_klanten_client,
@@ -35,22 +38,26 @@ from open_inwoner.openklant.wrap import (
     get_fetch_parameters,
     get_kcm_answer_mapping,
 )
-from open_inwoner.openzaak.api_models import Status, StatusType, Zaak
-from open_inwoner.openzaak.clients import CatalogiClient, ZakenClient
+from open_inwoner.openzaak.api_models import (
+    InformatieObject,
+    Rol,
+    Status,
+    StatusType,
+    Zaak,
+)
+from open_inwoner.openzaak.clients import CatalogiClient, DocumentenClient, ZakenClient
+from open_inwoner.openzaak.config_registry import zgw_config_registry
 from open_inwoner.openzaak.documents import (
+    RangeNotSatisfiable,
     fetch_single_information_object_from_url,
     fetch_single_information_object_uuid,
+    get_byte_range,
+    iter_document_content,
 )
-from open_inwoner.openzaak.models import (
-    OpenZaakConfig,
-    ZaakTypeConfig,
-    ZaakTypeInformatieObjectTypeConfig,
-    ZaakTypeResultaatTypeConfig,
-    ZaakTypeStatusTypeConfig,
-    ZGWApiGroupConfig,
-)
+from open_inwoner.openzaak.models import OpenZaakConfig, ZGWApiGroupConfig
 from open_inwoner.openzaak.utils import get_role_name_display, is_info_object_visible
 from open_inwoner.userfeed import hooks
+from open_inwoner.utils.fetch_plan import FetchPlan
 from open_inwoner.utils.glom import glom_multiple
 from open_inwoner.utils.time import has_new_elements
 from open_inwoner.utils.views import CommonPageMixin, LogMixin
@@ -115,22 +122,16 @@ class InnerCaseDetailView(
     def store_statustype_mapping(self, zaaktype_identificatie):
         # Filter on ZaakType identificatie to avoid eSuite situation where one statustype
         # is linked to multiple zaaktypes
-        self.statustype_config_mapping = {
-            zaaktype_statustype.statustype_url: zaaktype_statustype
-            for zaaktype_statustype in ZaakTypeStatusTypeConfig.objects.filter(
-                zaaktype_config__identificatie=zaaktype_identificatie
-            )
-        }
+        self.statustype_config_mapping = (
+            zgw_config_registry.get_statustype_config_mapping(zaaktype_identificatie)
+        )
 
     def store_resulttype_mapping(self, zaaktype_identificatie):
         # Filter on ZaakType identificatie to avoid eSuite situation where one resulttype
         # is linked to multiple zaaktypes
-        self.resulttype_config_mapping = {
-            zt_resulttype.resultaattype_url: zt_resulttype
-            for zt_resulttype in ZaakTypeResultaatTypeConfig.objects.filter(
-                zaaktype_config__identificatie=zaaktype_identificatie
-            )
-        }
+        self.resulttype_config_mapping = (
+            zgw_config_registry.get_resultaattype_config_mapping(zaaktype_identificatie)
+        )
 
     @cached_property
     def crumbs(self):
@@ -155,27 +156,20 @@ class InnerCaseDetailView(
             config = OpenZaakConfig.get_solo()
 
             api_group = ZGWApiGroupConfig.objects.get(pk=self.kwargs["api_group_id"])
-            zaken_client = api_group.zaken_client
 
-            # fetch data associated with `self.case`
-            documents = self.get_case_document_files(self.case, api_group)
-            statuses = zaken_client.fetch_status_history(self.case.url)
             self.store_statustype_mapping(self.case.zaaktype.identificatie)
             self.store_resulttype_mapping(self.case.zaaktype.identificatie)
 
-            objectcontactmomenten = []
-            if contactmoment_client := build_contactmomenten_client():
-                objectcontactmomenten = (
-                    contactmoment_client.retrieve_objectcontactmomenten_for_zaak(
-                        self.case
-                    )
-                )
-            questions = []
-            for ocm in objectcontactmomenten:
-                question = getattr(ocm, "contactmoment", None)
-                if question:
-                    questions.append(question)
-            questions.sort(key=lambda q: q.registratiedatum, reverse=True)
+            # fetch data associated with `self.case`
+            results = self.get_fetch_plan(api_group, config).run()
+            documents = results["documents"]
+            statuses = results["statuses"]
+            statustypen = results["statustypen"]
+            # the status of the case is resolved by the plan, but set here, outside
+            # of the thread pool
+            status_types_mapping, self.case.status = results["status_types_mapping"]
+            questions = results["questions"]
+            result_data = results["result_data"]
 
             kcm_answer_mapping = get_kcm_answer_mapping(questions, self.request.user)
             for question in questions:
@@ -183,18 +177,6 @@ class InnerCaseDetailView(
                     question, kcm_answer_mapping
                 )
 
-            statustypen = []
-            catalogi_client = api_group.catalogi_client
-            statustypen = catalogi_client.fetch_status_types_no_cache(
-                self.case.zaaktype.url
-            )
-
-            # NOTE we cannot sort on the Status.datum_status_gezet (datetime) because eSuite
-            # returns zeros as the time component of the datetime, so we're going with the
-            # observation that on both OpenZaak and eSuite the returned list is ordered 'oldest-last'
-            # here we want it 'oldest-first' so we reverse() it instead of sort()-ing
-            statuses.reverse()
-
             # get preview of second status
             if len(statuses) == 1:
                 second_status_preview = self.get_second_status_preview(statustypen)
@@ -202,19 +184,10 @@ class InnerCaseDetailView(
                 second_status_preview = None
 
             # handle/transform data associated with `self.case`
-            status_types_mapping = self.sync_statuses_with_status_types(
-                statuses, zaken_client, catalogi_client=catalogi_client
-            )
             end_statustype_data = self.handle_end_statustype_data(
                 status_types_mapping=status_types_mapping,
                 end_statustype=self.handle_end_statustype(statuses, statustypen),
             )
-            result_data = self.get_result_data(
-                self.case,
-                self.resulttype_config_mapping,
-                zaken_client,
-                catalogi_client,
-            )
 
             hooks.case_status_seen(self.request.user, self.case)
             hooks.case_documents_seen(self.request.user, self.case)
@@ -222,7 +195,7 @@ class InnerCaseDetailView(
             context["case"] = {
                 "id": str(self.case.uuid),
                 "identification": self.case.identification,
-                "initiator": self.get_initiator_display(self.case, zaken_client),
+                "initiator": results["initiator"],
                 "result": result_data.get("display", ""),
                 "result_description": result_data.get("description", ""),
                 "start_date": self.case.startdatum,
@@ -274,6 +247,84 @@ class InnerCaseDetailView(
 
         return context
 
+    def get_fetch_plan(
+        self, api_group: ZGWApiGroupConfig, config: OpenZaakConfig
+    ) -> FetchPlan:
+        """
+        Declare the API calls for the data of `self.case`, and how they depend on
+        each other
+
+        The nodes are executed in a thread pool and should not access the database, so
+        the clients and configuration are prepared here.
+        """
+        case = self.case
+        zaken_client = api_group.zaken_client
+        catalogi_client = api_group.catalogi_client
+        documenten_client = api_group.documenten_client
+        contactmoment_client = build_contactmomenten_client()
+
+        def fetch_statuses() -> list[Status]:
+            statuses = zaken_client.fetch_status_history(case.url)
+            # NOTE we cannot sort on the Status.datum_status_gezet (datetime) because eSuite
+            # returns zeros as the time component of the datetime, so we're going with the
+            # observation that on both OpenZaak and eSuite the returned list is ordered 'oldest-last'
+            # here we want it 'oldest-first' so we reverse() it instead of sort()-ing
+            statuses.reverse()
+            return statuses
+
+        def fetch_questions() -> list[ContactMoment]:
+            if not contactmoment_client:
+                return []
+
+            objectcontactmomenten = (
+                contactmoment_client.retrieve_objectcontactmomenten_for_zaak(case)
+            )
+            questions = []
+            for ocm in objectcontactmomenten:
+                question = getattr(ocm, "contactmoment", None)
+                if question:
+                    questions.append(question)
+            questions.sort(key=lambda q: q.registratiedatum, reverse=True)
+            return questions
+
+        plan = FetchPlan(max_workers=settings.ZGW_CASE_DETAIL_MAX_CONCURRENCY)
+        plan.add(
+            "documents",
+            lambda: self.get_case_document_files(
+                case,
+                api_group,
+                config=config,
+                zaken_client=zaken_client,
+                documenten_client=documenten_client,
+            ),
+        )
+        plan.add("statuses", fetch_statuses)
+        plan.add(
+            "statustypen",
+            lambda: catalogi_client.fetch_status_types_no_cache(case.zaaktype.url),
+        )
+        plan.add(
+            "status_types_mapping",
+            lambda statuses: self.sync_statuses_with_status_types(
+                statuses, case.status, zaken_client, catalogi_client=catalogi_client
+            ),
+            depends_on=["statuses"],
+        )
+        plan.add("questions", fetch_questions)
+        plan.add(
+            "initiator",
+            lambda: self.get_initiator_display(
+                self.get_case_roles(api_group, case.url)
+            ),
+        )
+        plan.add(
+            "result_data",
+            lambda: self.get_result_data(
+                case, self.resulttype_config_mapping, zaken_client, catalogi_client
+            ),
+        )
+        return plan
+
     def get_second_status_preview(self, statustypen: list) -> StatusType | None:
         """
         Get the relevant status type to display preview of second case status
@@ -307,16 +358,20 @@ class InnerCaseDetailView(
     def sync_statuses_with_status_types(
         self,
         statuses: list[Status],
+        case_status: Status | str | None,
         zaken_client: ZakenClient,
         catalogi_client: CatalogiClient,
-    ) -> dict[str, StatusType]:
+    ) -> tuple[dict[str, StatusType], Status | str | None]:
         """
-        Update `statuses` (including the status on this view) and sync with `status_types`:
-            - resolve `self.case.status` (a url/str) to a `Status` object
+        Update `statuses` and sync with `status_types`:
+            - resolve `case_status` (a url/str) to a `Status` object
             - resolve `status_type` url for each element in `statuses` to the corresponding
-              `StatusType` object (this also mutates `self.case.status`)
+              `StatusType` object (this also resolves the status type of `case_status`)
             - create mapping `{status_type_url: StatusType}`
 
+        The mapping and the resolved `case_status` are returned, the case itself is not
+        updated (this runs in a worker thread of the fetch plan).
+
         We create a preliminary mapping {status_type url: Status}, then loop over this mapping
         replacing `Status` with the `StatusType` corresponding to the url, and resolving the
         `status_type` url on each `Status` instance to the corresponding `StatusType` object.
@@ -330,11 +385,11 @@ class InnerCaseDetailView(
         # preliminary mapping {status_type url: status}
         for status in statuses:
             status_types_mapping[status.statustype].append(status)
-            if self.case.status == status.url:
-                self.case.status = status
+            if case_status == status.url:
+                case_status = status
 
         # eSuite compatibility
-        if isinstance(self.case.status, str):
+        if isinstance(case_status, str):
             # OIP requests cases, user goes to detailview of case
             # OIP requests the statusses of the case (the status history)
             # OIP sees a zaak.status URL which doesn't occur in the status history, however requires this status to determine the statustype and configuration options related to this statustype (Taiga #2037, uploading documents was activated for statustype in the admin but wasn't active for users
@@ -345,8 +400,8 @@ class InnerCaseDetailView(
                     self.case.identification
                 )
             )
-            self.case.status = zaken_client.fetch_single_status(self.case.status)
-            status_types_mapping[self.case.status.statustype].append(self.case.status)
+            case_status = zaken_client.fetch_single_status(case_status)
+            status_types_mapping[case_status.statustype].append(case_status)
 
         # final mapping {status_type url: status_type}
         for status_type_url, _statuses in list(status_types_mapping.items()):
@@ -356,7 +411,7 @@ class InnerCaseDetailView(
             for status in _statuses:
                 status.statustype = status_type
 
-        return status_types_mapping
+        return status_types_mapping, case_status
 
     def handle_end_statustype(
         self, statuses: list[Status], statustypen: list[StatusType]
@@ -428,10 +483,11 @@ class InnerCaseDetailView(
 
     @property
     def is_file_upload_enabled_for_case_type(self) -> bool:
-        case_upload_enabled = (
-            ZaakTypeInformatieObjectTypeConfig.objects.filter_enabled_for_case_type(
+        case_upload_enabled = bool(self.case.zaaktype) and any(
+            ztiotc.document_upload_enabled
+            for ztiotc in zgw_config_registry.get_informatieobjecttype_configs(
                 self.case.zaaktype
-            ).exists()
+            )
         )
         logger.info(
             "Case {url} has case type file upload: {case_upload_enabled}".format(
@@ -491,11 +547,8 @@ class InnerCaseDetailView(
         external_upload_url = ""
         contact_form_enabled = False
 
-        try:
-            ztc = ZaakTypeConfig.objects.filter_case_type(case.zaaktype).get()
-        except ObjectDoesNotExist:
-            pass
-        else:
+        ztc = zgw_config_registry.get_zaaktype_config(case.zaaktype)
+        if ztc:
             case_type_config_description = ztc.description
             contact_form_enabled = ztc.contact_form_enabled
             if ztc.document_upload_enabled and ztc.external_document_upload_url != "":
@@ -503,13 +556,13 @@ class InnerCaseDetailView(
                 external_upload_enabled = True
 
             try:
-                zt_statustype_config = ztc.zaaktypestatustypeconfig_set.get(
-                    statustype_url=case.status.statustype.url
+                zt_statustype_config = zgw_config_registry.get_statustype_config(
+                    ztc, case.status.statustype.url
                 )
-            # case has no status, or statustype config not found
-            except (AttributeError, ObjectDoesNotExist):
-                pass
-            else:
+            # case has no status
+            except AttributeError:
+                zt_statustype_config = None
+            if zt_statustype_config:
                 case_type_document_upload_description = (
                     zt_statustype_config.document_upload_description
                 )
@@ -565,9 +618,12 @@ class InnerCaseDetailView(
         }
 
     @staticmethod
-    def get_initiator_display(case: Zaak, zaken_client: ZakenClient) -> str:
-        roles = zaken_client.fetch_case_roles(case.url, RolOmschrijving.initiator)
-        return ", ".join(get_role_name_display(r) for r in roles)
+    def get_initiator_display(case_roles: list[Rol]) -> str:
+        return ", ".join(
+            get_role_name_display(r)
+            for r in case_roles
+            if r.omschrijving_generiek == RolOmschrijving.initiator
+        )
 
     @staticmethod
     def get_statuses_data(
@@ -616,33 +672,48 @@ class InnerCaseDetailView(
 
     @staticmethod
     def get_case_document_files(
-        case: Zaak, api_group: ZGWApiGroupConfig
+        case: Zaak,
+        api_group: ZGWApiGroupConfig,
+        config: OpenZaakConfig | None = None,
+        zaken_client: ZakenClient | None = None,
+        documenten_client: DocumentenClient | None = None,
     ) -> list[SimpleFile]:
-        client = api_group.zaken_client
-        case_info_objects = client.fetch_case_information_objects(case.url)
-
-        # get the information objects for the case objects
-
-        # TODO we'd like to use parallel() but it is borked in tests
-        # with parallel() as executor:
-        #     info_objects = executor.map(
-        #         fetch_single_information_object,
-        #         [case_info.informatieobject for case_info in case_info_objects],
-        #     )
-        info_objects = [
-            fetch_single_information_object_from_url(
-                case_info.informatieobject, api_group=api_group
+        """
+        The clients of `api_group` are built when they are not passed (which reads the
+        services from the database)
+        """
+        zaken_client = zaken_client or api_group.zaken_client
+        documenten_client = documenten_client or api_group.documenten_client
+        case_info_objects = zaken_client.fetch_case_information_objects(case.url)
+
+        # get the information objects for the case objects, concurrently
+        info_object_urls = list(
+            dict.fromkeys(case_info.informatieobject for case_info in case_info_objects)
+        )
+
+        def fetch_info_object(url: str) -> InformatieObject | None:
+            return fetch_single_information_object_from_url(
+                url, documenten_client=documenten_client
             )
-            for case_info in case_info_objects
-        ]
 
-        config = OpenZaakConfig.get_solo()
+        with parallel(max_workers=settings.ZGW_DOCUMENTEN_MAX_CONCURRENCY) as executor:
+            info_objects = dict(
+                zip(info_object_urls, executor.map(fetch_info_object, info_object_urls))
+            )
+
+        # filter in one pass
+        config = config or OpenZaakConfig.get_solo()
+        visible_info_objects = {
+            url: info_obj
+            for url, info_obj in info_objects.items()
+            if info_obj
+            and is_info_object_visible(info_obj, config.document_max_confidentiality)
+        }
+
         documents = []
-        for case_info_obj, info_obj in zip(case_info_objects, info_objects):
-            if not info_obj:
-                continue
-            if not is_info_object_visible(
-                info_obj, config.document_max_confidentiality
+        for case_info_obj in case_info_objects:
+            if not (
+                info_obj := visible_info_objects.get(case_info_obj.informatieobject)
             ):
                 continue
             # restructure into something understood by the FileList template tag
@@ -719,11 +790,28 @@ class CaseDocumentDownloadView(LogMixin, CaseAccessMixin, View):
         if not is_info_object_visible(info_object, config.document_max_confidentiality):
             raise PermissionDenied()
 
+        # support resuming downloads
+        size = info_object.bestandsomvang
+        try:
+            byte_range = get_byte_range(request.headers.get("Range"), size)
+        except RangeNotSatisfiable:
+            return HttpResponse(
+                status=416, headers={"Content-Range": f"bytes */{size}"}
+            )
+
         # retrieve and stream content
-        content_stream = None
-        content_stream = api_group.documenten_client.download_document(
-            info_object.inhoud
+        documenten_client = api_group.documenten_client
+        content_stream = documenten_client.download_document(
+            info_object.inhoud, byte_range=byte_range
         )
+        if (
+            content_stream is not None
+            and content_stream.status_code == 206
+            and "Content-Range" not in content_stream.headers
+        ):
+            # a partial response of unknown range can't be passed on
+            content_stream.close()
+            content_stream = documenten_client.download_document(info_object.inhoud)
 
         if not content_stream:
             raise Http404
@@ -739,9 +827,27 @@ class CaseDocumentDownloadView(LogMixin, CaseAccessMixin, View):
         headers = {
             "Content-Disposition": f'attachment; filename="{info_object.bestandsnaam}"',
             "Content-Type": info_object.formaat,
-            "Content-Length": info_object.bestandsomvang,
         }
-        response = StreamingHttpResponse(content_stream, headers=headers)
+        # the content is decoded while streaming, so an encoded length doesn't apply
+        content_length = None
+        if "Content-Encoding" not in content_stream.headers:
+            content_length = content_stream.headers.get("Content-Length")
+
+        status = 200
+        # the Documenten API can ignore or change the range: pass on what it returned
+        if content_stream.status_code == 206:
+            status = 206
+            headers["Content-Range"] = content_stream.headers["Content-Range"]
+            headers["Accept-Ranges"] = "bytes"
+        else:
+            content_length = content_length or size
+
+        if content_length:
+            headers["Content-Length"] = content_length
+
+        response = StreamingHttpResponse(
+            iter_document_content(content_stream), status=status, headers=headers
+        )
         return response
 
     def handle_no_permission(self):
@@ -963,10 +1069,7 @@ class CaseContactFormView(CaseAccessMixin, LogMixin, FormView):
     def register_by_api(self, form, config: OpenKlantConfig):
         assert config.has_api_configuration()
 
-        try:
-            ztc = ZaakTypeConfig.objects.filter_case_type(self.case.zaaktype).get()
-        except ObjectDoesNotExist:
-            ztc = None
+        ztc = zgw_config_registry.get_zaaktype_config(self.case.zaaktype)
 
         if klanten_client := build_klanten_client():
             klant = klanten_client.retrieve_klant(**get_fetch_parameters(self.request))
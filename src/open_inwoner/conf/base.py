@@ -113,6 +113,101 @@ SOLO_CACHE = "local"  # Avoid Redis overhead
 # ZGW API caches
 CACHE_ZGW_CATALOGI_TIMEOUT = config("CACHE_ZGW_CATALOGI_TIMEOUT", default=60 * 60 * 24)
 CACHE_ZGW_ZAKEN_TIMEOUT = config("CACHE_ZGW_ZAKEN_TIMEOUT", default=60 * 1)
+# Single klantcontactmomenten are cached per user (e.g. for the detail page)
+CACHE_KLANTCONTACTMOMENT_TIMEOUT = config(
+    "CACHE_KLANTCONTACTMOMENT_TIMEOUT", default=60 * 1
+)
+# Cached zaken data is tagged by zaak and betrokkene, and purged when a notification
+# is received, so the timeout can be raised when the notifications are configured.
+# Purges are kept for CACHE_TAG_TIMEOUT, which should be at least the timeout of the
+# tagged values.
+CACHE_TAG_TIMEOUT = config("CACHE_TAG_TIMEOUT", default=60 * 60 * 24)
+# Serve stale catalogi data for this long while refreshing, and fall back to the
+# last good data for this long when a backend fails
+CACHE_ZGW_CATALOGI_STALE_TIMEOUT = config(
+    "CACHE_ZGW_CATALOGI_STALE_TIMEOUT", default=60 * 60
+)
+CACHE_ZGW_CATALOGI_LAST_GOOD_TIMEOUT = config(
+    "CACHE_ZGW_CATALOGI_LAST_GOOD_TIMEOUT", default=60 * 60 * 24 * 7
+)
+# In-process (L1) cache for catalogi lookups, in front of the shared cache
+CACHE_ZGW_CATALOGI_LOCAL_TIMEOUT = config(
+    "CACHE_ZGW_CATALOGI_LOCAL_TIMEOUT", default=60 * 5
+)
+CACHE_ZGW_CATALOGI_LOCAL_MAXSIZE = config(
+    "CACHE_ZGW_CATALOGI_LOCAL_MAXSIZE", default=1000
+)
+# Size of the chunks in which documents are passed through to the user
+ZGW_DOCUMENT_DOWNLOAD_CHUNK_SIZE = config(
+    "ZGW_DOCUMENT_DOWNLOAD_CHUNK_SIZE", default=64 * 1024
+)
+# Upload documents larger than this (in bytes) in parts (the "bestandsdelen" of the
+# Documenten API 1.1+), instead of as base64 in one request. 0 disables this.
+ZGW_DOCUMENT_UPLOAD_IN_PARTS_THRESHOLD = config(
+    "ZGW_DOCUMENT_UPLOAD_IN_PARTS_THRESHOLD", default=10 * 1024 * 1024
+)
+# Max. number of concurrent requests to the Documenten API to list the documents of a case
+ZGW_DOCUMENTEN_MAX_CONCURRENCY = config("ZGW_DOCUMENTEN_MAX_CONCURRENCY", default=8)
+# Max. number of concurrent requests for the remaining pages of a paginated ZGW listing
+ZGW_PAGINATION_MAX_CONCURRENCY = config("ZGW_PAGINATION_MAX_CONCURRENCY", default=4)
+# Max. number of concurrent (groups of) requests to fetch the data of the case detail page
+ZGW_CASE_DETAIL_MAX_CONCURRENCY = config("ZGW_CASE_DETAIL_MAX_CONCURRENCY", default=6)
+# Max. number of concurrent requests (per catalogi service) to warm up the caches
+ZGW_CACHE_WARMUP_MAX_WORKERS = config("ZGW_CACHE_WARMUP_MAX_WORKERS", default=8)
+# Max. number of concurrent requests to import the zaaktype configs
+ZGW_IMPORT_MAX_CONCURRENCY = config("ZGW_IMPORT_MAX_CONCURRENCY", default=8)
+# Max. delay before invalidated in-process caches are cleared in other processes
+CACHE_LOCAL_VERSION_CHECK_INTERVAL = config(
+    "CACHE_LOCAL_VERSION_CHECK_INTERVAL", default=5
+)
+# Max. delay before changes to the zaaktype configs are picked up by other processes
+ZGW_CONFIG_REGISTRY_VERSION_CHECK_INTERVAL = config(
+    "ZGW_CONFIG_REGISTRY_VERSION_CHECK_INTERVAL", default=5
+)
+
+# ZGW API connection pools: max. number of kept-alive connections per service
+ZGW_CLIENT_POOL_SIZE = config("ZGW_CLIENT_POOL_SIZE", default=10)
+ZGW_CLIENT_POOL_SIZES = {
+    "zrc": config("ZGW_CLIENT_POOL_SIZE_ZRC", default=ZGW_CLIENT_POOL_SIZE),
+    "ztc": config("ZGW_CLIENT_POOL_SIZE_ZTC", default=ZGW_CLIENT_POOL_SIZE),
+    "drc": config("ZGW_CLIENT_POOL_SIZE_DRC", default=ZGW_CLIENT_POOL_SIZE),
+    "orc": config("ZGW_CLIENT_POOL_SIZE_ORC", default=ZGW_CLIENT_POOL_SIZE),
+}
+# Max. lifetime of a pooled client (ZGW JWTs are generated per client)
+ZGW_CLIENT_POOL_MAX_AGE = config("ZGW_CLIENT_POOL_MAX_AGE", default=60 * 10)
+
+# Process-wide limits for the requests to the ZGW (including the async engine) and
+# OpenKlant (eSuite/OpenKlant 1) services, per host. The concurrency limit adapts
+# between the min. and max. to the observed errors and latency (above the target, in
+# seconds); requests that cannot start within the acquire timeout fail. A rate
+# (requests per second, 0 disables) can be set as well.
+# Note: the requests of the `openklant2` client are not limited.
+OUTBOUND_SCHEDULER_ENABLED = config("OUTBOUND_SCHEDULER_ENABLED", default=False)
+OUTBOUND_MAX_CONCURRENCY_PER_BACKEND = config(
+    "OUTBOUND_MAX_CONCURRENCY_PER_BACKEND", default=20
+)
+OUTBOUND_MIN_CONCURRENCY_PER_BACKEND = config(
+    "OUTBOUND_MIN_CONCURRENCY_PER_BACKEND", default=2
+)
+OUTBOUND_LATENCY_TARGET = config("OUTBOUND_LATENCY_TARGET", default=5.0)
+OUTBOUND_ACQUIRE_TIMEOUT = config("OUTBOUND_ACQUIRE_TIMEOUT", default=10.0)
+OUTBOUND_RATE_PER_BACKEND = config("OUTBOUND_RATE_PER_BACKEND", default=0)
+OUTBOUND_BURST_PER_BACKEND = config("OUTBOUND_BURST_PER_BACKEND", default=0)
+
+# Circuit breaker per ZGW and OpenKlant service (state shared through the cache): fail
+# fast after the number of consecutive failures, and probe again after the timeout
+CIRCUIT_BREAKER_ENABLED = config("CIRCUIT_BREAKER_ENABLED", default=True)
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = config(
+    "CIRCUIT_BREAKER_FAILURE_THRESHOLD", default=5
+)
+CIRCUIT_BREAKER_RESET_TIMEOUT = config("CIRCUIT_BREAKER_RESET_TIMEOUT", default=30)
+
+# Fetch and resolve the cases with asyncio/httpx instead of thread pools
+ZGW_ASYNC_ENGINE_ENABLED = config("ZGW_ASYNC_ENGINE_ENABLED", default=False)
+ZGW_ASYNC_MAX_CONCURRENCY = config("ZGW_ASYNC_MAX_CONCURRENCY", default=100)
+ZGW_ASYNC_MAX_CONCURRENCY_PER_BACKEND = config(
+    "ZGW_ASYNC_MAX_CONCURRENCY_PER_BACKEND", default=20
+)
 
 # Laposta API caching
 CACHE_LAPOSTA_API_TIMEOUT = config("CACHE_LAPOSTA_API_TIMEOUT", default=60 * 15)
@@ -685,6 +780,16 @@ DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_TASK_TIME_LIMIT = config("CELERY_TASK_HARD_TIME_LIMIT", default=15 * 60)
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+# the queue of the tasks processing the ZGW notifications. To keep bursts of
+# notifications from delaying the other tasks, opt in to a dedicated queue (e.g.
+# "notifications") AND start a worker for it with `bin/celery_worker.sh notifications`,
+# otherwise the notifications are not processed at all
+ZGW_NOTIFICATIONS_QUEUE = config("ZGW_NOTIFICATIONS_QUEUE", default="celery")
+CELERY_TASK_ROUTES = {
+    "open_inwoner.openzaak.tasks.process_zaken_notification": {
+        "queue": ZGW_NOTIFICATIONS_QUEUE
+    },
+}
 # https://docs.celeryq.dev/en/latest/userguide/periodic-tasks.html#beat-entries
 CELERY_BEAT_SCHEDULE = {
     # Note that the keys here will be used to give human-readable names
@@ -706,6 +811,18 @@ CELERY_BEAT_SCHEDULE = {
         "task": "open_inwoner.configurations.tasks.send_failed_mail_digest",
         "schedule": crontab(minute="0", hour="7", day_of_month="*"),
     },
+    "Verwerk vastgelopen ZGW notificaties opnieuw": {
+        "task": "open_inwoner.openzaak.tasks.requeue_stale_zaken_notifications",
+        "schedule": crontab(minute="*/15", hour="*", day_of_month="*"),
+    },
+    "Verstuur achtergebleven zaak update emails": {
+        "task": "open_inwoner.openzaak.tasks.send_stale_case_update_emails",
+        "schedule": crontab(minute="*/5", hour="*", day_of_month="*"),
+    },
+    "Verwijder oude ZGW notificaties": {
+        "task": "open_inwoner.openzaak.tasks.delete_old_received_notifications",
+        "schedule": crontab(minute="30", hour="6", day_of_month="*"),
+    },
     "Probeer emails opnieuw te sturen": {
         "task": "django_yubin.tasks.retry_emails",
         "schedule": crontab(minute="1", hour="*", day_of_month="*"),
@@ -903,12 +1020,35 @@ ZGW_CONSUMERS_TEST_SCHEMA_DIRS = [
 ZGW_LIMIT_NOTIFICATIONS_FREQUENCY = config(
     "ZGW_LIMIT_NOTIFICATIONS_FREQUENCY", default=60 * 15
 )
+# handle the ZGW notifications in a Celery task (on ZGW_NOTIFICATIONS_QUEUE), instead
+# of in the webhook request
+ZGW_NOTIFICATIONS_ASYNC = config("ZGW_NOTIFICATIONS_ASYNC", default=True)
+# identical notifications (resource, resource URL and kenmerken) received within this
+# number of seconds are handled once
+ZGW_NOTIFICATIONS_DEDUPLICATION_WINDOW = config(
+    "ZGW_NOTIFICATIONS_DEDUPLICATION_WINDOW", default=60
+)
+# the case update emails for a user are buffered for this number of seconds, and the
+# updates of a case within the window are sent as a single email (0 to send directly)
+ZGW_NOTIFICATIONS_COALESCE_WINDOW = config(
+    "ZGW_NOTIFICATIONS_COALESCE_WINDOW", default=60
+)
+# notifications of which the processing did not start or finish within this number of
+# seconds (e.g. because the worker was killed) are queued again
+ZGW_NOTIFICATIONS_STALE_TIMEOUT = config(
+    "ZGW_NOTIFICATIONS_STALE_TIMEOUT", default=CELERY_TASK_TIME_LIMIT
+)
+# received notifications are kept for this number of days
+ZGW_NOTIFICATIONS_RETENTION_DAYS = config("ZGW_NOTIFICATIONS_RETENTION_DAYS", default=7)
 
 # recent documents: created/added no longer than n days in the past
 DOCUMENT_RECENT_DAYS = config("DOCUMENT_RECENT_DAYS", default=1)
 
 # recent answers to contactmomenten: no longer than n days in the past
 CONTACTMOMENT_NEW_DAYS = config("CONTACTMOMENT_NEW_DAYS", default=7)
+# Max. number of concurrent requests to the Klanten and Contactmomenten APIs to
+# resolve the contactmomenten of a user
+OPENKLANT_MAX_CONCURRENCY = config("OPENKLANT_MAX_CONCURRENCY", default=8)
 
 #
 # Maykin 2FA
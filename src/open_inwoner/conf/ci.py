@@ -52,6 +52,17 @@ ENVIRONMENT = "CI"
 # Django solo caching (disabled for CI)
 SOLO_CACHE = None
 
+# Clear the in-process caches as soon as the shared cache is cleared
+CACHE_LOCAL_VERSION_CHECK_INTERVAL = 0
+
+# The state of the circuit breakers would carry over between tests that mock failing
+# services, so it is only enabled in its own tests
+CIRCUIT_BREAKER_ENABLED = False
+
+# Most notification tests handle the notifications and send the emails synchronously
+ZGW_NOTIFICATIONS_ASYNC = False
+ZGW_NOTIFICATIONS_COALESCE_WINDOW = 0
+
 #
 # Django-axes
 #
@@ -398,6 +398,75 @@ MAIL_EDITOR_CONF = {
             },
         ],
     },
+    "case_update_digest": {
+        "name": _("Case update notification (digest)"),
+        "description": _(
+            "This email is used to notify people about multiple updates of their case "
+            "within a short period (new statuses and documents)"
+        ),
+        "subject_default": "Uw zaak is bijgewerkt op {{ site_name }}",
+        "body_default": _readfile("case_update_digest.html"),
+        "subject": [
+            {
+                "name": "site_name",
+                "description": _("Name of the site."),
+            },
+        ],
+        "body": [
+            {
+                "name": "identification",
+                "description": _("The identification of the case"),
+                "example": "ZAAK-1234",
+            },
+            {
+                "name": "type_description",
+                "description": _("The description of the type of the case"),
+                "example": _("Casetype placeholder"),
+            },
+            {
+                "name": "status_descriptions",
+                "description": _("The descriptions of the new statuses of the case"),
+                "example": [_("status placeholder")],
+            },
+            {
+                "name": "document_count",
+                "description": _("The number of documents added to the case"),
+                "example": 2,
+            },
+            {
+                "name": "action_required",
+                "description": _("Whether one of the new statuses requires action"),
+                "example": False,
+            },
+            {
+                "name": "end_date",
+                "description": _("The planned final date of the case"),
+                "example": date(2024, 5, 1),
+            },
+            {
+                "name": "case_link",
+                "description": _("The link to the case details."),
+            },
+            {
+                "name": "site_name",
+                "description": _("Name of the site"),
+            },
+            {
+                "name": "contact_page",
+                "description": _("The link to an existing contactpage"),
+            },
+            {
+                "name": "contact_phonenumber",
+                "description": _("The callable link to the configured phonenumber"),
+            },
+            {
+                "name": "profile_notifications",
+                "description": _(
+                    "The link to the notifications and unsubscribe settings"
+                ),
+            },
+        ],
+    },
     "case_status_notification_action_required": {
         "name": _("Case status update notification (action required)"),
         "description": _(
@@ -5,6 +5,8 @@ from django.utils.translation import gettext_lazy as _
 from ordered_model.admin import OrderedInlineModelAdminMixin, OrderedTabularInline
 from solo.admin import SingletonModelAdmin
 
+from open_inwoner.utils.circuit_breaker import get_circuit_states_display
+
 from .models import ContactFormSubject, KlantContactMomentAnswer, OpenKlantConfig
 
 
@@ -55,6 +57,7 @@ class OpenKlantConfigAdmin(OrderedInlineModelAdminMixin, SingletonModelAdmin):
     inlines = [
         ContactFormSubjectInlineAdmin,
     ]
+    readonly_fields = ["circuit_breaker_states"]
     fieldsets = [
         (
             _("Email registratie"),
@@ -92,11 +95,18 @@ class OpenKlantConfigAdmin(OrderedInlineModelAdminMixin, SingletonModelAdmin):
                 "fields": [
                     "klanten_service",
                     "contactmomenten_service",
+                    "circuit_breaker_states",
                 ],
             },
         ),
     ]
 
+    @admin.display(description=_("Circuit breaker"))
+    def circuit_breaker_states(self, obj):
+        return get_circuit_states_display(
+            [obj.klanten_service, obj.contactmomenten_service]
+        )
+
 
 @admin.register(KlantContactMomentAnswer)
 class KlantContactMomentAnswerAdmin(admin.ModelAdmin):
@@ -1,13 +1,21 @@
 import logging
+import threading
+from collections.abc import Iterable
+
+from django.conf import settings
 
 from ape_pie.client import APIClient
 from requests.exceptions import RequestException
 from zgw_consumers.api_models.base import factory
 from zgw_consumers.client import build_client
+from zgw_consumers.concurrent import parallel
+from zgw_consumers.models import Service
 from zgw_consumers.utils import pagination_helper
 
 from open_inwoner.openzaak.api_models import Zaak
 from open_inwoner.utils.api import ClientError, get_json_response
+from open_inwoner.utils.circuit_breaker import CircuitBreakerMixin
+from open_inwoner.utils.outbound import ScheduledRequestsMixin
 
 from .api_models import (
     ContactMoment,
@@ -23,7 +31,15 @@ from .models import OpenKlantConfig
 logger = logging.getLogger(__name__)
 
 
-class KlantenClient(APIClient):
+class OpenKlantAPIClient(CircuitBreakerMixin, ScheduledRequestsMixin, APIClient):
+    configured_from: Service | None
+
+    def __init__(self, *args, configured_from: Service | None = None, **kwargs):
+        self.configured_from = configured_from
+        super().__init__(*args, **kwargs)
+
+
+class KlantenClient(OpenKlantAPIClient):
     def create_klant(
         self,
         user_bsn: str | None = None,
@@ -158,7 +174,13 @@ class KlantenClient(APIClient):
         return klant
 
 
-class ContactmomentenClient(APIClient):
+class ContactmomentenClient(OpenKlantAPIClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # the contactmomenten retrieved during the lifetime of the client (a request)
+        self._contactmomenten: dict[str, ContactMoment | None] = {}
+        self._contactmomenten_lock = threading.Lock()
+
     #
     # contactmomenten
     #
@@ -207,6 +229,30 @@ class ContactmomentenClient(APIClient):
 
         return contact_moment
 
+    def retrieve_contactmomenten(
+        self, urls: Iterable[str]
+    ) -> dict[str, ContactMoment | None]:
+        """
+        Retrieve the contactmomenten concurrently, by URL
+
+        The contactmomenten are memoized for the lifetime of the client, so each
+        contactmoment is retrieved once.
+        """
+        urls = list(dict.fromkeys(urls))
+        with self._contactmomenten_lock:
+            missing = [url for url in urls if url not in self._contactmomenten]
+
+        if missing:
+            with parallel(max_workers=settings.OPENKLANT_MAX_CONCURRENCY) as executor:
+                retrieved = dict(
+                    zip(missing, executor.map(self.retrieve_contactmoment, missing))
+                )
+            with self._contactmomenten_lock:
+                self._contactmomenten.update(retrieved)
+
+        with self._contactmomenten_lock:
+            return {url: self._contactmomenten[url] for url in urls}
+
     #
     # objectcontactmomenten
     #
@@ -248,17 +294,13 @@ class ContactmomentenClient(APIClient):
         object_contact_momenten = factory(ObjectContactMoment, all_data)
 
         # resolve linked resources
-        contactmoment_mapping = {}
+        contactmomenten = self.retrieve_contactmomenten(
+            ocm.contactmoment for ocm in object_contact_momenten
+        )
         for ocm in object_contact_momenten:
             assert ocm.object == zaak.url
             ocm.object = zaak
-
-            contactmoment_url = ocm.contactmoment
-            if contactmoment_url in contactmoment_mapping:
-                ocm.contactmoment = contactmoment_mapping[contactmoment_url]
-            else:
-                ocm.contactmoment = self.retrieve_contactmoment(contactmoment_url)
-                contactmoment_mapping[contactmoment_url] = ocm.contactmoment
+            ocm.contactmoment = contactmomenten[ocm.contactmoment]
 
         return object_contact_momenten
 
@@ -282,9 +324,13 @@ class ContactmomentenClient(APIClient):
     #
     # klantcontactmomenten
     #
-    def retrieve_klantcontactmomenten_for_klant(
+    def _list_klantcontactmomenten_for_klant(
         self, klant: Klant
     ) -> list[KlantContactMoment]:
+        """
+        List the klantcontactmomenten of the klant, without resolving their
+        contactmomenten
+        """
         try:
             response = self.get(
                 "klantcontactmomenten",
@@ -297,15 +343,67 @@ class ContactmomentenClient(APIClient):
             return []
 
         klanten_contact_moments = factory(KlantContactMoment, all_data)
-
-        # resolve linked resources
         for kcm in klanten_contact_moments:
             assert kcm.klant == klant.url
             kcm.klant = klant
-            kcm.contactmoment = self.retrieve_contactmoment(kcm.contactmoment)
 
         return klanten_contact_moments
 
+    def retrieve_klantcontactmomenten_for_klant(
+        self, klant: Klant
+    ) -> list[KlantContactMoment]:
+        return self.retrieve_klantcontactmomenten_for_klanten([klant])
+
+    def retrieve_klantcontactmomenten_for_klanten(
+        self, klanten: list[Klant]
+    ) -> list[KlantContactMoment]:
+        """
+        Retrieve the klantcontactmomenten of the klanten
+
+        The klantcontactmomenten of the klanten are listed concurrently, and the
+        contactmomenten of all klanten are resolved together afterwards.
+        """
+        with parallel(max_workers=settings.OPENKLANT_MAX_CONCURRENCY) as executor:
+            klanten_contact_moments = [
+                kcm
+                for kcms in executor.map(
+                    self._list_klantcontactmomenten_for_klant, klanten
+                )
+                for kcm in kcms
+            ]
+
+        # resolve linked resources
+        contactmomenten = self.retrieve_contactmomenten(
+            kcm.contactmoment for kcm in klanten_contact_moments
+        )
+        for kcm in klanten_contact_moments:
+            kcm.contactmoment = contactmomenten[kcm.contactmoment]
+
+        return klanten_contact_moments
+
+    def retrieve_klantcontactmoment_for_klant(
+        self, klant: Klant, kcm_uuid: str
+    ) -> KlantContactMoment | None:
+        """
+        Retrieve a single klantcontactmoment of the klant, resolving only its own
+        contactmoment
+
+        The klantcontactmoment is looked up in the (filtered) klantcontactmomenten of
+        the klant, which also ensures that it belongs to the klant (eSuite doesn't
+        support retrieving single klantcontactmomenten).
+        """
+        for kcm in self._list_klantcontactmomenten_for_klant(klant):
+            if str(kcm.uuid) == str(kcm_uuid):
+                break
+        else:
+            return None
+
+        kcm.contactmoment = self.retrieve_contactmomenten([kcm.contactmoment])[
+            kcm.contactmoment
+        ]
+
+        return kcm
+
     def retrieve_objectcontactmomenten_for_object_type(
         self, contactmoment: ContactMoment, object_type: str
     ) -> list[ObjectContactMoment]:
@@ -336,7 +434,9 @@ def _build_open_klant_client(type_) -> APIClient | None:
     if client_class := services_to_client_mapping.get(type_):
         service = getattr(config, f"{type_}_service")
         if service:
-            client = build_client(service, client_factory=client_class)
+            client = build_client(
+                service, client_factory=client_class, configured_from=service
+            )
             return client
 
     logger.warning("no service defined for %s", type_)
@@ -0,0 +1,109 @@
+# Generated by Django 4.2.16 on 2026-10-18 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("openklant", "0014_contactformconfig"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OpenKlant2KlantContact",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("uuid", models.UUIDField(unique=True, verbose_name="UUID")),
+                (
+                    "nummer",
+                    models.CharField(blank=True, max_length=10, verbose_name="Nummer"),
+                ),
+                ("kanaal", models.CharField(max_length=50, verbose_name="Kanaal")),
+                (
+                    "onderwerp",
+                    models.CharField(
+                        blank=True, max_length=200, verbose_name="Onderwerp"
+                    ),
+                ),
+                (
+                    "inhoud",
+                    models.TextField(blank=True, null=True, verbose_name="Inhoud"),
+                ),
+                (
+                    "plaatsgevonden_op",
+                    models.DateTimeField(verbose_name="Plaatsgevonden op"),
+                ),
+                (
+                    "onderwerpobject_uuid",
+                    models.UUIDField(
+                        blank=True, null=True, verbose_name="Onderwerpobject UUID"
+                    ),
+                ),
+                (
+                    "question_uuid",
+                    models.UUIDField(
+                        blank=True,
+                        db_index=True,
+                        help_text="The klantcontact to which this klantcontact is an answer (through its onderwerpobject).",
+                        null=True,
+                        verbose_name="Question UUID",
+                    ),
+                ),
+                (
+                    "synced_on",
+                    models.DateTimeField(auto_now=True, verbose_name="Synced on"),
+                ),
+            ],
+            options={
+                "verbose_name": "OpenKlant2 klantcontact",
+                "verbose_name_plural": "OpenKlant2 klantcontacten",
+            },
+        ),
+        migrations.CreateModel(
+            name="OpenKlant2Betrokkene",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("uuid", models.UUIDField(unique=True, verbose_name="UUID")),
+                (
+                    "partij_uuid",
+                    models.UUIDField(
+                        blank=True,
+                        db_index=True,
+                        null=True,
+                        verbose_name="Partij UUID",
+                    ),
+                ),
+                (
+                    "klantcontact",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="betrokkenen",
+                        to="openklant.openklant2klantcontact",
+                        verbose_name="Klantcontact",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "OpenKlant2 betrokkene",
+                "verbose_name_plural": "OpenKlant2 betrokkenen",
+            },
+        ),
+    ]
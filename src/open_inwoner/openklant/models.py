@@ -184,3 +184,74 @@ class KlantContactMomentAnswer(models.Model):
         verbose_name = _("KlantContactMoment")
         verbose_name_plural = _("KlantContactMomenten")
         unique_together = [["user", "contactmoment_url"]]
+
+
+class OpenKlant2KlantContact(models.Model):
+    """
+    Local index of the klantcontacten in OpenKlant2, maintained by
+    `OpenKlant2Service.sync_klantcontacten`
+
+    OpenKlant2 cannot filter the klantcontacten by partij, so the klantcontacten of a
+    partij are looked up here (through the betrokkenen) instead of scanning all
+    klantcontacten of the channel.
+    """
+
+    uuid = models.UUIDField(verbose_name=_("UUID"), unique=True)
+    nummer = models.CharField(verbose_name=_("Nummer"), max_length=10, blank=True)
+    kanaal = models.CharField(verbose_name=_("Kanaal"), max_length=50)
+    onderwerp = models.CharField(
+        verbose_name=_("Onderwerp"), max_length=200, blank=True
+    )
+    inhoud = models.TextField(verbose_name=_("Inhoud"), null=True, blank=True)
+    plaatsgevonden_op = models.DateTimeField(verbose_name=_("Plaatsgevonden op"))
+    onderwerpobject_uuid = models.UUIDField(
+        verbose_name=_("Onderwerpobject UUID"), null=True, blank=True
+    )
+    question_uuid = models.UUIDField(
+        verbose_name=_("Question UUID"),
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text=_(
+            "The klantcontact to which this klantcontact is an answer (through its "
+            "onderwerpobject)."
+        ),
+    )
+    synced_on = models.DateTimeField(verbose_name=_("Synced on"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("OpenKlant2 klantcontact")
+        verbose_name_plural = _("OpenKlant2 klantcontacten")
+
+    def __str__(self):
+        return f"{self.nummer} ({self.uuid})"
+
+    def as_klantcontact(self) -> dict:
+        """
+        Return the fields of the klantcontact as in the API (as far as indexed)
+        """
+        return {
+            "uuid": str(self.uuid),
+            "nummer": self.nummer,
+            "kanaal": self.kanaal,
+            "onderwerp": self.onderwerp,
+            "inhoud": self.inhoud,
+            "plaatsgevondenOp": self.plaatsgevonden_op.isoformat(),
+        }
+
+
+class OpenKlant2Betrokkene(models.Model):
+    uuid = models.UUIDField(verbose_name=_("UUID"), unique=True)
+    klantcontact = models.ForeignKey(
+        OpenKlant2KlantContact,
+        verbose_name=_("Klantcontact"),
+        on_delete=models.CASCADE,
+        related_name="betrokkenen",
+    )
+    partij_uuid = models.UUIDField(
+        verbose_name=_("Partij UUID"), null=True, blank=True, db_index=True
+    )
+
+    class Meta:
+        verbose_name = _("OpenKlant2 betrokkene")
+        verbose_name_plural = _("OpenKlant2 betrokkenen")
@@ -3,6 +3,7 @@ import logging
 import uuid
 from typing import Iterable, Literal, Self
 
+from django.db import transaction
 from django.utils import timezone
 
 import glom
@@ -13,10 +14,12 @@ from open_inwoner.accounts.models import User
 from open_inwoner.configurations.models import SiteConfiguration
 from open_inwoner.openklant.api_models import Klant
 from open_inwoner.openklant.clients import build_klanten_client
+from open_inwoner.openklant.models import OpenKlant2Betrokkene, OpenKlant2KlantContact
 from open_inwoner.utils.logentry import system_action
 from openklant2.client import OpenKlant2Client
 from openklant2.types.resources.digitaal_adres import DigitaalAdres
 from openklant2.types.resources.klant_contact import KlantContact
+from openklant2.types.resources.onderwerp_object import OnderwerpObject
 from openklant2.types.resources.partij import Partij, PartijListParams
 
 from .wrap import FetchParameters, get_fetch_parameters
@@ -148,6 +151,12 @@ class OpenKlant2Service:
     client: OpenKlant2Client
     mijn_vragen_actor: uuid.UUID | None
     MIJN_VRAGEN_KANAAL: str = "oip_mijn_vragen"
+    KLANTCONTACT_EXPAND = [
+        "leiddeTotInterneTaken",
+        "gingOverOnderwerpobjecten",
+        "hadBetrokkenen",
+        "hadBetrokkenen.wasPartij",
+    ]
 
     def __init__(
         self, client: OpenKlant2Client, mijn_vragen_actor: str | uuid.UUID | None = None
@@ -549,12 +558,7 @@ class OpenKlant2Service:
         # side.
         klantcontacten = self.client.klant_contact.list_iter(
             params={
-                "expand": [
-                    "leiddeTotInterneTaken",
-                    "gingOverOnderwerpobjecten",
-                    "hadBetrokkenen",
-                    "hadBetrokkenen.wasPartij",
-                ],
+                "expand": self.KLANTCONTACT_EXPAND,
                 "kanaal": self.MIJN_VRAGEN_KANAAL,
             }
         )
@@ -570,6 +574,48 @@ class OpenKlant2Service:
 
         return klantcontacten_for_partij
 
+    def _get_answer_onderwerp_object(
+        self, klantcontact: KlantContact
+    ) -> OnderwerpObject | None:
+        """
+        Return the onderwerpobject linking an answer to its question klantcontact (or
+        `None` if the klantcontact is a question)
+        """
+        if not (onderwerp_objecten := klantcontact["gingOverOnderwerpobjecten"]):
+            return None
+
+        if expanded := glom.glom(
+            klantcontact, "_expand.gingOverOnderwerpobjecten", default=None
+        ):
+            return expanded[0]
+        return self.client.onderwerp_object.retrieve(onderwerp_objecten[0]["uuid"])
+
+    @staticmethod
+    def _build_questions(
+        klantcontacten: dict[str, KlantContact],
+        question_uuids: list[str],
+        answers_for_klantcontact_uuid: dict[str, str],
+    ) -> list[OpenKlant2Question]:
+        question_objs: list[OpenKlant2Question] = []
+        for question_uuid in question_uuids:
+            question = klantcontacten[question_uuid]
+            try:
+                answer_uuid = answers_for_klantcontact_uuid[question_uuid]
+                answer = klantcontacten[answer_uuid]
+            except KeyError:
+                answer = None
+
+            answer_obj = None
+            if answer:
+                answer_obj = OpenKlant2Answer.from_klantcontact(answer)
+
+            question_objs.append(
+                OpenKlant2Question.from_klantcontact_and_answer(question, answer_obj)
+            )
+
+        question_objs.sort(key=lambda o: o.plaatsgevonden_op)
+        return question_objs
+
     def questions_for_partij(self, partij: Partij) -> list[OpenKlant2Question]:
         answers_for_klantcontact_uuid = {}
         question_uuids = []
@@ -581,13 +627,9 @@ class OpenKlant2Service:
             ] = klantcontact
 
             # A klantcontact is an answer if it is linked to a Question via an onderwerp object
-            if onderwerp_objecten := klantcontact["gingOverOnderwerpobjecten"]:
-
-                # To which question klantcontact is this an answer?
-                answer_onderwerp_object = self.client.onderwerp_object.retrieve(
-                    onderwerp_objecten[0]["uuid"]
-                )
-
+            if answer_onderwerp_object := self._get_answer_onderwerp_object(
+                klantcontact
+            ):
                 if not answer_onderwerp_object["wasKlantcontact"]:
                     logger.error(
                         "Onderwerp object %s should point to question klantcontact",
@@ -602,22 +644,144 @@ class OpenKlant2Service:
                 # No onderwerp object, so we treat this klantcontact as a question
                 question_uuids.append(klantcontact["uuid"])
 
-        question_objs: list[OpenKlant2Question] = []
-        for question_uuid in question_uuids:
-            question = klantcontact_uuid_to_klantcontact_object[question_uuid]
-            try:
-                answer_uuid = answers_for_klantcontact_uuid[question_uuid]
-                answer = klantcontact_uuid_to_klantcontact_object[answer_uuid]
-            except KeyError:
-                answer = None
+        return self._build_questions(
+            klantcontact_uuid_to_klantcontact_object,
+            question_uuids,
+            answers_for_klantcontact_uuid,
+        )
 
-            answer_obj = None
-            if answer:
-                answer_obj = OpenKlant2Answer.from_klantcontact(answer)
+    def _get_index_values(
+        self, klantcontact: KlantContact, indexed: OpenKlant2KlantContact | None
+    ) -> dict:
+        onderwerpobject_uuid = question_uuid = None
+        if onderwerp_objecten := klantcontact["gingOverOnderwerpobjecten"]:
+            onderwerpobject_uuid = uuid.UUID(onderwerp_objecten[0]["uuid"])
+            if indexed and indexed.onderwerpobject_uuid == onderwerpobject_uuid:
+                # an onderwerpobject does not move to another question
+                question_uuid = indexed.question_uuid
+            else:
+                onderwerp_object = self._get_answer_onderwerp_object(klantcontact)
+                if was_klantcontact := onderwerp_object["wasKlantcontact"]:
+                    question_uuid = uuid.UUID(was_klantcontact["uuid"])
 
-            question_objs.append(
-                OpenKlant2Question.from_klantcontact_and_answer(question, answer_obj)
+        return {
+            "nummer": klantcontact["nummer"],
+            "kanaal": klantcontact["kanaal"],
+            "onderwerp": klantcontact["onderwerp"],
+            "inhoud": klantcontact["inhoud"],
+            "plaatsgevonden_op": datetime.datetime.fromisoformat(
+                klantcontact["plaatsgevondenOp"]
+            ),
+            "onderwerpobject_uuid": onderwerpobject_uuid,
+            "question_uuid": question_uuid,
+        }
+
+    def sync_klantcontacten(self) -> int:
+        """
+        Update the local index of the klantcontacten on the channel, and return the
+        number of klantcontacten that were added or changed
+
+        OpenKlant2 cannot filter the klantcontacten on changes, so all klantcontacten
+        of the channel are listed, but only the new and changed klantcontacten are
+        written. The onderwerpobjecten are taken from the expanded listing (or the
+        index) instead of being retrieved one by one. Klantcontacten that are no longer
+        listed are removed from the index.
+
+        As every run lists the whole channel, this is not scheduled until the index is
+        read by the views (see `indexed_questions_for_partij`).
+        """
+        indexed = {
+            obj.uuid: obj
+            for obj in OpenKlant2KlantContact.objects.filter(
+                kanaal=self.MIJN_VRAGEN_KANAAL
+            ).prefetch_related("betrokkenen")
+        }
+        seen = set()
+        synced = 0
+
+        for klantcontact in self.client.klant_contact.list_iter(
+            params={
+                "expand": self.KLANTCONTACT_EXPAND,
+                "kanaal": self.MIJN_VRAGEN_KANAAL,
+            }
+        ):
+            klantcontact_uuid = uuid.UUID(klantcontact["uuid"])
+            seen.add(klantcontact_uuid)
+
+            obj = indexed.get(klantcontact_uuid)
+            values = self._get_index_values(klantcontact, obj)
+            partij_for_betrokkene = {
+                uuid.UUID(betrokkene["uuid"]): (
+                    uuid.UUID(partij["uuid"])
+                    if (partij := betrokkene.get("wasPartij"))
+                    else None
+                )
+                for betrokkene in glom.glom(
+                    klantcontact, "_expand.hadBetrokkenen", default=[]
+                )
+            }
+
+            if obj and all(
+                getattr(obj, field) == value for field, value in values.items()
+            ):
+                if partij_for_betrokkene == {
+                    betrokkene.uuid: betrokkene.partij_uuid
+                    for betrokkene in obj.betrokkenen.all()
+                }:
+                    continue
+
+            with transaction.atomic():
+                obj, _ = OpenKlant2KlantContact.objects.update_or_create(
+                    uuid=klantcontact_uuid, defaults=values
+                )
+                obj.betrokkenen.exclude(uuid__in=partij_for_betrokkene).delete()
+                for betrokkene_uuid, partij_uuid in partij_for_betrokkene.items():
+                    OpenKlant2Betrokkene.objects.update_or_create(
+                        uuid=betrokkene_uuid,
+                        defaults={"klantcontact": obj, "partij_uuid": partij_uuid},
+                    )
+            synced += 1
+
+        removed, _ = (
+            OpenKlant2KlantContact.objects.filter(kanaal=self.MIJN_VRAGEN_KANAAL)
+            .exclude(uuid__in=seen)
+            .delete()
+        )
+        logger.info(
+            "Synced %s klantcontacten and removed %s klantcontacten from the index",
+            synced,
+            removed,
+        )
+        return synced
+
+    def indexed_questions_for_partij(self, partij: Partij) -> list[OpenKlant2Question]:
+        """
+        Like `questions_for_partij`, but read from the local index of klantcontacten
+        (see `sync_klantcontacten`) instead of the API
+        """
+        klantcontacten = (
+            OpenKlant2KlantContact.objects.filter(
+                kanaal=self.MIJN_VRAGEN_KANAAL,
+                betrokkenen__partij_uuid=partij["uuid"],
             )
+            .distinct()
+            .order_by("nummer")
+        )
 
-        question_objs.sort(key=lambda o: o.plaatsgevonden_op)
-        return question_objs
+        answers_for_klantcontact_uuid = {}
+        question_uuids = []
+        klantcontact_uuid_to_klantcontact_object = {}
+        for obj in klantcontacten:
+            klantcontact_uuid_to_klantcontact_object[
+                str(obj.uuid)
+            ] = obj.as_klantcontact()
+            if obj.question_uuid:
+                answers_for_klantcontact_uuid[str(obj.question_uuid)] = str(obj.uuid)
+            elif not obj.onderwerpobject_uuid:
+                question_uuids.append(str(obj.uuid))
+
+        return self._build_questions(
+            klantcontact_uuid_to_klantcontact_object,
+            question_uuids,
+            answers_for_klantcontact_uuid,
+        )
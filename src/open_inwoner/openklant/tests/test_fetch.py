@@ -1,8 +1,15 @@
+from unittest.mock import patch
+
 from django.test import TestCase
 
 import requests_mock
+from zgw_consumers.api_models.base import factory
 
-from open_inwoner.openklant.api_models import KlantContactMoment
+from open_inwoner.openklant.api_models import Klant, KlantContactMoment
+from open_inwoner.openklant.clients import (
+    ContactmomentenClient,
+    build_contactmomenten_client,
+)
 from open_inwoner.openklant.tests.data import MockAPIReadData
 from open_inwoner.openklant.wrap import (
     fetch_klantcontactmoment,
@@ -58,3 +65,106 @@ class FetchKlantDataTestCase(ClearCachesMixin, DisableRequestLogMixin, TestCase)
         self.assertIsNotNone(kcm)
         self.assertIsInstance(kcm, KlantContactMoment)
         self.assertEqual(str(kcm.uuid), data.klant_contactmoment2["uuid"])
+
+    def test_fetch_klantcontactmoment_resolves_a_single_contactmoment(self, m):
+        data = MockAPIReadData().install_mocks(m)
+
+        kcm = fetch_klantcontactmoment(
+            data.klant_contactmoment["uuid"], user_bsn=data.user.bsn
+        )
+
+        self.assertEqual(kcm.contactmoment.url, data.contactmoment["url"])
+        requested_urls = {request.url for request in m.request_history}
+        self.assertNotIn(data.contactmoment_vestiging["url"], requested_urls)
+        self.assertNotIn(data.contactmoment_intern["url"], requested_urls)
+
+        # cached for the user
+        m.reset_mock()
+        kcm = fetch_klantcontactmoment(
+            data.klant_contactmoment["uuid"], user_bsn=data.user.bsn
+        )
+
+        self.assertEqual(str(kcm.uuid), data.klant_contactmoment["uuid"])
+        self.assertFalse(m.called)
+
+    def test_fetch_klantcontactmoment_of_other_klant(self, m):
+        data = MockAPIReadData().install_mocks(m)
+
+        kcm = fetch_klantcontactmoment(
+            data.klant_contactmoment2["uuid"], user_bsn=data.user.bsn
+        )
+
+        self.assertIsNone(kcm)
+
+    def test_fetch_klantcontactmoment_with_invalid_uuid(self, m):
+        data = MockAPIReadData().install_mocks(m)
+        m.reset_mock()
+
+        kcm = fetch_klantcontactmoment("not-a-uuid", user_bsn=data.user.bsn)
+
+        self.assertIsNone(kcm)
+        self.assertFalse(m.called)
+
+    def test_fetch_klantcontactmoment_cache_key_has_no_user_identifiers(self, m):
+        data = MockAPIReadData().install_mocks(m)
+
+        with patch("open_inwoner.openklant.wrap.cache") as cache_mock:
+            cache_mock.get.return_value = None
+            fetch_klantcontactmoment(
+                data.klant_contactmoment["uuid"], user_bsn=data.user.bsn
+            )
+
+        (cache_key,) = cache_mock.get.call_args.args
+        self.assertTrue(
+            cache_key.startswith(
+                f"klantcontactmoment:{data.klant_contactmoment['uuid']}:"
+            )
+        )
+        self.assertNotIn(data.user.bsn, cache_key)
+
+    def test_contactmomenten_are_retrieved_once(self, m):
+        data = MockAPIReadData().install_mocks(m)
+        client = build_contactmomenten_client()
+        urls = [data.contactmoment["url"], data.contactmoment_vestiging["url"]]
+
+        contactmomenten = client.retrieve_contactmomenten(urls + urls[:1])
+
+        self.assertEqual(list(contactmomenten), urls)
+        self.assertEqual(
+            [contactmoment.url for contactmoment in contactmomenten.values()], urls
+        )
+        self.assertEqual(m.call_count, 2)
+
+        # memoized by the client
+        client.retrieve_contactmomenten(urls)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_contactmomenten_of_klanten_are_resolved_together(self, m):
+        data = MockAPIReadData().install_mocks(m)
+        client = build_contactmomenten_client()
+        klanten = factory(Klant, [data.klant_bsn, data.klant_kvk, data.klant_vestiging])
+
+        with patch.object(
+            ContactmomentenClient,
+            "retrieve_contactmomenten",
+            autospec=True,
+            side_effect=ContactmomentenClient.retrieve_contactmomenten,
+        ) as mock_retrieve:
+            kcms = client.retrieve_klantcontactmomenten_for_klanten(klanten)
+
+        mock_retrieve.assert_called_once()
+        self.assertEqual(
+            {str(kcm.uuid) for kcm in kcms},
+            {
+                data.klant_contactmoment["uuid"],
+                data.klant_contactmoment_intern["uuid"],
+                data.klant_contactmoment2["uuid"],
+                data.klant_contactmoment4["uuid"],
+            },
+        )
+        self.assertEqual(
+            {kcm.klant.url for kcm in kcms},
+            {klant.url for klant in klanten},
+        )
+        self.assertTrue(all(kcm.contactmoment for kcm in kcms))
@@ -7,6 +7,7 @@ from open_inwoner.openklant.tests.data import MockAPIReadData
 from open_inwoner.openklant.wrap import (
     fetch_klantcontactmomenten,
     get_kcm_answer_mapping,
+    mark_kcm_answer_seen,
 )
 from open_inwoner.utils.test import ClearCachesMixin, DisableRequestLogMixin
 
@@ -63,3 +64,39 @@ class KlantHelperTest(ClearCachesMixin, DisableRequestLogMixin, TestCase):
                     kcms[1].contactmoment.url: kcm_answers[1],
                 },
             )
+
+    def test_get_kcm_answer_mapping_query_count(self, m):
+        data = MockAPIReadData().install_mocks(m)
+        contactmomenten = [
+            kcm.contactmoment
+            for kcm in fetch_klantcontactmomenten(user_bsn=data.user.bsn)
+        ]
+
+        # read, and insert the missing answers (in a savepoint)
+        with self.assertNumQueries(4):
+            get_kcm_answer_mapping(contactmomenten, data.user)
+
+        with self.assertNumQueries(1):
+            mapping = get_kcm_answer_mapping(contactmomenten, data.user)
+
+        self.assertEqual(
+            list(mapping), [contactmoment.url for contactmoment in contactmomenten]
+        )
+
+    def test_mark_kcm_answer_seen(self, m):
+        data = MockAPIReadData().install_mocks(m)
+        kcm = fetch_klantcontactmomenten(user_bsn=data.user.bsn)[0]
+        KlantContactMomentAnswer.objects.create(
+            user=data.user, contactmoment_url=kcm.contactmoment.url
+        )
+
+        with self.assertNumQueries(2):
+            kcm_answer = mark_kcm_answer_seen(kcm.contactmoment, data.user)
+
+        self.assertTrue(kcm_answer.is_seen)
+        kcm_answer.refresh_from_db()
+        self.assertTrue(kcm_answer.is_seen)
+
+        # already seen
+        with self.assertNumQueries(1):
+            mark_kcm_answer_seen(kcm.contactmoment, data.user)
@@ -6,6 +6,7 @@ import freezegun
 
 from open_inwoner.accounts.models import User
 from open_inwoner.accounts.tests.factories import UserFactory
+from open_inwoner.openklant.models import OpenKlant2KlantContact
 from open_inwoner.openklant.services import OpenKlant2Question, OpenKlant2Service
 from open_inwoner.openklant.tests.helpers import Openklant2ServiceTestCase
 from openklant2.factories.partij import CreatePartijPersoonDataFactory
@@ -399,3 +400,44 @@ class QuestionAnswerTestCase(Openklant2ServiceTestCase):
         self.assertTrue(
             all(self.een_persoon["uuid"] in question.question for question in questions)
         )
+
+    def test_get_questions_from_index(self):
+        for persoon in (self.een_persoon, self.een_ander_persoon):
+            raw_questions = [
+                self.service.create_question(
+                    persoon,
+                    question=f"A question asked by {persoon['uuid']}, part {i}",
+                    subject="Life and stuff",
+                )
+                for i in range(2)
+            ]
+
+            for rq in raw_questions[:1]:
+                self.service.create_answer(
+                    persoon, rq.question_kcm_uuid, "The answer is 42"
+                )
+
+        synced = self.service.sync_klantcontacten()
+
+        self.assertEqual(synced, 6)
+        self.assertEqual(OpenKlant2KlantContact.objects.count(), 6)
+
+        # no requests are needed to look up the questions
+        with self.assertNumQueries(1):
+            questions = self.service.indexed_questions_for_partij(self.een_persoon)
+
+        self.assertEqual(
+            len(questions), 2, msg="Only the user's questions should be returned"
+        )
+        self.assertEqual(
+            {
+                question.question: question.answer and question.answer.answer
+                for question in questions
+            },
+            {
+                f"A question asked by {self.een_persoon['uuid']}, part 0": (
+                    "The answer is 42"
+                ),
+                f"A question asked by {self.een_persoon['uuid']}, part 1": None,
+            },
+        )
@@ -1,30 +1,31 @@
 import logging
+import uuid
 from datetime import timedelta
-from typing import NotRequired, TypedDict
+from typing import Iterable, NotRequired, TypedDict
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 
 from open_inwoner.accounts.models import User
 from open_inwoner.kvk.branches import get_kvk_branch_number
-from open_inwoner.openklant.api_models import ContactMoment, KlantContactMoment
+from open_inwoner.openklant.api_models import ContactMoment, Klant, KlantContactMoment
 from open_inwoner.openklant.clients import (
     build_contactmomenten_client,
     build_klanten_client,
 )
 from open_inwoner.openklant.models import KlantContactMomentAnswer, OpenKlantConfig
+from open_inwoner.utils.hash import create_sha256_hash
 from open_inwoner.utils.time import instance_is_new
 
 logger = logging.getLogger(__name__)
 
 
-def fetch_klantcontactmomenten(
+def _fetch_klanten(
     user_bsn: str | None = None,
     user_kvk_or_rsin: str | None = None,
     vestigingsnummer: str | None = None,
-) -> list[KlantContactMoment]:
-    if not user_bsn and not user_kvk_or_rsin:
-        return []
-
+) -> list[Klant]:
     client = build_klanten_client()
     if client is None:
         return []
@@ -36,17 +37,30 @@ def fetch_klantcontactmomenten(
             user_kvk_or_rsin, vestigingsnummer=vestigingsnummer
         )
 
-    if klanten is None:
+    return klanten or []
+
+
+def fetch_klantcontactmomenten(
+    user_bsn: str | None = None,
+    user_kvk_or_rsin: str | None = None,
+    vestigingsnummer: str | None = None,
+) -> list[KlantContactMoment]:
+    if not user_bsn and not user_kvk_or_rsin:
+        return []
+
+    klanten = _fetch_klanten(
+        user_bsn=user_bsn,
+        user_kvk_or_rsin=user_kvk_or_rsin,
+        vestigingsnummer=vestigingsnummer,
+    )
+    if not klanten:
         return []
 
     client = build_contactmomenten_client()
     if client is None:
         return []
 
-    ret = list()
-    for klant in klanten:
-        moments = client.retrieve_klantcontactmomenten_for_klant(klant)
-        ret.extend(moments)
+    ret = client.retrieve_klantcontactmomenten_for_klanten(klanten)
 
     # combine sorting for moments of all klanten for a bsn
     ret.sort(key=lambda kcm: kcm.contactmoment.registratiedatum, reverse=True)
@@ -60,26 +74,51 @@ def fetch_klantcontactmoment(
     user_kvk_or_rsin: str | None = None,
     vestigingsnummer: str | None = None,
 ) -> KlantContactMoment | None:
+    """
+    Fetch a single klantcontactmoment of the user's klanten
+
+    Only the contactmoment of the klantcontactmoment itself is resolved, and the
+    result is cached (per user) for `CACHE_KLANTCONTACTMOMENT_TIMEOUT` seconds.
+    """
     if not user_bsn and not user_kvk_or_rsin:
         return
 
-    # use the list query because eSuite doesn't have all proper resources
-    # see git history before this change for the original single resource version
-    if user_bsn:
-        kcms = fetch_klantcontactmomenten(user_bsn=user_bsn)
-    elif user_kvk_or_rsin:
-        kcms = fetch_klantcontactmomenten(
-            user_kvk_or_rsin=user_kvk_or_rsin, vestigingsnummer=vestigingsnummer
-        )
+    try:
+        kcm_uuid = str(uuid.UUID(kcm_uuid))
+    except ValueError:
+        return
 
-    kcm = None
-    # try to grab the specific KCM
-    for k in kcms:
-        if kcm_uuid == str(k.uuid):
-            kcm = k
-            break
+    # don't put the BSN or KvK number in the cache key
+    user_hash = create_sha256_hash(
+        f"{user_bsn}:{user_kvk_or_rsin}:{vestigingsnummer}", salt=settings.SECRET_KEY
+    )
+    cache_key = f"klantcontactmoment:{kcm_uuid}:{user_hash}"
+    if kcm := cache.get(cache_key):
+        return kcm
+
+    klanten = _fetch_klanten(
+        user_bsn=user_bsn,
+        user_kvk_or_rsin=user_kvk_or_rsin,
+        vestigingsnummer=vestigingsnummer,
+    )
+    if not klanten:
+        return
 
-    return kcm
+    client = build_contactmomenten_client()
+    if client is None:
+        return
+
+    # eSuite doesn't have all proper resources, so the klantcontactmoment is looked
+    # up through the klantcontactmomenten of the klanten
+    for klant in klanten:
+        if kcm := client.retrieve_klantcontactmoment_for_klant(klant, kcm_uuid):
+            if kcm.contactmoment:
+                cache.set(
+                    cache_key, kcm, timeout=settings.CACHE_KLANTCONTACTMOMENT_TIMEOUT
+                )
+            return kcm
+
+    return None
 
 
 class BsnFetchParam(TypedDict):
@@ -123,32 +162,73 @@ def get_fetch_parameters(
     return None
 
 
-def get_kcm_answer_mapping(
-    contactmomenten: list[ContactMoment],
-    user: User,
+def _get_or_create_kcm_answers(
+    contactmoment_urls: Iterable[str], user: User
 ) -> dict[str, KlantContactMomentAnswer]:
-    to_create = []
-    existing_kcms = set(
-        KlantContactMomentAnswer.objects.filter(user=user).values_list(
-            "contactmoment_url", flat=True
+    """
+    Get or create the `KlantContactMomentAnswer` of the user for each of the
+    contactmomenten, in one read and (if any are missing) one insert query
+    """
+    contactmoment_urls = list(dict.fromkeys(contactmoment_urls))
+    kcm_answer_mapping = {
+        kcm_answer.contactmoment_url: kcm_answer
+        for kcm_answer in KlantContactMomentAnswer.objects.filter(
+            user=user, contactmoment_url__in=contactmoment_urls
         )
-    )
-    for contactmoment in contactmomenten:
-        if contactmoment.url in existing_kcms:
-            continue
+    }
 
-        to_create.append(
-            KlantContactMomentAnswer(user=user, contactmoment_url=contactmoment.url)
+    missing = [url for url in contactmoment_urls if url not in kcm_answer_mapping]
+    if not missing:
+        return kcm_answer_mapping
+
+    to_create = [
+        KlantContactMomentAnswer(user=user, contactmoment_url=url) for url in missing
+    ]
+    try:
+        with transaction.atomic():
+            KlantContactMomentAnswer.objects.bulk_create(to_create)
+    except IntegrityError:
+        # created by a concurrent request in the meantime
+        KlantContactMomentAnswer.objects.bulk_create(to_create, ignore_conflicts=True)
+        to_create = KlantContactMomentAnswer.objects.filter(
+            user=user, contactmoment_url__in=missing
         )
 
-    KlantContactMomentAnswer.objects.bulk_create(to_create)
+    kcm_answer_mapping.update(
+        (kcm_answer.contactmoment_url, kcm_answer) for kcm_answer in to_create
+    )
+    return kcm_answer_mapping
 
-    kcm_answer_mapping = {
-        kcm_answer.contactmoment_url: kcm_answer
-        for kcm_answer in KlantContactMomentAnswer.objects.filter(user=user)
-    }
 
-    return kcm_answer_mapping
+def get_kcm_answer_mapping(
+    contactmomenten: list[ContactMoment],
+    user: User,
+) -> dict[str, KlantContactMomentAnswer]:
+    """
+    Return the `KlantContactMomentAnswer` of the user for each of the contactmomenten
+    (by URL), creating the missing ones
+
+    Call this once for all contactmomenten of a page: the number of queries does not
+    depend on the number of contactmomenten.
+    """
+    return _get_or_create_kcm_answers(
+        (contactmoment.url for contactmoment in contactmomenten), user
+    )
+
+
+def mark_kcm_answer_seen(
+    contactmoment: ContactMoment, user: User
+) -> KlantContactMomentAnswer:
+    """
+    Mark the answer to the contactmoment as seen by the user
+    """
+    kcm_answer = _get_or_create_kcm_answers([contactmoment.url], user)[
+        contactmoment.url
+    ]
+    if not kcm_answer.is_seen:
+        kcm_answer.is_seen = True
+        KlantContactMomentAnswer.objects.filter(pk=kcm_answer.pk).update(is_seen=True)
+    return kcm_answer
 
 
 def contactmoment_has_new_answer(
@@ -21,11 +21,15 @@ from open_inwoner.openzaak.import_export import (
     CatalogusConfigExport,
     CatalogusConfigImport,
 )
+from open_inwoner.openzaak.tasks import process_zaken_notification
+from open_inwoner.utils.circuit_breaker import get_circuit_states_display
 from open_inwoner.utils.forms import LimitedUploadFileField
 
+from .constants import ReceivedNotificationStatus
 from .models import (
     CatalogusConfig,
     OpenZaakConfig,
+    ReceivedNotification,
     UserCaseInfoObjectNotification,
     UserCaseStatusNotification,
     ZaakTypeConfig,
@@ -41,6 +45,15 @@ logger = logging.getLogger(__name__)
 class ZGWApiGroupConfig(admin.StackedInline):
     model = ZGWApiGroupConfig
     extra = 0
+    readonly_fields = ["circuit_breaker_states"]
+
+    @admin.display(description=_("Circuit breaker"))
+    def circuit_breaker_states(self, obj):
+        if not obj.pk:
+            return "-"
+        return get_circuit_states_display(
+            [obj.zrc_service, obj.drc_service, obj.ztc_service, obj.form_service]
+        )
 
 
 @admin.register(OpenZaakConfig)
@@ -505,6 +518,58 @@ class ZaakTypeConfigAdmin(ImportExportMixin, admin.ModelAdmin):
         )
 
 
+@admin.register(ReceivedNotification)
+class ReceivedNotificationAdmin(admin.ModelAdmin):
+    search_fields = [
+        "resource_url",
+        "hoofd_object",
+    ]
+    list_display = [
+        "resource",
+        "actie",
+        "resource_url",
+        "received_on",
+        "processed_on",
+        "attempted_on",
+        "deliveries",
+        "status",
+    ]
+    list_filter = [
+        "status",
+        "resource",
+        "kanaal",
+    ]
+    date_hierarchy = "received_on"
+    actions = ["reprocess_notifications"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    @admin.action(description=_("Process the selected failed notifications again"))
+    def reprocess_notifications(self, request, qs):
+        failed = list(
+            qs.filter(status=ReceivedNotificationStatus.failed).values_list(
+                "pk", flat=True
+            )
+        )
+        for pk in failed:
+            process_zaken_notification.delay(pk)
+
+        self.message_user(
+            request,
+            ngettext(
+                "%d notification will be processed again.",
+                "%d notifications will be processed again.",
+                len(failed),
+            )
+            % len(failed),
+            level=messages.SUCCESS,
+        )
+
+
 @admin.register(UserCaseStatusNotification)
 class UserCaseStatusNotificationAdmin(admin.ModelAdmin):
     raw_id_fields = ["user"]
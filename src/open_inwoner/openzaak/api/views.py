@@ -1,5 +1,7 @@
 import logging
 
+from django.conf import settings
+
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -10,7 +12,10 @@ from open_inwoner.configurations.models import SiteConfiguration
 from open_inwoner.openzaak.api_models import Notification
 from open_inwoner.openzaak.auth import get_valid_subscription_from_request
 from open_inwoner.openzaak.exceptions import InvalidAuth
-from open_inwoner.openzaak.notifications import handle_zaken_notification
+from open_inwoner.openzaak.notifications import (
+    handle_zaken_notification,
+    receive_zaken_notification,
+)
 from open_inwoner.utils.logentry import system_action as log_system_action
 
 logger = logging.getLogger(__name__)
@@ -95,4 +100,8 @@ class ZakenNotificationsWebhookView(NotificationsWebhookBaseView):
         config = SiteConfiguration.get_solo()
         if not config.notifications_cases_enabled:
             return
-        handle_zaken_notification(notification)
+
+        if settings.ZGW_NOTIFICATIONS_ASYNC:
+            receive_zaken_notification(notification)
+        else:
+            handle_zaken_notification(notification)
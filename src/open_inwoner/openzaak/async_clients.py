@@ -0,0 +1,330 @@
+"""
+asyncio counterparts of the ZGW clients in `.clients`, limited to the calls needed to
+fetch and resolve the cases of a user (see `AsyncCaseResolver`).
+
+The methods mirror their synchronous counterparts, including the cache keys and
+options, so both implementations share the cached results.
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+from django.conf import settings
+
+import httpx
+import requests
+from ape_pie.client import is_base_url
+from ape_pie.exceptions import InvalidURLError
+from zgw_consumers.api_models.base import factory
+from zgw_consumers.client import ServiceConfigAdapter
+from zgw_consumers.models import Service
+
+from open_inwoner.utils.api import ClientError, get_page_urls, merge_page_results
+from open_inwoner.utils.circuit_breaker import asend_with_circuit_breaker
+from open_inwoner.utils.outbound import outbound_scheduler
+
+from ..utils.decorators import cache as cache_result
+from .api_models import Resultaat, ResultaatType, Status, StatusType, Zaak, ZaakType
+from .clients import CATALOGI_CACHE_OPTIONS, CRS_HEADERS
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyBudget:
+    """
+    Limit the number of requests in flight, in total and per backend
+    """
+
+    def __init__(self, max_concurrency: int, max_concurrency_per_backend: int):
+        self.max_concurrency_per_backend = max_concurrency_per_backend
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._backend_semaphores: dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(max_concurrency_per_backend)
+        )
+
+    @asynccontextmanager
+    async def acquire(self, backend: str):
+        async with self._backend_semaphores[backend], self._semaphore:
+            yield
+
+
+def get_json_response(response: httpx.Response) -> dict | None:
+    """
+    Equivalent of `open_inwoner.utils.api.get_json_response` for httpx responses
+    """
+    try:
+        response_json = response.json()
+    except Exception:
+        response_json = None
+
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        if response.status_code >= 500:
+            raise
+        raise ClientError(response_json) from exc
+
+    return response_json
+
+
+def _get_auth_headers(auth: requests.auth.AuthBase | None) -> dict[str, str]:
+    # the zgw-consumers auth classes only set headers
+    if not auth:
+        return {}
+    request = auth(requests.Request("GET", "http://localhost/").prepare())
+    return dict(request.headers)
+
+
+class AsyncZgwAPIClient:
+    """
+    An httpx-based client for a ZGW service
+
+    Like the synchronous clients, the requests are routed through the
+    `outbound_scheduler` and the circuit breaker of the service. The unavailability
+    errors of those (`requests.ConnectionError`) are handled like connection errors.
+
+    The client must be built outside the event loop (the configuration of the service
+    is read from the database) and used as an async context manager.
+    """
+
+    configured_from: Service
+
+    def __init__(
+        self,
+        service: Service,
+        budget: ConcurrencyBudget,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.configured_from = service
+        self.base_url = service.api_root
+        self.budget = budget
+
+        session_kwargs = ServiceConfigAdapter(service).get_client_session_kwargs()
+        self._client = httpx.AsyncClient(
+            headers=_get_auth_headers(session_kwargs.get("auth")),
+            cert=session_kwargs.get("cert"),
+            verify=session_kwargs.get("verify", True),
+            timeout=session_kwargs.get("timeout"),
+            limits=httpx.Limits(
+                max_connections=budget.max_concurrency_per_backend,
+            ),
+            transport=transport,
+        )
+
+    def __str__(self):
+        return f"Client {self.__class__.__name__} for {self.base_url}"
+
+    async def __aenter__(self):
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(self, *args):
+        await self._client.__aexit__(*args)
+
+    def to_absolute_url(self, url: str) -> str:
+        # same restriction as `ape_pie.APIClient`: don't send the credentials elsewhere
+        if is_base_url(url):
+            if not url.startswith(self.base_url):
+                raise InvalidURLError(
+                    f"Target URL {url} has a different base URL than the client "
+                    f"({self.base_url})."
+                )
+            return url
+        return f"{self.base_url.rstrip('/')}/{url.lstrip('/')}"
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        url = self.to_absolute_url(url)
+        async with self.budget.acquire(self.base_url):
+            # the same limiter and circuit breaker as the synchronous clients
+            return await asend_with_circuit_breaker(
+                self.configured_from,
+                lambda: outbound_scheduler.asend(
+                    url, lambda: self._client.get(url, **kwargs)
+                ),
+            )
+
+    async def _get_page(self, url: str, **kwargs) -> dict:
+        response = await self.get(url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_paginated(
+        self, data: dict, max_requests: int | None = None, **kwargs
+    ) -> list[dict]:
+        """
+        Equivalent of `open_inwoner.utils.api.parallel_pagination_helper`
+        """
+        results = list(data["results"])
+        next_url = data.get("next")
+        num_requests = 0
+
+        if len(page_urls := get_page_urls(data, max_requests)) > 1:
+            pages = await asyncio.gather(
+                *(self._get_page(url, **kwargs) for url in page_urls)
+            )
+
+            merge_page_results(results, pages)
+
+            num_requests = len(page_urls)
+            next_url = pages[-1].get("next")
+
+        while next_url:
+            if max_requests and num_requests >= max_requests:
+                logger.info(
+                    "Number of requests while retrieving paginated results reached "
+                    "maximum of %s requests, returning results",
+                    max_requests,
+                )
+                break
+            page = await self._get_page(next_url, **kwargs)
+            num_requests += 1
+            results.extend(page["results"])
+            next_url = page.get("next")
+        return results
+
+    async def _fetch_single(self, url: str, model: type):
+        try:
+            response = await self.get(url)
+            data = get_json_response(response)
+        except (httpx.HTTPError, requests.ConnectionError, ClientError) as e:
+            logger.exception("exception while making request", exc_info=e)
+            return
+
+        return factory(model, data)
+
+
+class AsyncZakenClient(AsyncZgwAPIClient):
+    def __init__(self, *args, zaak_max_confidentiality: str, **kwargs):
+        # `OpenZaakConfig` cannot be read from the event loop
+        self.zaak_max_confidentiality = zaak_max_confidentiality
+        super().__init__(*args, **kwargs)
+
+    async def fetch_cases(
+        self,
+        user_bsn: str | None = None,
+        user_kvk: str | None = None,
+        user_rsin: str | None = None,
+        max_requests: int = 4,
+        identificatie: str | None = None,
+        vestigingsnummer: str | None = None,
+    ) -> list[Zaak]:
+        if user_bsn and (user_kvk or user_rsin or vestigingsnummer):
+            raise ValueError(
+                "either `user_bsn` or `user_kvk`/`user_risin` (+ optionally `vestigingsnummer`) "
+                "should be supplied, not both"
+            )
+
+        if user_bsn:
+            return await self.fetch_cases_by_bsn(
+                user_bsn, max_requests=max_requests, identificatie=identificatie
+            )
+
+        if user_kvk or user_rsin:
+            user_kvk_or_rsin = user_rsin if user_rsin else user_kvk
+            return await self.fetch_cases_by_kvk_or_rsin(
+                user_kvk_or_rsin,
+                max_requests=max_requests,
+                zaak_identificatie=identificatie,
+                vestigingsnummer=vestigingsnummer,
+            )
+        return []
+
+    @cache_result(
+        "{self.base_url}:cases:{user_bsn}:{max_requests}:{identificatie}",
+        timeout=settings.CACHE_ZGW_ZAKEN_TIMEOUT,
+        tags=["betrokkene:{user_bsn}"],
+    )
+    async def fetch_cases_by_bsn(
+        self,
+        user_bsn: str,
+        max_requests: int | None = 4,
+        identificatie: str | None = None,
+    ) -> list[Zaak]:
+        params = {
+            "rol__betrokkeneIdentificatie__natuurlijkPersoon__inpBsn": user_bsn,
+            "maximaleVertrouwelijkheidaanduiding": self.zaak_max_confidentiality,
+        }
+        if identificatie:
+            params.update({"identificatie": identificatie})
+
+        return await self._fetch_cases(params, max_requests)
+
+    @cache_result(
+        "{self.base_url}:cases:{kvk_or_rsin}:{vestigingsnummer}:{max_requests}:{zaak_identificatie}",
+        timeout=settings.CACHE_ZGW_ZAKEN_TIMEOUT,
+        tags=["betrokkene:{kvk_or_rsin}", "vestiging:{vestigingsnummer}"],
+    )
+    async def fetch_cases_by_kvk_or_rsin(
+        self,
+        kvk_or_rsin: str | None,
+        max_requests: int | None = 4,
+        zaak_identificatie: str | None = None,
+        vestigingsnummer: str | None = None,
+    ) -> list[Zaak]:
+        if not kvk_or_rsin:
+            return []
+
+        params = {
+            "rol__betrokkeneIdentificatie__nietNatuurlijkPersoon__innNnpId": kvk_or_rsin,
+            "maximaleVertrouwelijkheidaanduiding": self.zaak_max_confidentiality,
+        }
+        if vestigingsnummer:
+            params.update(
+                {
+                    "rol__betrokkeneIdentificatie__vestiging__vestigingsNummer": vestigingsnummer,
+                }
+            )
+        if zaak_identificatie:
+            params.update({"identificatie": zaak_identificatie})
+
+        return await self._fetch_cases(params, max_requests)
+
+    async def _fetch_cases(self, params: dict, max_requests: int | None) -> list[Zaak]:
+        try:
+            response = await self.get("zaken", params=params, headers=CRS_HEADERS)
+            data = get_json_response(response)
+            all_data = await self.get_paginated(
+                data, max_requests=max_requests, headers=CRS_HEADERS
+            )
+        except (httpx.HTTPError, requests.ConnectionError, ClientError) as e:
+            logger.exception("exception while making request", exc_info=e)
+            return []
+
+        return factory(Zaak, all_data)
+
+    @cache_result("{self.base_url}:status:{status_url}", timeout=60 * 60)
+    async def fetch_single_status(self, status_url: str) -> Status | None:
+        return await self._fetch_single(status_url, Status)
+
+    @cache_result(
+        "{self.base_url}:single_result:{result_url}",
+        timeout=settings.CACHE_ZGW_ZAKEN_TIMEOUT,
+    )
+    async def fetch_single_result(self, result_url: str) -> Resultaat | None:
+        return await self._fetch_single(result_url, Resultaat)
+
+
+class AsyncCatalogiClient(AsyncZgwAPIClient):
+    @cache_result(
+        "{self.base_url}:status_type:{status_type_url}",
+        **CATALOGI_CACHE_OPTIONS,
+    )
+    async def fetch_single_status_type(self, status_type_url: str) -> StatusType | None:
+        return await self._fetch_single(status_type_url, StatusType)
+
+    @cache_result(
+        "{self.base_url}:resultaat_type:{resultaat_type_url}",
+        **CATALOGI_CACHE_OPTIONS,
+    )
+    async def fetch_single_resultaat_type(
+        self, resultaat_type_url: str
+    ) -> ResultaatType | None:
+        return await self._fetch_single(resultaat_type_url, ResultaatType)
+
+    @cache_result(
+        "{self.base_url}:case_type:{case_type_url}",
+        **CATALOGI_CACHE_OPTIONS,
+    )
+    async def fetch_single_case_type(self, case_type_url: str) -> ZaakType | None:
+        return await self._fetch_single(case_type_url, ZaakType)
@@ -0,0 +1,124 @@
+"""
+Warm up the caches of the cached `CatalogiClient` lookups from the catalogi listings,
+so the first visitors after the (nightly) import don't pay for the cold caches.
+"""
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+
+from django.conf import settings
+
+from zgw_consumers.concurrent import parallel
+
+from open_inwoner.utils.local_cache import invalidate_local_caches
+
+from .api_models import ZaakType
+from .clients import CatalogiClient, build_catalogi_clients
+
+logger = logging.getLogger(__name__)
+
+# resource -> cached lookup
+CACHED_LOOKUPS = {
+    "zaaktype": CatalogiClient.fetch_single_case_type,
+    "statustype": CatalogiClient.fetch_single_status_type,
+    "resultaattype": CatalogiClient.fetch_single_resultaat_type,
+    "informatieobjecttype": CatalogiClient.fetch_single_information_object_type,
+}
+
+
+@dataclass
+class CacheWarmUpReport:
+    # number of values that were already cached
+    hits: Counter = field(default_factory=Counter)
+    # number of values that were not cached (or expired)
+    misses: Counter = field(default_factory=Counter)
+    failed_clients: list[str] = field(default_factory=list)
+
+    def add(self, resource: str, was_cached: bool):
+        if was_cached:
+            self.hits[resource] += 1
+        else:
+            self.misses[resource] += 1
+
+    def hit_rate(self, resource: str) -> float:
+        total = self.hits[resource] + self.misses[resource]
+        return self.hits[resource] / total if total else 0.0
+
+    def summary(self) -> list[str]:
+        lines = [
+            f"warmed up {self.hits[resource] + self.misses[resource]} {resource} "
+            f"cache entries ({self.hit_rate(resource):.0%} were cached)"
+            for resource in CACHED_LOOKUPS
+        ]
+        for client in self.failed_clients:
+            lines.append(f"failed to warm up the caches for {client}")
+        return lines
+
+
+def _prime(client: CatalogiClient, resource: str, values) -> list[tuple[str, bool]]:
+    lookup = CACHED_LOOKUPS[resource]
+    return [(resource, lookup.prime(value, client, value.url)) for value in values]
+
+
+def _warm_up_client(client: CatalogiClient, max_workers: int) -> list[tuple[str, bool]]:
+    case_types = client.fetch_zaaktypes_no_cache()
+    results = _prime(client, "zaaktype", case_types)
+
+    def warm_up_case_type(case_type: ZaakType) -> list[tuple[str, bool]]:
+        return _prime(
+            client, "statustype", client.fetch_status_types_no_cache(case_type.url)
+        ) + _prime(
+            client,
+            "resultaattype",
+            client.fetch_result_types_no_cache(case_type.url),
+        )
+
+    with parallel(max_workers=max_workers) as executor:
+        for case_type_results in executor.map(warm_up_case_type, case_types):
+            results += case_type_results
+
+    results += _prime(
+        client,
+        "informatieobjecttype",
+        client.fetch_information_object_types_no_cache(),
+    )
+    return results
+
+
+def warm_up_catalogi_caches(max_workers: int | None = None) -> CacheWarmUpReport:
+    """
+    Store the zaaktypen, statustypen, resultaattypen and informatieobjecttypen of
+    every catalogi service as the cached values of their single lookups
+
+    The values are fetched with the listings (with at most `max_workers` concurrent
+    requests per service) instead of one by one. Afterwards, the local caches of all
+    processes are cleared, so they pick up the refreshed values.
+    """
+    max_workers = max_workers or settings.ZGW_CACHE_WARMUP_MAX_WORKERS
+    report = CacheWarmUpReport()
+
+    # API groups can share a catalogi service
+    clients = {client.configured_from.pk: client for client in build_catalogi_clients()}
+
+    for client in clients.values():
+        try:
+            results = _warm_up_client(client, max_workers)
+        except Exception:
+            logger.exception("Failed to warm up the caches for %s", client)
+            report.failed_clients.append(str(client))
+            continue
+
+        for resource, was_cached in results:
+            report.add(resource, was_cached)
+
+    invalidate_local_caches()
+
+    for resource in CACHED_LOOKUPS:
+        logger.info(
+            "Warmed up %s %s cache entries (hit rate %.2f)",
+            report.hits[resource] + report.misses[resource],
+            resource,
+            report.hit_rate(resource),
+        )
+
+    return report
@@ -1,6 +1,9 @@
 import base64
 import concurrent.futures
+import hashlib
 import logging
+import threading
+import time
 import warnings
 from dataclasses import dataclass
 from datetime import date
@@ -12,6 +15,7 @@ from django.utils.functional import SimpleLazyObject
 
 from ape_pie.client import APIClient
 from requests import HTTPError, RequestException, Response
+from requests.adapters import HTTPAdapter
 from zgw_consumers.api_models.base import factory
 from zgw_consumers.api_models.catalogi import Catalogus
 from zgw_consumers.api_models.constants import RolOmschrijving, RolTypes
@@ -23,9 +27,16 @@ from zgw_consumers.service import pagination_helper
 
 from open_inwoner.openzaak.api_models import InformatieObject
 from open_inwoner.openzaak.exceptions import MultiZgwClientProxyError
-from open_inwoner.utils.api import ClientError, get_json_response
+from open_inwoner.utils.api import (
+    ClientError,
+    get_json_response,
+    parallel_pagination_helper,
+)
 
+from ..utils.circuit_breaker import CircuitBreakerMixin
 from ..utils.decorators import cache as cache_result
+from ..utils.files import MultipartFileStream
+from ..utils.outbound import ScheduledRequestsMixin
 from .api_models import (
     InformatieObjectType,
     OpenSubmission,
@@ -43,22 +54,120 @@ from .models import OpenZaakConfig
 
 CRS_HEADERS = {"Content-Crs": "EPSG:4326", "Accept-Crs": "EPSG:4326"}
 
+# popular, rarely changing catalogi lookups: avoid stampedes on expiry and outages
+CATALOGI_CACHE_OPTIONS = {
+    "timeout": settings.CACHE_ZGW_CATALOGI_TIMEOUT
+    + settings.CACHE_ZGW_CATALOGI_STALE_TIMEOUT,
+    "soft_timeout": settings.CACHE_ZGW_CATALOGI_TIMEOUT,
+    "single_flight": True,
+    "last_good_timeout": settings.CACHE_ZGW_CATALOGI_LAST_GOOD_TIMEOUT,
+    "is_failure": lambda result: result is None,
+    "local_timeout": settings.CACHE_ZGW_CATALOGI_LOCAL_TIMEOUT,
+    "local_maxsize": settings.CACHE_ZGW_CATALOGI_LOCAL_MAXSIZE,
+}
+
 logger = logging.getLogger(__name__)
 
 
-class ZgwAPIClient(APIClient):
+class ZgwAPIClient(CircuitBreakerMixin, ScheduledRequestsMixin, APIClient):
     """A client for interacting with ZGW services."""
 
     configured_from: Service
+    pooled: bool = False
+    retired: bool = False
 
     def __init__(self, *args, **kwargs):
         self.configured_from = kwargs.pop("configured_from")
+        pool_maxsize = kwargs.pop("pool_maxsize", None)
         super().__init__(*args, **kwargs)
 
+        if pool_maxsize:
+            # long-lived client shared between threads (see `ZgwClientPool`): enter the
+            # session once, so the connections are kept alive instead of closed after
+            # every request. The pool closes the client.
+            self.pooled = True
+            self._in_flight = 0
+            self._in_flight_lock = threading.Lock()
+            adapter_kwargs = {"pool_connections": 1, "pool_maxsize": pool_maxsize}
+            self.mount("https://", HTTPAdapter(**adapter_kwargs))
+            self.mount("http://", HTTPAdapter(**adapter_kwargs))
+            super().__enter__()
+
+    def __enter__(self):
+        if self.pooled:
+            return self
+        return super().__enter__()
+
+    def __exit__(self, *args):
+        # a pooled client is closed by the pool, other threads might still be using it
+        if self.pooled:
+            return
+        return super().__exit__(*args)
+
+    def request(self, *args, **kwargs) -> Response:
+        if not self.pooled:
+            return super().request(*args, **kwargs)
+
+        with self._in_flight_lock:
+            self._in_flight += 1
+        try:
+            return super().request(*args, **kwargs)
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+                is_idle = self.retired and not self._in_flight
+            if is_idle:
+                self.close()
+
+    def retire(self):
+        """
+        Close a pooled client once the requests in flight are finished
+
+        Threads can still hold (and use) a client that was dropped from the pool, the
+        client is closed again after each of their requests.
+        """
+        with self._in_flight_lock:
+            self.retired = True
+            is_idle = not self._in_flight
+        if is_idle:
+            self.close()
+
     def __str__(self):
         return f"Client {self.__class__.__name__} for {self.base_url}"
 
 
+def filter_roles_for_bsn(roles: list[Rol], bsn: str) -> list[Rol]:
+    roles_for_bsn = []
+    for role in roles:
+        if role.betrokkene_type == RolTypes.natuurlijk_persoon:
+            inp_bsn = role.betrokkene_identificatie.get("inp_bsn")
+            if inp_bsn and inp_bsn == bsn:
+                roles_for_bsn.append(role)
+    return roles_for_bsn
+
+
+def filter_roles_for_kvk_or_rsin(roles: list[Rol], kvk_or_rsin: str) -> list[Rol]:
+    roles_for_kvk_or_rsin = []
+    for role in roles:
+        if role.betrokkene_type == RolTypes.niet_natuurlijk_persoon:
+            nnp_id = role.betrokkene_identificatie.get("inn_nnp_id")
+            if nnp_id and nnp_id == kvk_or_rsin:
+                roles_for_kvk_or_rsin.append(role)
+    return roles_for_kvk_or_rsin
+
+
+def filter_roles_for_vestigingsnummer(
+    roles: list[Rol], vestigingsnummer: str
+) -> list[Rol]:
+    roles_for_vestigingsnummer = []
+    for role in roles:
+        if role.betrokkene_type == RolTypes.vestiging:
+            identifier = role.betrokkene_identificatie.get("vestigings_nummer")
+            if identifier and identifier == vestigingsnummer:
+                roles_for_vestigingsnummer.append(role)
+    return roles_for_vestigingsnummer
+
+
 class ZakenClient(ZgwAPIClient):
     def fetch_cases(
         self,
@@ -93,6 +202,7 @@ class ZakenClient(ZgwAPIClient):
     @cache_result(
         "{self.base_url}:cases:{user_bsn}:{max_requests}:{identificatie}",
         timeout=settings.CACHE_ZGW_ZAKEN_TIMEOUT,
+        tags=["betrokkene:{user_bsn}"],
     )
     def fetch_cases_by_bsn(
         self,
@@ -122,13 +232,11 @@ class ZakenClient(ZgwAPIClient):
                 headers=CRS_HEADERS,
             )
             data = get_json_response(response)
-            all_data = list(
-                pagination_helper(
-                    self,
-                    data,
-                    max_requests=max_requests,
-                    headers=CRS_HEADERS,
-                )
+            all_data = parallel_pagination_helper(
+                self,
+                data,
+                max_requests=max_requests,
+                headers=CRS_HEADERS,
             )
         except (RequestException, ClientError) as e:
             logger.exception("exception while making request", exc_info=e)
@@ -141,6 +249,7 @@ class ZakenClient(ZgwAPIClient):
     @cache_result(
         "{self.base_url}:cases:{kvk_or_rsin}:{vestigingsnummer}:{max_requests}:{zaak_identificatie}",
         timeout=settings.CACHE_ZGW_ZAKEN_TIMEOUT,
+        tags=["betrokkene:{kvk_or_rsin}", "vestiging:{vestigingsnummer}"],
     )
     def fetch_cases_by_kvk_or_rsin(
         self,
@@ -183,13 +292,11 @@ class ZakenClient(ZgwAPIClient):
                 headers=CRS_HEADERS,
             )
             data = get_json_response(response)
-            all_data = list(
-                pagination_helper(
-                    self,
-                    data,
-                    max_requests=max_requests,
-                    headers=CRS_HEADERS,
-                )
+            all_data = parallel_pagination_helper(
+                self,
+                data,
+                max_requests=max_requests,
+                headers=CRS_HEADERS,
             )
         except (RequestException, ClientError) as e:
             logger.exception("exception while making request", exc_info=e)
@@ -202,6 +309,7 @@ class ZakenClient(ZgwAPIClient):
     @cache_result(
         "{self.base_url}:single_case:{case_uuid}",
         timeout=settings.CACHE_ZGW_ZAKEN_TIMEOUT,
+        tags=["zaak:{self.base_url}zaken/{case_uuid}"],
     )
     def fetch_single_case(self, case_uuid: str) -> Zaak | None:
         try:
@@ -266,18 +374,19 @@ class ZakenClient(ZgwAPIClient):
         try:
             response = self.get("statussen", params={"zaak": case_url})
             data = get_json_response(response)
+            all_data = parallel_pagination_helper(self, data)
         except (RequestException, ClientError) as e:
             logger.exception("exception while making request", exc_info=e)
             return []
 
-        # TODO use pagination_helper?
-        statuses = factory(Status, data["results"])
+        statuses = factory(Status, all_data)
 
         return statuses
 
     @cache_result(
         "{self.base_url}:status_history:{case_url}",
         timeout=settings.CACHE_ZGW_ZAKEN_TIMEOUT,
+        tags=["zaak:{case_url}"],
     )
     def fetch_status_history(self, case_url: str) -> list[Status]:
         return self.fetch_status_history_no_cache(case_url)
@@ -298,6 +407,7 @@ class ZakenClient(ZgwAPIClient):
     @cache_result(
         "{self.base_url}:case_roles:{case_url}:{role_desc_generic}",
         timeout=settings.CACHE_ZGW_ZAKEN_TIMEOUT,
+        tags=["zaak:{case_url}"],
     )
     def fetch_case_roles(
         self, case_url: str, role_desc_generic: str | None = None
@@ -315,7 +425,7 @@ class ZakenClient(ZgwAPIClient):
                 params=params,
             )
             data = get_json_response(response)
-            all_data = list(pagination_helper(self, data))
+            all_data = parallel_pagination_helper(self, data)
         except (RequestException, ClientError) as e:
             logger.exception("exception while making request", exc_info=e)
             return []
@@ -336,18 +446,7 @@ class ZakenClient(ZgwAPIClient):
 
         see Taiga #948
         """
-        case_roles = self.fetch_case_roles(case_url)
-        if not case_roles:
-            return []
-
-        bsn_roles = []
-        for role in case_roles:
-            if role.betrokkene_type == RolTypes.natuurlijk_persoon:
-                inp_bsn = role.betrokkene_identificatie.get("inp_bsn")
-                if inp_bsn and inp_bsn == bsn:
-                    bsn_roles.append(role)
-
-        return bsn_roles
+        return filter_roles_for_bsn(self.fetch_case_roles(case_url), bsn)
 
     # implicitly cached because it uses fetch_case_roles()
     def fetch_roles_for_case_and_kvk_or_rsin(
@@ -359,18 +458,9 @@ class ZakenClient(ZgwAPIClient):
 
         see Taiga #948
         """
-        case_roles = self.fetch_case_roles(case_url)
-        if not case_roles:
-            return []
-
-        roles = []
-        for role in case_roles:
-            if role.betrokkene_type == RolTypes.niet_natuurlijk_persoon:
-                nnp_id = role.betrokkene_identificatie.get("inn_nnp_id")
-                if nnp_id and nnp_id == kvk_or_rsin:
-                    roles.append(role)
-
-        return roles
+        return filter_roles_for_kvk_or_rsin(
+            self.fetch_case_roles(case_url), kvk_or_rsin
+        )
 
     # implicitly cached because it uses fetch_case_roles()
     def fetch_roles_for_case_and_vestigingsnummer(
@@ -382,18 +472,9 @@ class ZakenClient(ZgwAPIClient):
 
         see Taiga #948
         """
-        case_roles = self.fetch_case_roles(case_url)
-        if not case_roles:
-            return []
-
-        roles = []
-        for role in case_roles:
-            if role.betrokkene_type == RolTypes.vestiging:
-                identifier = role.betrokkene_identificatie.get("vestigings_nummer")
-                if identifier and identifier == vestigingsnummer:
-                    roles.append(role)
-
-        return roles
+        return filter_roles_for_vestigingsnummer(
+            self.fetch_case_roles(case_url), vestigingsnummer
+        )
 
     # not cached because currently only used in info-object download view
     def fetch_case_information_objects_for_case_and_info(
@@ -458,7 +539,7 @@ class CatalogiClient(ZgwAPIClient):
                 params={"zaaktype": case_type_url},
             )
             data = get_json_response(response)
-            all_data = list(pagination_helper(self, data))
+            all_data = parallel_pagination_helper(self, data)
         except (RequestException, ClientError) as e:
             logger.exception("exception while making request", exc_info=e)
             return []
@@ -476,7 +557,7 @@ class CatalogiClient(ZgwAPIClient):
                 params={"zaaktype": case_type_url},
             )
             data = get_json_response(response)
-            all_data = list(pagination_helper(self, data))
+            all_data = parallel_pagination_helper(self, data)
         except (RequestException, ClientError) as e:
             logger.exception("exception while making request", exc_info=e)
             return []
@@ -487,7 +568,7 @@ class CatalogiClient(ZgwAPIClient):
 
     @cache_result(
         "{self.base_url}:status_type:{status_type_url}",
-        timeout=settings.CACHE_ZGW_CATALOGI_TIMEOUT,
+        **CATALOGI_CACHE_OPTIONS,
     )
     def fetch_single_status_type(self, status_type_url: str) -> StatusType | None:
         try:
@@ -503,7 +584,7 @@ class CatalogiClient(ZgwAPIClient):
 
     @cache_result(
         "{self.base_url}:resultaat_type:{resultaat_type_url}",
-        timeout=settings.CACHE_ZGW_CATALOGI_TIMEOUT,
+        **CATALOGI_CACHE_OPTIONS,
     )
     def fetch_single_resultaat_type(
         self, resultaat_type_url: str
@@ -523,7 +604,7 @@ class CatalogiClient(ZgwAPIClient):
         try:
             response = self.get("zaaktypen")
             data = get_json_response(response)
-            all_data = list(pagination_helper(self, data))
+            all_data = parallel_pagination_helper(self, data)
         except (RequestException, ClientError) as e:
             logger.exception("exception while making request", exc_info=e)
             return []
@@ -546,7 +627,7 @@ class CatalogiClient(ZgwAPIClient):
 
             response = self.get("zaaktypen", params=params)
             data = get_json_response(response)
-            all_data = list(pagination_helper(self, data))
+            all_data = parallel_pagination_helper(self, data)
         except (RequestException, ClientError) as e:
             logger.exception("exception while making request", exc_info=e)
             return []
@@ -557,7 +638,7 @@ class CatalogiClient(ZgwAPIClient):
 
     @cache_result(
         "{self.base_url}:case_type:{case_type_url}",
-        timeout=settings.CACHE_ZGW_CATALOGI_TIMEOUT,
+        **CATALOGI_CACHE_OPTIONS,
     )
     def fetch_single_case_type(self, case_type_url: str) -> ZaakType | None:
         try:
@@ -578,7 +659,7 @@ class CatalogiClient(ZgwAPIClient):
         try:
             response = self.get("catalogussen")
             data = get_json_response(response)
-            all_data = list(pagination_helper(self, data))
+            all_data = parallel_pagination_helper(self, data)
         except (RequestException, ClientError) as e:
             logger.exception("exception while making request", exc_info=e)
             return []
@@ -587,6 +668,21 @@ class CatalogiClient(ZgwAPIClient):
 
         return catalogs
 
+    # not cached because only used by tools,
+    # and because caching (stale) listings can break lookups
+    def fetch_information_object_types_no_cache(self) -> list[InformatieObjectType]:
+        try:
+            response = self.get("informatieobjecttypen")
+            data = get_json_response(response)
+            all_data = parallel_pagination_helper(self, data)
+        except (RequestException, ClientError) as e:
+            logger.exception("exception while making request", exc_info=e)
+            return []
+
+        information_object_types = factory(InformatieObjectType, all_data)
+
+        return information_object_types
+
     @cache_result(
         "{self.base_url}:information_object_type:{information_object_type_url}",
         timeout=settings.CACHE_ZGW_CATALOGI_TIMEOUT,
@@ -628,12 +724,28 @@ class DocumentenClient(ZgwAPIClient):
 
         return info_object
 
-    def download_document(self, url: str) -> Response | None:
+    def download_document(
+        self, url: str, byte_range: tuple[int, int] | None = None
+    ) -> Response | None:
+        """
+        Start the download of the document content
+
+        The content is not read: iterate over the response in chunks (see
+        `iter_document_content()`) and close it.
+
+        :param byte_range: only download this (inclusive) range of bytes. The server
+        can ignore this, so check the status of the response.
+        """
+        headers = {}
+        if byte_range:
+            headers["Range"] = "bytes={}-{}".format(*byte_range)
+
+        response = self.get(url, headers=headers, stream=True)
         try:
-            response = self.get(url)
             response.raise_for_status()
         except HTTPError as e:
             logger.exception("exception while making request", exc_info=e)
+            response.close()
         else:
             return response
 
@@ -650,7 +762,7 @@ class DocumentenClient(ZgwAPIClient):
             "creatiedatum": date.today().strftime("%Y-%m-%d"),
             "titel": title,
             "auteur": user.get_full_name(),
-            "inhoud": base64.b64encode(file.read()).decode("utf-8"),
+            "inhoud": None,
             "bestandsomvang": file.size,
             "bestandsnaam": file.name,
             "status": "definitief",
@@ -659,6 +771,12 @@ class DocumentenClient(ZgwAPIClient):
             "informatieobjecttype": informatieobjecttype_url,
         }
 
+        threshold = settings.ZGW_DOCUMENT_UPLOAD_IN_PARTS_THRESHOLD
+        if threshold and file.size > threshold:
+            return self._upload_document_in_parts(document_body, file)
+
+        document_body["inhoud"] = base64.b64encode(file.read()).decode("utf-8")
+
         try:
             response = self.post("enkelvoudiginformatieobjecten", json=document_body)
             data = get_json_response(response)
@@ -668,6 +786,64 @@ class DocumentenClient(ZgwAPIClient):
 
         return data
 
+    def _upload_document_in_parts(
+        self, document_body: dict, file: InMemoryUploadedFile
+    ) -> dict | None:
+        """
+        Upload a document with the bestandsdelen of the Documenten API (1.1+)
+
+        The document is created without content, which returns the parts (and a lock
+        on the document). The parts are uploaded one by one, read from the (temporary)
+        file while they are sent, and the document is unlocked when it is complete.
+        An incomplete document is unlocked and deleted again.
+        """
+        data = None
+        try:
+            response = self.post("enkelvoudiginformatieobjecten", json=document_body)
+            data = get_json_response(response)
+
+            offset = 0
+            for part in sorted(data["bestandsdelen"], key=lambda p: p["volgnummer"]):
+                body = MultipartFileStream(
+                    {"lock": data["lock"]},
+                    "inhoud",
+                    file,
+                    filename=file.name,
+                    offset=offset,
+                    length=part["omvang"],
+                )
+                response = self.put(
+                    part["url"],
+                    data=body,
+                    headers={"Content-Type": body.content_type},
+                )
+                get_json_response(response)
+                offset += part["omvang"]
+
+            response = self.post(f"{data['url']}/unlock", json={"lock": data["lock"]})
+            get_json_response(response)
+        except Exception as e:
+            # including the errors of reading the file while it is sent
+            logger.exception("exception while uploading document in parts", exc_info=e)
+            if data:
+                self._discard_document(data)
+            return
+
+        return data
+
+    def _discard_document(self, data: dict):
+        try:
+            response = self.post(f"{data['url']}/unlock", json={"lock": data["lock"]})
+            response.raise_for_status()
+            response = self.delete(data["url"])
+            response.raise_for_status()
+        except RequestException as e:
+            logger.exception(
+                "exception while discarding incomplete document %s",
+                data["url"],
+                exc_info=e,
+            )
+
 
 class FormClient(ZgwAPIClient):
     def fetch_open_submissions(
@@ -873,7 +1049,7 @@ ZgwClientFactoryReturn: TypeAlias = (
 )
 
 
-def build_zgw_client_from_service(service: Service) -> ZgwClientFactoryReturn:
+def build_zgw_client_from_service(service: Service, **kwargs) -> ZgwClientFactoryReturn:
     services_to_client_mapping: Mapping[str, Type[ZgwClientFactoryReturn]] = {
         APITypes.zrc: ZakenClient,
         APITypes.ztc: CatalogiClient,
@@ -888,10 +1064,81 @@ def build_zgw_client_from_service(service: Service) -> ZgwClientFactoryReturn:
             f"No client defined for API type {service.api_type} on service {service}"
         )
 
-    client = build_client(service, client_factory=client_class, configured_from=service)
+    client = build_client(
+        service, client_factory=client_class, configured_from=service, **kwargs
+    )
     return client
 
 
+def get_service_version(service: Service) -> str:
+    """
+    Fingerprint the configuration of `service`, which changes when the service is edited
+    """
+    values = [
+        (field.attname, getattr(service, field.attname))
+        for field in service._meta.concrete_fields
+    ]
+    return hashlib.md5(repr(values).encode(), usedforsecurity=False).hexdigest()
+
+
+class ZgwClientPool:
+    """
+    Long-lived ZGW clients, keyed by Service and configuration version.
+
+    Building a client for every API call means every request opens a new connection
+    (including the TLS handshake). Pooled clients keep a pool of at most
+    `settings.ZGW_CLIENT_POOL_SIZES[service.api_type]` connections alive, and can be
+    shared between threads.
+
+    A client is replaced when its Service is edited, and dropped when the Service or one
+    of the certificates is changed (see `.signals`). Clients are also replaced after
+    `settings.ZGW_CLIENT_POOL_MAX_AGE` seconds, as the JWT for ZGW auth is generated
+    once per client and expires. Replaced and dropped clients are closed once their
+    requests in flight are finished (see `ZgwAPIClient.retire()`).
+    """
+
+    def __init__(self):
+        self._clients: dict[tuple[int, str], tuple[ZgwClientFactoryReturn, float]] = {}
+        self._lock = threading.Lock()
+
+    def get_client(self, service: Service) -> ZgwClientFactoryReturn:
+        if not service or not service.pk:
+            # unsaved or missing service: nothing to key the client by
+            return build_zgw_client_from_service(service)
+
+        key = (service.pk, get_service_version(service))
+        now = time.monotonic()
+        with self._lock:
+            client, expires_at = self._clients.get(key, (None, 0.0))
+            if client and now < expires_at:
+                return client
+
+            # drop the clients for expired or older versions of the service
+            self._close_clients(lambda k: k[0] == service.pk)
+
+            pool_maxsize = settings.ZGW_CLIENT_POOL_SIZES.get(
+                service.api_type, settings.ZGW_CLIENT_POOL_SIZE
+            )
+            client = build_zgw_client_from_service(service, pool_maxsize=pool_maxsize)
+            self._clients[key] = (client, now + settings.ZGW_CLIENT_POOL_MAX_AGE)
+            return client
+
+    def invalidate(self, service_pk: int | None = None):
+        """
+        Close the clients for a service, or for all services if no pk is given
+        """
+        with self._lock:
+            self._close_clients(lambda k: service_pk is None or k[0] == service_pk)
+
+    def _close_clients(self, predicate):
+        for key in [key for key in self._clients if predicate(key)]:
+            client, _ = self._clients.pop(key)
+            client.retire()
+
+
+zgw_client_pool = ZgwClientPool()
+
+
 def _build_all_zgw_clients_for_type(
     type_: ZgwClientType,
 ) -> list[ZakenClient | CatalogiClient | DocumentenClient | FormClient]:
@@ -904,7 +1151,7 @@ def _build_all_zgw_clients_for_type(
     }
 
     return [
-        build_zgw_client_from_service(
+        zgw_client_pool.get_client(
             getattr(api_group, services_to_client_mapping[type_])
         )
         for api_group in config.api_groups.all()
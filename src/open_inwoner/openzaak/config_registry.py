@@ -0,0 +1,274 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import connection
+
+from open_inwoner.utils.local_cache import bump_shared_version, get_shared_version
+
+from .api_models import ZaakType
+from .models import (
+    ZaakTypeConfig,
+    ZaakTypeInformatieObjectTypeConfig,
+    ZaakTypeResultaatTypeConfig,
+    ZaakTypeStatusTypeConfig,
+)
+
+logger = logging.getLogger(__name__)
+
+VERSION_CACHE_KEY = "openzaak:zgw_config_registry:version"
+
+
+def _catalogus_url(case_type: ZaakType) -> str | None:
+    # support both url and resolved dataclass
+    if case_type.catalogus is None or isinstance(case_type.catalogus, str):
+        return case_type.catalogus
+    return case_type.catalogus.url
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    version: str
+    zaaktype_configs: dict[tuple[str | None, str], ZaakTypeConfig]
+    statustype_configs: dict[tuple[int, str], ZaakTypeStatusTypeConfig]
+    statustype_configs_by_identificatie: dict[str, list[ZaakTypeStatusTypeConfig]]
+    resultaattype_configs_by_identificatie: dict[str, list[ZaakTypeResultaatTypeConfig]]
+    informatieobjecttype_configs: dict[int, list[ZaakTypeInformatieObjectTypeConfig]]
+
+    @classmethod
+    def load(cls, version: str) -> "_Snapshot":
+        zaaktype_configs_by_id = {
+            ztc.pk: ztc
+            for ztc in ZaakTypeConfig.objects.select_related(
+                "catalogus", "catalogus__service"
+            )
+        }
+
+        def _related(queryset):
+            # share the ZaakTypeConfig instances instead of querying them per config
+            for config in queryset.order_by("pk"):
+                config.zaaktype_config = zaaktype_configs_by_id[
+                    config.zaaktype_config_id
+                ]
+                yield config
+
+        statustype_configs = {}
+        statustype_configs_by_identificatie = defaultdict(list)
+        for config in _related(ZaakTypeStatusTypeConfig.objects.all()):
+            statustype_configs[
+                (config.zaaktype_config_id, config.statustype_url)
+            ] = config
+            statustype_configs_by_identificatie[
+                config.zaaktype_config.identificatie
+            ].append(config)
+
+        resultaattype_configs_by_identificatie = defaultdict(list)
+        for config in _related(ZaakTypeResultaatTypeConfig.objects.all()):
+            resultaattype_configs_by_identificatie[
+                config.zaaktype_config.identificatie
+            ].append(config)
+
+        informatieobjecttype_configs = defaultdict(list)
+        for config in _related(ZaakTypeInformatieObjectTypeConfig.objects.all()):
+            informatieobjecttype_configs[config.zaaktype_config_id].append(config)
+
+        return cls(
+            version=version,
+            zaaktype_configs={
+                (
+                    ztc.catalogus.url if ztc.catalogus else None,
+                    ztc.identificatie,
+                ): ztc
+                for ztc in zaaktype_configs_by_id.values()
+            },
+            statustype_configs=statustype_configs,
+            statustype_configs_by_identificatie=dict(
+                statustype_configs_by_identificatie
+            ),
+            resultaattype_configs_by_identificatie=dict(
+                resultaattype_configs_by_identificatie
+            ),
+            informatieobjecttype_configs=dict(informatieobjecttype_configs),
+        )
+
+
+class ZGWConfigRegistry:
+    """
+    Process-local index of the ZaakType(-Status/-Resultaat/-InformatieObjectType)Config
+    tables, which only change by `zgw_import_data` or admin edits.
+
+    The registry is versioned by a key in the shared cache, which is bumped whenever one
+    of the models changes (see `.signals`). Other processes pick up the new version after
+    at most `ZGW_CONFIG_REGISTRY_VERSION_CHECK_INTERVAL` seconds.
+
+    Inside a transaction the registry is bypassed and the database is queried directly,
+    so uncommitted changes are never shared with other threads.
+
+    The returned model instances are shared and should not be modified.
+    """
+
+    def __init__(self, cache_alias: str = "default"):
+        self.cache_alias = cache_alias
+        self._snapshot: _Snapshot | None = None
+        self._next_version_check = 0.0
+        self._lock = threading.Lock()
+
+    def _get_snapshot(self) -> _Snapshot | None:
+        if connection.in_atomic_block:
+            return None
+
+        with self._lock:
+            now = time.monotonic()
+            if self._snapshot is not None and now < self._next_version_check:
+                return self._snapshot
+
+            version = get_shared_version(VERSION_CACHE_KEY, self.cache_alias)
+            if self._snapshot is None or self._snapshot.version != version:
+                logger.debug("Loading ZGW config registry version %s", version)
+                self._snapshot = _Snapshot.load(version)
+
+            self._next_version_check = (
+                now + settings.ZGW_CONFIG_REGISTRY_VERSION_CHECK_INTERVAL
+            )
+            return self._snapshot
+
+    def invalidate(self):
+        """
+        Drop the local snapshot and bump the shared version for all processes
+        """
+        with self._lock:
+            self._snapshot = None
+        bump_shared_version(VERSION_CACHE_KEY, self.cache_alias)
+
+    def clear(self):
+        """
+        Drop the local snapshot only
+        """
+        with self._lock:
+            self._snapshot = None
+
+    #
+    # lookups
+    #
+
+    def get_zaaktype_config(self, case_type: ZaakType) -> ZaakTypeConfig | None:
+        return self.get_zaaktype_config_from_str(
+            _catalogus_url(case_type), case_type.identificatie
+        )
+
+    def get_zaaktype_config_from_str(
+        self, catalogus_url: str | None, case_type_identificatie: str
+    ) -> ZaakTypeConfig | None:
+        if (snapshot := self._get_snapshot()) is None:
+            return ZaakTypeConfig.objects.filter_from_str(
+                catalogus_url, case_type_identificatie
+            ).first()
+
+        return snapshot.zaaktype_configs.get((catalogus_url, case_type_identificatie))
+
+    def get_statustype_config(
+        self, ztc: ZaakTypeConfig, statustype_url: str
+    ) -> ZaakTypeStatusTypeConfig | None:
+        if (snapshot := self._get_snapshot()) is None:
+            return ZaakTypeStatusTypeConfig.objects.filter(
+                zaaktype_config=ztc, statustype_url=statustype_url
+            ).first()
+
+        return snapshot.statustype_configs.get((ztc.pk, statustype_url))
+
+    def find_statustype_config(
+        self, case_type: ZaakType, statustype_url: str
+    ) -> ZaakTypeStatusTypeConfig | None:
+        return self.find_statustype_config_from_str(
+            _catalogus_url(case_type), case_type.identificatie, statustype_url
+        )
+
+    def find_statustype_config_from_str(
+        self,
+        catalogus_url: str | None,
+        case_type_identificatie: str,
+        statustype_url: str,
+    ) -> ZaakTypeStatusTypeConfig | None:
+        if (snapshot := self._get_snapshot()) is None:
+            return ZaakTypeStatusTypeConfig.objects.find_for_types_from_str(
+                catalogus_url, case_type_identificatie, statustype_url
+            )
+
+        ztc = snapshot.zaaktype_configs.get((catalogus_url, case_type_identificatie))
+        if not ztc:
+            return None
+        return snapshot.statustype_configs.get((ztc.pk, statustype_url))
+
+    def get_statustype_config_mapping(
+        self, case_type_identificatie: str
+    ) -> dict[str, ZaakTypeStatusTypeConfig]:
+        """
+        Map statustype urls to configs for all ZaakTypeConfigs with the identificatie
+        """
+        if (snapshot := self._get_snapshot()) is None:
+            configs = ZaakTypeStatusTypeConfig.objects.filter(
+                zaaktype_config__identificatie=case_type_identificatie
+            )
+        else:
+            configs = snapshot.statustype_configs_by_identificatie.get(
+                case_type_identificatie, []
+            )
+        return {config.statustype_url: config for config in configs}
+
+    def get_resultaattype_config_mapping(
+        self, case_type_identificatie: str
+    ) -> dict[str, ZaakTypeResultaatTypeConfig]:
+        """
+        Map resultaattype urls to configs for all ZaakTypeConfigs with the identificatie
+        """
+        if (snapshot := self._get_snapshot()) is None:
+            configs = ZaakTypeResultaatTypeConfig.objects.filter(
+                zaaktype_config__identificatie=case_type_identificatie
+            )
+        else:
+            configs = snapshot.resultaattype_configs_by_identificatie.get(
+                case_type_identificatie, []
+            )
+        return {config.resultaattype_url: config for config in configs}
+
+    def get_informatieobjecttype_configs(
+        self, case_type: ZaakType
+    ) -> list[ZaakTypeInformatieObjectTypeConfig]:
+        """
+        Equivalent of `ZaakTypeInformatieObjectTypeConfig.objects.filter_case_type()`
+        """
+        if (snapshot := self._get_snapshot()) is None:
+            return list(
+                ZaakTypeInformatieObjectTypeConfig.objects.filter_case_type(case_type)
+            )
+
+        ztc = snapshot.zaaktype_configs.get(
+            (_catalogus_url(case_type), case_type.identificatie)
+        )
+        if not ztc:
+            return []
+
+        case_type_uuid = str(case_type.uuid)
+        return [
+            config
+            for config in snapshot.informatieobjecttype_configs.get(ztc.pk, [])
+            if case_type_uuid in {str(u) for u in config.zaaktype_uuids}
+        ]
+
+    def get_informatieobjecttype_config(
+        self, case_type: ZaakType, info_object_type_url: str
+    ) -> ZaakTypeInformatieObjectTypeConfig | None:
+        return next(
+            (
+                config
+                for config in self.get_informatieobjecttype_configs(case_type)
+                if config.informatieobjecttype_url == info_object_type_url
+            ),
+            None,
+        )
+
+
+zgw_config_registry = ZGWConfigRegistry()
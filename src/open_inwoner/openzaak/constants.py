@@ -7,3 +7,10 @@ class StatusIndicators(models.TextChoices):
     warning = "warning", _("Warning")
     failure = "failure", _("Failure")
     success = "success", _("Success")
+
+
+class ReceivedNotificationStatus(models.TextChoices):
+    pending = "pending", _("Pending")
+    processing = "processing", _("Processing")
+    processed = "processed", _("Processed")
+    failed = "failed", _("Failed")
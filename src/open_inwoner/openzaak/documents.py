@@ -1,7 +1,11 @@
 import logging
+import re
+from collections.abc import Iterator
 
 from django.conf import settings
 
+from requests import Response
+
 from open_inwoner.openzaak.api_models import InformatieObject
 from open_inwoner.openzaak.clients import DocumentenClient
 
@@ -9,12 +13,20 @@ from ..utils.decorators import cache as cache_result
 
 logger = logging.getLogger(__name__)
 
+BYTE_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
 
 @cache_result("information_object_url:{url}", timeout=settings.CACHE_ZGW_ZAKEN_TIMEOUT)
 def fetch_single_information_object_from_url(
-    url: str, api_group
+    url: str, api_group=None, documenten_client: DocumentenClient | None = None
 ) -> InformatieObject | None:
-    return api_group.documenten_client._fetch_single_information_object(url=url)
+    # an existing client can be passed instead of the API group (e.g. from a thread)
+    documenten_client = documenten_client or api_group.documenten_client
+    return documenten_client._fetch_single_information_object(url=url)
 
 
 # not cached because currently only used in info-object download view
@@ -22,3 +34,52 @@ def fetch_single_information_object_uuid(
     uuid: str, documenten_client: DocumentenClient
 ) -> InformatieObject | None:
     return documenten_client._fetch_single_information_object(uuid=uuid)
+
+
+def get_byte_range(
+    range_header: str | None, size: int | None
+) -> tuple[int, int] | None:
+    """
+    Parse a single range of the `Range` header (`bytes=0-99`, `bytes=100-` or
+    `bytes=-100`) into the (inclusive) first and last byte positions
+
+    Invalid and unsupported ranges (like multiple ranges) are ignored, in which case
+    the full content should be returned. `RangeNotSatisfiable` is raised for ranges
+    outside of the content.
+    """
+    if not range_header or not size:
+        return
+
+    if not (match := BYTE_RANGE_RE.match(range_header.strip())):
+        return
+
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return
+        # suffix range: the last N bytes
+        if (length := int(last)) == 0:
+            raise RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+
+    first = int(first)
+    if last and int(last) < first:
+        return
+    if first >= size:
+        raise RangeNotSatisfiable
+
+    last = min(int(last), size - 1) if last else size - 1
+    return first, last
+
+
+def iter_document_content(response: Response) -> Iterator[bytes]:
+    """
+    Pass the content of a (streaming) download through in chunks, so at most
+    `ZGW_DOCUMENT_DOWNLOAD_CHUNK_SIZE` bytes of a download are kept in memory
+    """
+    try:
+        yield from response.iter_content(
+            chunk_size=settings.ZGW_DOCUMENT_DOWNLOAD_CHUNK_SIZE
+        )
+    finally:
+        response.close()
@@ -2,8 +2,10 @@ import logging
 
 from django.core.management.base import BaseCommand
 
+from open_inwoner.openzaak.cache_warmup import warm_up_catalogi_caches
 from open_inwoner.openzaak.models import ZGWApiGroupConfig
 from open_inwoner.openzaak.zgw_imports import (
+    CatalogiSnapshot,
     import_catalog_configs,
     import_zaaktype_configs,
     import_zaaktype_informatieobjecttype_configs,
@@ -17,8 +19,20 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = "Import ZGW catalog data"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--warm-up-caches",
+            action="store_true",
+            help="Warm up the caches for the catalogi data after the import",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Import the configs of all zaaktypen, including the unchanged ones",
+        )
+
     def log_supplement_imports_to_stdout(
-        self, import_func: callable, config_type: str
+        self, import_func: callable, config_type: str, snapshot: CatalogiSnapshot
     ) -> None:
         """
         Convenience function for logging zaaktype config types to stdout
@@ -35,7 +49,7 @@ class Command(BaseCommand):
             BBB - zaaktype-bbb
               info-bbb
         """
-        imported = import_func()
+        imported = import_func(snapshot)
 
         count = sum(len(t[1]) for t in imported)
         self.stdout.write(f"imported {count} new zaaktype-{config_type} configs")
@@ -63,8 +77,11 @@ class Command(BaseCommand):
 
         self.stdout.write("")
 
+        # the zaaktypen are fetched once, for all remaining imports
+        snapshot = CatalogiSnapshot.fetch(incremental=not options["full"])
+
         # zaaktype config
-        imported = import_zaaktype_configs()
+        imported = import_zaaktype_configs(snapshot)
 
         self.stdout.write(f"imported {len(imported)} new zaaktype configs")
         for c in sorted(map(str, imported)):
@@ -74,11 +91,18 @@ class Command(BaseCommand):
 
         # supplemental configs
         self.log_supplement_imports_to_stdout(
-            import_zaaktype_informatieobjecttype_configs, "informatiebjecttype"
+            import_zaaktype_informatieobjecttype_configs,
+            "informatiebjecttype",
+            snapshot,
         )
         self.log_supplement_imports_to_stdout(
-            import_zaaktype_statustype_configs, "statustype"
+            import_zaaktype_statustype_configs, "statustype", snapshot
         )
         self.log_supplement_imports_to_stdout(
-            import_zaaktype_resultaattype_configs, "resultaattype"
+            import_zaaktype_resultaattype_configs, "resultaattype", snapshot
         )
+
+        if options["warm_up_caches"]:
+            report = warm_up_catalogi_caches()
+            for line in report.summary():
+                self.stdout.write(line)
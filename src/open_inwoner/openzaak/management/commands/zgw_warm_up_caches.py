@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from open_inwoner.openzaak.cache_warmup import warm_up_catalogi_caches
+from open_inwoner.openzaak.models import ZGWApiGroupConfig
+
+
+class Command(BaseCommand):
+    help = "Warm up the caches for the ZGW catalogi data"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            help="Max. number of concurrent requests per catalogi service",
+        )
+
+    def handle(self, *args, **options):
+        if ZGWApiGroupConfig.objects.count() == 0:
+            self.stdout.write(
+                "Please define at least one ZGWApiGroupConfig before running this command."
+            )
+            return
+
+        report = warm_up_catalogi_caches(max_workers=options["max_workers"])
+        for line in report.summary():
+            self.stdout.write(line)
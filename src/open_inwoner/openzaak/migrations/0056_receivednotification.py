@@ -0,0 +1,99 @@
+# Generated by Django 4.2.15 on 2026-10-18 12:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("openzaak", "0055_openzaakconfig_zaken_filter_enabled"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReceivedNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kanaal", models.CharField(max_length=100, verbose_name="Kanaal")),
+                (
+                    "resource",
+                    models.CharField(max_length=100, verbose_name="Resource"),
+                ),
+                (
+                    "resource_url",
+                    models.URLField(max_length=1000, verbose_name="Resource URL"),
+                ),
+                (
+                    "hoofd_object",
+                    models.URLField(max_length=1000, verbose_name="Hoofd object"),
+                ),
+                ("actie", models.CharField(max_length=100, verbose_name="Actie")),
+                ("aanmaakdatum", models.DateTimeField(verbose_name="Aanmaakdatum")),
+                (
+                    "kenmerken",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="Kenmerken"
+                    ),
+                ),
+                (
+                    "deduplication_key",
+                    models.CharField(
+                        db_index=True,
+                        max_length=64,
+                        verbose_name="Deduplication key",
+                    ),
+                ),
+                (
+                    "deliveries",
+                    models.PositiveIntegerField(
+                        default=1,
+                        help_text="The number of times this notification was received within the deduplication window.",
+                        verbose_name="Deliveries",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processing", "Processing"),
+                            ("processed", "Processed"),
+                            ("failed", "Failed"),
+                        ],
+                        db_index=True,
+                        default="pending",
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+                ("error", models.TextField(blank=True, verbose_name="Error")),
+                (
+                    "received_on",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="Received on",
+                    ),
+                ),
+                (
+                    "processed_on",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Processed on"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Received notification",
+                "verbose_name_plural": "Received notifications",
+            },
+        ),
+    ]
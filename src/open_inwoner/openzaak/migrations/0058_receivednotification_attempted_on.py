@@ -0,0 +1,23 @@
+# Generated by Django 4.2.15 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("openzaak", "0057_pendingcaseupdateemail"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="receivednotification",
+            name="attempted_on",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the notification was last claimed for processing or queued again.",
+                null=True,
+                verbose_name="Last attempt",
+            ),
+        ),
+    ]
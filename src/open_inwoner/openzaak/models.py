@@ -4,6 +4,7 @@ from datetime import timedelta
 from typing import Protocol, cast
 from urllib.parse import urlparse
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models, transaction
 from django.db.models import UniqueConstraint
 from django.utils import timezone
@@ -26,7 +27,8 @@ from open_inwoner.openzaak.managers import (
     ZaakTypeStatusTypeConfigQuerySet,
 )
 
-from .constants import StatusIndicators
+from .api_models import Notification
+from .constants import ReceivedNotificationStatus, StatusIndicators
 
 logger = logging.getLogger(__name__)
 
@@ -193,9 +195,9 @@ class ZGWApiGroupConfig(models.Model):
     )
 
     def _build_client_from_attr(self, attr: str):
-        from .clients import build_zgw_client_from_service
+        from .clients import zgw_client_pool
 
-        return build_zgw_client_from_service(getattr(self, attr))
+        return zgw_client_pool.get_client(getattr(self, attr))
 
     @property
     def zaken_client(self):
@@ -899,3 +901,106 @@ class UserCaseInfoObjectNotification(UserCaseStatusNotificationBase):
         return UserCaseInfoObjectNotification.objects.has_received_similar_notes_within(
             self.user, self.case_uuid, period, collision_key, not_record_id=self.id
         )
+
+
+class ReceivedNotification(models.Model):
+    """
+    A notification received on the ZGW notifications webhook, to be processed by a
+    Celery task
+    """
+
+    kanaal = models.CharField(_("Kanaal"), max_length=100)
+    resource = models.CharField(_("Resource"), max_length=100)
+    resource_url = models.URLField(_("Resource URL"), max_length=1000)
+    hoofd_object = models.URLField(_("Hoofd object"), max_length=1000)
+    actie = models.CharField(_("Actie"), max_length=100)
+    aanmaakdatum = models.DateTimeField(_("Aanmaakdatum"))
+    kenmerken = models.JSONField(_("Kenmerken"), default=dict, blank=True)
+
+    deduplication_key = models.CharField(
+        _("Deduplication key"), max_length=64, db_index=True
+    )
+    deliveries = models.PositiveIntegerField(
+        _("Deliveries"),
+        default=1,
+        help_text=_(
+            "The number of times this notification was received within the "
+            "deduplication window."
+        ),
+    )
+    status = models.CharField(
+        _("Status"),
+        max_length=20,
+        choices=ReceivedNotificationStatus.choices,
+        default=ReceivedNotificationStatus.pending,
+        db_index=True,
+    )
+    error = models.TextField(_("Error"), blank=True)
+    received_on = models.DateTimeField(
+        _("Received on"), default=timezone.now, db_index=True
+    )
+    processed_on = models.DateTimeField(_("Processed on"), null=True, blank=True)
+    attempted_on = models.DateTimeField(
+        _("Last attempt"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "When the notification was last claimed for processing or queued again."
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("Received notification")
+        verbose_name_plural = _("Received notifications")
+
+    def __str__(self):
+        return f"{self.kanaal} {self.resource} {self.actie} ({self.resource_url})"
+
+    @classmethod
+    def from_notification(cls, notification: Notification) -> "ReceivedNotification":
+        return cls(
+            kanaal=notification.kanaal,
+            resource=notification.resource,
+            resource_url=notification.resource_url,
+            hoofd_object=notification.hoofd_object,
+            actie=notification.actie,
+            aanmaakdatum=notification.aanmaakdatum,
+            kenmerken=notification.kenmerken,
+        )
+
+    def to_notification(self) -> Notification:
+        return Notification(
+            kanaal=self.kanaal,
+            resource=self.resource,
+            resource_url=self.resource_url,
+            hoofd_object=self.hoofd_object,
+            actie=self.actie,
+            aanmaakdatum=self.aanmaakdatum,
+            kenmerken=self.kenmerken,
+        )
+
+
+class PendingCaseUpdateEmail(models.Model):
+    """
+    A case update email for a user, buffered to be sent together with the other updates
+    of the case within `settings.ZGW_NOTIFICATIONS_COALESCE_WINDOW` seconds
+    """
+
+    user = models.ForeignKey(
+        "accounts.User",
+        on_delete=models.CASCADE,
+    )
+    case_uuid = models.UUIDField(
+        verbose_name=_("Zaak UUID"),
+    )
+    template_name = models.CharField(_("Template name"), max_length=255)
+    context = models.JSONField(
+        _("Context"), default=dict, blank=True, encoder=DjangoJSONEncoder
+    )
+    created_on = models.DateTimeField(
+        verbose_name=_("Created on"), default=timezone.now
+    )
+
+    class Meta:
+        verbose_name = _("Pending case update email")
+        verbose_name_plural = _("Pending case update emails")
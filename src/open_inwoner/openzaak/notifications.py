@@ -1,8 +1,17 @@
+import json
 import logging
+import time
 from datetime import date, timedelta
+from functools import partial
+from hashlib import sha256
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Coalesce
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext as _
 
 from mail_editor.helpers import find_template
@@ -18,6 +27,7 @@ from open_inwoner.openzaak.api_models import (
     ZaakType,
 )
 from open_inwoner.openzaak.clients import CatalogiClient, ZakenClient
+from open_inwoner.openzaak.config_registry import zgw_config_registry
 from open_inwoner.openzaak.documents import fetch_single_information_object_from_url
 from open_inwoner.openzaak.models import (
     OpenZaakConfig,
@@ -32,13 +42,24 @@ from open_inwoner.openzaak.utils import (
     is_zaak_visible,
 )
 from open_inwoner.userfeed import hooks
+from open_inwoner.utils.cache_tags import purge_cache_tags
 from open_inwoner.utils.logentry import system_action as log_system_action
 from open_inwoner.utils.url import build_absolute_url
 
-from .models import ZaakTypeStatusTypeConfig, ZGWApiGroupConfig
+from .constants import ReceivedNotificationStatus
+from .models import (
+    PendingCaseUpdateEmail,
+    ReceivedNotification,
+    ZaakTypeStatusTypeConfig,
+    ZGWApiGroupConfig,
+)
 
 logger = logging.getLogger(__name__)
 
+# updates of these resources change the cached data of a case, and the case lists of
+# its betrokkenen
+CACHE_PURGE_RESOURCES = ("zaak", "status", "rol")
+
 
 # TODO: check siteconfig for notification enabled
 def handle_zaken_notification(notification: Notification):
@@ -55,6 +76,14 @@ def handle_zaken_notification(notification: Notification):
     # on the 'zaken' channel the hoofd_object is always the zaak
     case_url = notification.hoofd_object
 
+    purge_caches = notification.resource in CACHE_PURGE_RESOURCES
+    if purge_caches:
+        # the roles are fetched (and cached) again below
+        purge_cache_tags(
+            f"zaak:{case_url}",
+            *_get_betrokkene_tags_from_kenmerken(notification.kenmerken),
+        )
+
     # we're only interested in some updates
     resources = ("status", "zaakinformatieobject")
     r = notification.resource  # short alias for logging
@@ -74,9 +103,13 @@ def handle_zaken_notification(notification: Notification):
         return
 
     zaken_client = api_group.zaken_client
+    roles = zaken_client.fetch_case_roles(case_url)
+
+    if purge_caches:
+        purge_cache_tags(*_get_betrokkene_tags_from_roles(roles))
 
     # check if we have users that need to be informed about this case
-    if not (roles := zaken_client.fetch_case_roles(case_url)):
+    if not roles:
         log_system_action(
             f"ignored {r} notification: cannot retrieve rollen for case {case_url}",
             # NOTE this used to be logging.ERROR, but as this is also our first call
@@ -130,17 +163,155 @@ def handle_zaken_notification(notification: Notification):
         raise NotImplementedError("programmer error in earlier resource filter")
 
 
-def send_case_update_email(
-    user: User,
+def get_notification_deduplication_key(notification: Notification) -> str:
+    data = json.dumps(
+        [notification.resource, notification.resource_url, notification.kenmerken],
+        sort_keys=True,
+    )
+    return sha256(data.encode()).hexdigest()
+
+
+def _get_notification_deduplication_cache_key(key: str) -> str:
+    return f"openzaak:notification:{key}"
+
+
+def receive_zaken_notification(
+    notification: Notification,
+) -> ReceivedNotification | None:
+    """
+    Store the notification and queue it, to be processed by
+    `process_received_notification`
+
+    Returns `None` for a duplicate: an identical notification was received within
+    `settings.ZGW_NOTIFICATIONS_DEDUPLICATION_WINDOW` seconds (e.g. a redelivery),
+    which is only counted as another delivery of the earlier notification.
+    """
+    key = get_notification_deduplication_key(notification)
+    window = settings.ZGW_NOTIFICATIONS_DEDUPLICATION_WINDOW
+
+    # cache.add() is atomic, so concurrent deliveries can't both be stored
+    if not cache.add(
+        _get_notification_deduplication_cache_key(key), True, timeout=window
+    ):
+        ReceivedNotification.objects.filter(
+            deduplication_key=key,
+            received_on__gte=timezone.now() - timedelta(seconds=window),
+        ).update(deliveries=F("deliveries") + 1)
+        logger.info(
+            "Ignored duplicate %s notification for %s",
+            notification.resource,
+            notification.resource_url,
+        )
+        return None
+
+    received = ReceivedNotification.from_notification(notification)
+    received.deduplication_key = key
+    try:
+        received.save()
+    except Exception:
+        _forget_received_notification(received)
+        raise
+
+    transaction.on_commit(partial(_queue_received_notification, received))
+    return received
+
+
+def _forget_received_notification(received: ReceivedNotification):
+    # the webhook responds with an error, so the sender redelivers the notification,
+    # which must not be ignored as a duplicate
+    cache.delete(_get_notification_deduplication_cache_key(received.deduplication_key))
+    if received.pk:
+        received.delete()
+
+
+def _queue_received_notification(received: ReceivedNotification):
+    # circular import
+    from .tasks import process_zaken_notification
+
+    try:
+        process_zaken_notification.delay(received.pk)
+    except Exception:
+        _forget_received_notification(received)
+        raise
+
+
+def process_received_notification(received_id: int):
+    # claim the notification, so it is processed once even if the task is delivered
+    # more than once
+    claimed = ReceivedNotification.objects.filter(
+        pk=received_id,
+        status__in=[
+            ReceivedNotificationStatus.pending,
+            ReceivedNotificationStatus.failed,
+        ],
+    ).update(status=ReceivedNotificationStatus.processing, attempted_on=timezone.now())
+    if not claimed:
+        return
+
+    received = ReceivedNotification.objects.get(pk=received_id)
+    start = time.perf_counter()
+    try:
+        handle_zaken_notification(received.to_notification())
+    except Exception as e:
+        log_system_action(
+            f"error handling notification: {e}", log_level=logging.ERROR, exc_info=e
+        )
+        received.status = ReceivedNotificationStatus.failed
+        received.error = str(e)
+    else:
+        received.status = ReceivedNotificationStatus.processed
+        received.error = ""
+
+    received.processed_on = timezone.now()
+    received.save(update_fields=["status", "error", "processed_on"])
+
+    logger.info(
+        "Processed %s notification %s in %.3fs, %.1fs after receiving it",
+        received.resource,
+        received.pk,
+        time.perf_counter() - start,
+        (received.processed_on - received.received_on).total_seconds(),
+    )
+
+
+def claim_stale_received_notifications() -> list[int]:
+    """
+    Return the ids of the notifications that should be queued again, because their
+    processing did not start or finish within `settings.ZGW_NOTIFICATIONS_STALE_TIMEOUT`
+    seconds (e.g. the task was lost, or the worker was killed while processing it)
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=settings.ZGW_NOTIFICATIONS_STALE_TIMEOUT)
+
+    with transaction.atomic():
+        stale = list(
+            ReceivedNotification.objects.select_for_update(skip_locked=True)
+            .alias(last_attempt=Coalesce("attempted_on", "received_on"))
+            .filter(
+                status__in=[
+                    ReceivedNotificationStatus.pending,
+                    ReceivedNotificationStatus.processing,
+                ],
+                last_attempt__lt=stale_before,
+            )
+            .values_list("pk", flat=True)
+        )
+        # the next attempt is only reclaimed after another timeout
+        ReceivedNotification.objects.filter(pk__in=stale).update(
+            status=ReceivedNotificationStatus.pending, attempted_on=now
+        )
+
+    if stale:
+        logger.warning("Queueing %s stale notifications again", len(stale))
+    return stale
+
+
+def get_case_update_email_context(
     case: Zaak,
-    template_name: str,
     api_group: ZGWApiGroupConfig,
     status: Status | None = None,
     extra_context: dict = None,
-):
-    """
-    send the actual mail
-    """
+) -> dict:
     case_detail_url = build_absolute_url(
         reverse(
             "cases:case_detail",
@@ -150,7 +321,6 @@ def send_case_update_email(
 
     config = OpenZaakConfig.get_solo()
 
-    template = find_template(template_name)
     context = {
         "identification": case.identification,
         "type_description": case.zaaktype.omschrijving,
@@ -167,8 +337,197 @@ def send_case_update_email(
         )
     if extra_context:
         context.update(extra_context)
+    return context
+
+
+def send_case_update_email(
+    user: User,
+    case: Zaak,
+    template_name: str,
+    api_group: ZGWApiGroupConfig,
+    status: Status | None = None,
+    extra_context: dict = None,
+):
+    """
+    send the actual mail
+    """
+    context = get_case_update_email_context(
+        case, api_group, status=status, extra_context=extra_context
+    )
+    template = find_template(template_name)
+    template.send_email([user.email], context)
+
+
+def queue_case_update_email(
+    user: User,
+    case: Zaak,
+    template_name: str,
+    api_group: ZGWApiGroupConfig,
+    **kwargs,
+):
+    """
+    Buffer the case update email, to be sent together with the other updates of the
+    case within `settings.ZGW_NOTIFICATIONS_COALESCE_WINDOW` seconds
+
+    The keyword arguments are those of `send_case_update_email`.
+    """
+    if not (window := settings.ZGW_NOTIFICATIONS_COALESCE_WINDOW):
+        send_case_update_email(user, case, template_name, api_group=api_group, **kwargs)
+        return
+
+    PendingCaseUpdateEmail.objects.create(
+        user=user,
+        case_uuid=case.uuid,
+        template_name=template_name,
+        context=get_case_update_email_context(case, api_group, **kwargs),
+    )
+
+    def schedule_emails():
+        # circular import
+        from .tasks import send_case_update_emails
+
+        # only the first update of the window schedules the task (after it is
+        # committed, so the task cannot miss it)
+        key = _get_case_update_emails_cache_key(user.pk, case.uuid)
+        if cache.add(key, True, timeout=2 * window):
+            send_case_update_emails.apply_async(
+                (user.pk, str(case.uuid)), countdown=window
+            )
+
+    transaction.on_commit(schedule_emails)
+
+
+def _get_case_update_emails_cache_key(user_id: int, case_uuid) -> str:
+    return f"openzaak:case_update_emails:{user_id}:{case_uuid}"
+
+
+def _load_case_update_email_context(context: dict) -> dict:
+    # the dates are serialized in the buffer
+    return {
+        **context,
+        **{
+            key: date.fromisoformat(context[key])
+            for key in ("start_date", "end_date")
+            if context.get(key)
+        },
+    }
+
+
+def get_stale_pending_case_update_emails() -> list[tuple[int, str]]:
+    """
+    Return the (user id, case UUID) of the buffered case update emails that should
+    have been sent already, because the task scheduled to send them was lost (e.g. in
+    a worker restart before its countdown expired)
+    """
+    stale_before = timezone.now() - timedelta(
+        seconds=2 * settings.ZGW_NOTIFICATIONS_COALESCE_WINDOW
+    )
+    return [
+        (user_id, str(case_uuid))
+        for user_id, case_uuid in PendingCaseUpdateEmail.objects.filter(
+            created_on__lt=stale_before
+        )
+        .values_list("user_id", "case_uuid")
+        .distinct()
+    ]
+
+
+def send_pending_case_update_emails(user_id: int, case_uuid: str):
+    """
+    Send the buffered case update emails of the user for the case, as a single digest
+    email if there was more than one update
+    """
+    # updates buffered from now on are sent by a new task
+    cache.delete(_get_case_update_emails_cache_key(user_id, case_uuid))
+
+    with transaction.atomic():
+        pending = list(
+            PendingCaseUpdateEmail.objects.select_for_update()
+            .filter(user_id=user_id, case_uuid=case_uuid)
+            .select_related("user")
+            .order_by("created_on", "pk")
+        )
+        PendingCaseUpdateEmail.objects.filter(pk__in=[p.pk for p in pending]).delete()
+
+    if not pending:
+        return
+
+    user = pending[0].user
+    if len(pending) == 1:
+        template = find_template(pending[0].template_name)
+        template.send_email(
+            [user.email], _load_case_update_email_context(pending[0].context)
+        )
+        return
+
+    context = _load_case_update_email_context(pending[-1].context)
+    context.pop("status_description", None)
+    context.update(
+        {
+            "status_descriptions": [
+                p.context["status_description"]
+                for p in pending
+                if "status_description" in p.context
+            ],
+            "document_count": sum(
+                p.template_name == "case_document_notification" for p in pending
+            ),
+            "action_required": any(
+                p.template_name == "case_status_notification_action_required"
+                for p in pending
+            ),
+        }
+    )
+    template = find_template("case_update_digest")
     template.send_email([user.email], context)
 
+    log_system_action(
+        f"send digest of {len(pending)} case update emails for user '{user}' "
+        f"case {case_uuid}",
+        log_level=logging.INFO,
+    )
+
+
+def _get_betrokkene_tags(betrokkene_type: str | None, identification: dict) -> set[str]:
+    """
+    Return the cache tags of the case lists of a betrokkene: by BSN, by KvK number or
+    RSIN, and by vestigingsnummer
+    """
+    values = set()
+    if betrokkene_type == RolTypes.natuurlijk_persoon:
+        values.add(("betrokkene", identification.get("inp_bsn")))
+    elif betrokkene_type == RolTypes.niet_natuurlijk_persoon:
+        values.add(("betrokkene", identification.get("inn_nnp_id")))
+        values.add(("betrokkene", identification.get("kvk_nummer")))
+    elif betrokkene_type == RolTypes.vestiging:
+        values.add(("vestiging", identification.get("vestigings_nummer")))
+        values.add(("betrokkene", identification.get("kvk_nummer")))
+
+    return {f"{kind}:{value}" for kind, value in values if value}
+
+
+def _get_betrokkene_tags_from_roles(roles: list[Rol]) -> set[str]:
+    tags = set()
+    for role in roles:
+        tags |= _get_betrokkene_tags(
+            role.betrokkene_type, role.betrokkene_identificatie
+        )
+    return tags
+
+
+def _get_betrokkene_tags_from_kenmerken(kenmerken: dict) -> set[str]:
+    """
+    Return the cache tags of the betrokkene of a rol notification, if the Zaken API
+    includes it in the kenmerken
+
+    The roles are not retrieved for this: a rol (or zaak) notification without the
+    betrokkene leaves the case lists to expire (`settings.CACHE_ZGW_ZAKEN_TIMEOUT`).
+    """
+    return _get_betrokkene_tags(
+        kenmerken.get("betrokkene_type"),
+        kenmerken.get("betrokkene_identificatie") or {},
+    )
+
 
 def _wrap_join(iter, glue="") -> str:
     parts = list(sorted(f"'{v}'" for v in iter))
@@ -301,7 +660,7 @@ def _handle_zaakinformatieobject_update(
         )
         return
 
-    send_case_update_email(user, case, template_name, api_group=api_group)
+    queue_case_update_email(user, case, template_name, api_group=api_group)
     note.mark_sent()
 
     log_system_action(
@@ -449,11 +808,8 @@ def _check_statustype_config(
     resource = notification.resource
     statustype_url = case.status.statustype
 
-    try:
-        statustype_config = ZaakTypeStatusTypeConfig.objects.get(
-            zaaktype_config=ztc, statustype_url=statustype_url
-        )
-    except ZaakTypeStatusTypeConfig.DoesNotExist:
+    statustype_config = zgw_config_registry.get_statustype_config(ztc, statustype_url)
+    if not statustype_config:
         log_system_action(
             "ignored {resource} notification: ZaakTypeStatusTypeConfig could not be found for statustype {url}",
             resource=resource,
@@ -594,7 +950,7 @@ def _handle_status_update(
         )
         return
 
-    send_case_update_email(
+    queue_case_update_email(
         user, case, template_name, api_group=api_group, status=status
     )
     note.mark_sent()
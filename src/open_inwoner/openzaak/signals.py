@@ -0,0 +1,54 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from simple_certmanager.models import Certificate
+from zgw_consumers.models import Service
+
+from .clients import zgw_client_pool
+from .config_registry import zgw_config_registry
+from .models import (
+    CatalogusConfig,
+    ZaakTypeConfig,
+    ZaakTypeInformatieObjectTypeConfig,
+    ZaakTypeResultaatTypeConfig,
+    ZaakTypeStatusTypeConfig,
+)
+
+REGISTRY_MODELS = (
+    CatalogusConfig,
+    ZaakTypeConfig,
+    ZaakTypeInformatieObjectTypeConfig,
+    ZaakTypeResultaatTypeConfig,
+    ZaakTypeStatusTypeConfig,
+)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_zgw_config_registry(sender, **kwargs):
+    if sender not in REGISTRY_MODELS:
+        return
+
+    # wait for the commit, otherwise other processes could reload the old data
+    transaction.on_commit(zgw_config_registry.invalidate)
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+def invalidate_zgw_client_pool_for_service(sender, instance, **kwargs):
+    zgw_client_pool.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Certificate)
+@receiver(post_delete, sender=Certificate)
+def invalidate_zgw_client_pool_for_certificate(sender, **kwargs):
+    # the certificate files are not part of the service version
+    zgw_client_pool.invalidate()
+
+
+@receiver(post_migrate)
+def clear_zgw_config_registry(**kwargs):
+    # tables can be flushed without model signals (e.g. between tests)
+    zgw_config_registry.clear()
+    zgw_client_pool.invalidate()
@@ -1,10 +1,21 @@
 import io
 import logging
+from datetime import timedelta
 
+from django.conf import settings
 from django.core.management import call_command
+from django.utils import timezone
 
 from open_inwoner.celery import app
 
+from .models import ReceivedNotification
+from .notifications import (
+    claim_stale_received_notifications,
+    get_stale_pending_case_update_emails,
+    process_received_notification,
+    send_pending_case_update_emails,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,8 +25,53 @@ def import_zgw_data():
 
     out = io.StringIO()
 
-    call_command("zgw_import_data", stdout=out)
+    call_command("zgw_import_data", warm_up_caches=True, stdout=out)
 
     logger.info("finished import_zgw_data() task")
 
     return out.getvalue()
+
+
+@app.task
+def warm_up_zgw_caches():
+    logger.info("starting warm_up_zgw_caches() task")
+
+    out = io.StringIO()
+
+    call_command("zgw_warm_up_caches", stdout=out)
+
+    logger.info("finished warm_up_zgw_caches() task")
+
+    return out.getvalue()
+
+
+@app.task
+def process_zaken_notification(received_id: int):
+    process_received_notification(received_id)
+
+
+@app.task
+def requeue_stale_zaken_notifications():
+    for received_id in claim_stale_received_notifications():
+        process_zaken_notification.delay(received_id)
+
+
+@app.task
+def send_case_update_emails(user_id: int, case_uuid: str):
+    send_pending_case_update_emails(user_id, case_uuid)
+
+
+@app.task
+def send_stale_case_update_emails():
+    for user_id, case_uuid in get_stale_pending_case_update_emails():
+        send_pending_case_update_emails(user_id, case_uuid)
+
+
+@app.task
+def delete_old_received_notifications():
+    deleted, _ = ReceivedNotification.objects.filter(
+        received_on__lt=timezone.now()
+        - timedelta(days=settings.ZGW_NOTIFICATIONS_RETENTION_DAYS)
+    ).delete()
+
+    logger.info("deleted %s received notifications", deleted)
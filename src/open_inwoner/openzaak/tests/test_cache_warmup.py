@@ -0,0 +1,137 @@
+import inspect
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+import requests_mock
+
+from open_inwoner.utils.test import ClearCachesMixin, paginated_response
+
+from ..cache_warmup import warm_up_catalogi_caches
+from ..clients import build_catalogi_clients
+from .factories import ZGWApiGroupConfigFactory
+from .helpers import generate_oas_component_cached
+from .shared import CATALOGI_ROOT
+from .test_zgw_imports import ZaakTypeMockData
+
+
+@requests_mock.Mocker()
+class CatalogiCacheWarmUpTest(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.api_group = ZGWApiGroupConfigFactory(ztc_service__api_root=CATALOGI_ROOT)
+        # same catalogi service
+        ZGWApiGroupConfigFactory(ztc_service=cls.api_group.ztc_service)
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaak_type_data = ZaakTypeMockData(CATALOGI_ROOT)
+        self.zaak_type = self.zaak_type_data.zaaktype_aaa_1
+        self.status_types = [
+            generate_oas_component_cached(
+                "ztc",
+                "schemas/StatusType",
+                url=f"{CATALOGI_ROOT}statustypen/aaaaaaaa-aaaa-aaaa-aaaa-00000000000{i}",
+                zaaktype=self.zaak_type["url"],
+            )
+            for i in range(2)
+        ]
+        self.resultaat_type = generate_oas_component_cached(
+            "ztc",
+            "schemas/ResultaatType",
+            url=f"{CATALOGI_ROOT}resultaattypen/aaaaaaaa-aaaa-aaaa-aaaa-000000000000",
+            zaaktype=self.zaak_type["url"],
+        )
+        self.information_object_type = generate_oas_component_cached(
+            "ztc",
+            "schemas/InformatieObjectType",
+            url=f"{CATALOGI_ROOT}informatieobjecttypen/aaaaaaaa-aaaa-aaaa-aaaa-000000000000",
+        )
+
+    def install_mocks(self, m):
+        self.zaak_type_data.install_mocks(m)
+        m.get(f"{CATALOGI_ROOT}statustypen", json=paginated_response([]))
+        m.get(f"{CATALOGI_ROOT}resultaattypen", json=paginated_response([]))
+        m.get(
+            f"{CATALOGI_ROOT}statustypen?zaaktype={self.zaak_type['url']}",
+            json=paginated_response(self.status_types),
+        )
+        m.get(
+            f"{CATALOGI_ROOT}resultaattypen?zaaktype={self.zaak_type['url']}",
+            json=paginated_response([self.resultaat_type]),
+        )
+        m.get(
+            f"{CATALOGI_ROOT}informatieobjecttypen",
+            json=paginated_response([self.information_object_type]),
+        )
+
+    def test_warm_up_primes_cached_lookups(self, m):
+        self.install_mocks(m)
+
+        report = warm_up_catalogi_caches(max_workers=2)
+
+        self.assertEqual(report.failed_clients, [])
+        self.assertEqual(report.misses["zaaktype"], 4)
+        self.assertEqual(report.misses["statustype"], 2)
+        self.assertEqual(report.misses["resultaattype"], 1)
+        self.assertEqual(report.misses["informatieobjecttype"], 1)
+        self.assertEqual(sum(report.hits.values()), 0)
+
+        m.reset_mock()
+        (client,) = {c.configured_from.pk: c for c in build_catalogi_clients()}.values()
+
+        case_type = client.fetch_single_case_type(self.zaak_type["url"])
+        status_type = client.fetch_single_status_type(self.status_types[1]["url"])
+        resultaat_type = client.fetch_single_resultaat_type(self.resultaat_type["url"])
+        information_object_type = client.fetch_single_information_object_type(
+            self.information_object_type["url"]
+        )
+
+        self.assertFalse(m.called)
+        self.assertEqual(case_type.url, self.zaak_type["url"])
+        self.assertEqual(status_type.url, self.status_types[1]["url"])
+        self.assertEqual(resultaat_type.url, self.resultaat_type["url"])
+        self.assertEqual(
+            information_object_type.url, self.information_object_type["url"]
+        )
+
+    def test_warm_up_invalidates_local_caches(self, m):
+        self.install_mocks(m)
+
+        with patch(
+            "open_inwoner.openzaak.cache_warmup.invalidate_local_caches"
+        ) as mock_invalidate:
+            warm_up_catalogi_caches()
+
+        mock_invalidate.assert_called_once_with()
+
+    def test_warm_up_command_reports_hit_rates(self, m):
+        self.install_mocks(m)
+
+        call_command("zgw_warm_up_caches", stdout=StringIO())
+        out = StringIO()
+        call_command("zgw_warm_up_caches", stdout=out)
+
+        expected = inspect.cleandoc(
+            """
+            warmed up 4 zaaktype cache entries (100% were cached)
+            warmed up 2 statustype cache entries (100% were cached)
+            warmed up 1 resultaattype cache entries (100% were cached)
+            warmed up 1 informatieobjecttype cache entries (100% were cached)
+            """
+        )
+        self.assertEqual(out.getvalue().strip(), expected)
+
+    def test_failing_service_is_reported(self, m):
+        self.install_mocks(m)
+        m.get(f"{CATALOGI_ROOT}zaaktypen", exc=RuntimeError("boom"))
+
+        report = warm_up_catalogi_caches()
+
+        self.assertEqual(len(report.failed_clients), 1)
+        self.assertEqual(sum(report.misses.values()), 0)
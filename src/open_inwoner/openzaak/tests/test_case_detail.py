@@ -1458,6 +1458,61 @@ class TestCaseDetailView(
             [self.informatie_object_file_2, self.informatie_object_file],
         )
 
+    @override_settings(ZGW_DOCUMENTEN_MAX_CONCURRENCY=2)
+    @patch.object(
+        ContactmomentenClient,
+        "retrieve_objectcontactmomenten_for_zaak",
+        autospec=True,
+        return_value=[],
+    )
+    def test_case_io_objects_are_retrieved_once(self, m, cm_client_mock):
+        self._setUpMocks(m)
+        # the same document is linked twice
+        m.get(
+            f"{ZAKEN_ROOT}zaakinformatieobjecten?zaak={self.zaak['url']}",
+            json=[
+                self.zaak_informatie_object_old,
+                self.zaak_informatie_object_new,
+                self.zaak_informatie_object_invisible,
+                self.zaak_informatie_object_new,
+            ],
+        )
+
+        response = self.app.get(self.case_detail_url, user=self.user)
+
+        documents = response.context.get("case", {}).get("documents")
+        self.assertEqual(
+            documents,
+            [
+                self.informatie_object_file_2,
+                self.informatie_object_file_2,
+                self.informatie_object_file,
+            ],
+        )
+        for info_object in [
+            self.informatie_object,
+            self.informatie_object_2,
+            self.informatie_object_invisible,
+        ]:
+            self.assertEqual(
+                [r.url for r in m.request_history].count(info_object["url"]), 1
+            )
+
+    def test_case_roles_are_retrieved_once(self, m):
+        self._setUpMocks(m)
+
+        response = self.app.get(self.case_detail_url, user=self.user)
+
+        self.assertEqual(
+            response.context.get("case", {}).get("initiator"), "Foo Bar van der Bazz"
+        )
+        # the initiator is taken from the roles retrieved by the access check
+        role_requests = [
+            r for r in m.request_history if r.url.startswith(f"{ZAKEN_ROOT}rollen")
+        ]
+        self.assertEqual(len(role_requests), 1)
+        self.assertNotIn("omschrijvinggeneriek", role_requests[0].qs)
+
     def test_user_is_redirected_to_root_when_not_logged_in_via_digid(self, m):
         self._setUpMocks(m)
 
@@ -11,6 +11,8 @@ from django.test import TransactionTestCase
 from django.test.utils import override_settings
 from django.urls import reverse_lazy
 
+import httpx
+import requests
 import requests_mock
 from django_webtest import TransactionWebTest
 from furl import furl
@@ -20,6 +22,7 @@ from zgw_consumers.api_models.constants import VertrouwelijkheidsAanduidingen
 
 from open_inwoner.accounts.choices import LoginTypeChoices
 from open_inwoner.accounts.tests.factories import UserFactory, eHerkenningUserFactory
+from open_inwoner.cms.cases.views.async_services import AsyncCaseResolver
 from open_inwoner.cms.cases.views.cases import CaseFilterFormOption, InnerCaseListView
 from open_inwoner.utils.test import (
     ClearCachesMixin,
@@ -614,6 +617,39 @@ class CaseListViewTests(AssertTimelineLogMixin, ClearCachesMixin, TransactionTes
         # case filter form is disabled by default
         self.assertFalse(response.context.get("filter_form_enabled"))
 
+    def test_list_cases_with_async_engine(self, m):
+        for mock in self.mocks:
+            mock._setUpMocks(m)
+
+        # route the httpx requests of the async engine through requests_mock
+        session = requests.Session()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            response = session.request(
+                request.method, str(request.url), headers=dict(request.headers)
+            )
+            return httpx.Response(
+                response.status_code,
+                headers={"Content-Type": response.headers.get("Content-Type", "")},
+                content=response.content,
+            )
+
+        self.client.force_login(user=self.user)
+        response = self.client.get(self.inner_url, HTTP_HX_REQUEST="true")
+
+        self.clear_caches()
+        m.reset_mock()
+
+        with override_settings(ZGW_ASYNC_ENGINE_ENABLED=True), patch.object(
+            AsyncCaseResolver, "transport", httpx.MockTransport(handler)
+        ):
+            async_response = self.client.get(self.inner_url, HTTP_HX_REQUEST="true")
+
+        self.assertTrue(
+            any(req.path.startswith("/api/v1/statussen") for req in m.request_history)
+        )
+        self.assertListEqual(async_response.context["cases"], response.context["cases"])
+
     def test_filter_widget_is_controlled_by_zaken_filter_enabled(self, m):
         self.client.force_login(user=self.user)
 
@@ -1055,6 +1091,24 @@ class CaseListViewTests(AssertTimelineLogMixin, ClearCachesMixin, TransactionTes
         self.assertNotContains(response_2, self.mocks[1].zaak2["url"])
         self.assertContains(response_2, "?page=1")
 
+    @patch.object(InnerCaseListView, "paginate_by", 4)
+    def test_list_cases_paginated_only_resolves_cases_on_page(self, m):
+        for mock in self.mocks:
+            mock._setUpMocks(m)
+
+        self.client.force_login(user=self.user)
+        response = self.client.get(self.inner_url, HTTP_HX_REQUEST="true")
+
+        self.assertEqual(len(response.context.get("cases")), 4)
+
+        resolved_hostnames = {
+            req.hostname
+            for req in m.request_history
+            if "/statussen/" in req.path or "/resultaten/" in req.path
+        }
+        # only the cases from the first backend are on the first page
+        self.assertEqual(resolved_hostnames, {"zaken.nl"})
+
     @patch.object(InnerCaseListView, "paginate_by", 4)
     def test_list_cases_paginated_logs_displayed_case_ids(self, m):
         for mock in self.mocks:
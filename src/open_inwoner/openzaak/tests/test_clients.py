@@ -1,7 +1,7 @@
 from unittest import TestCase as PlainTestCase
 from unittest.mock import Mock, patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 import requests
 import requests_mock
@@ -20,6 +20,7 @@ from open_inwoner.openzaak.clients import (
     build_zaken_client,
     build_zaken_clients,
     build_zgw_client_from_service,
+    zgw_client_pool,
 )
 from open_inwoner.openzaak.exceptions import MultiZgwClientProxyError
 from open_inwoner.openzaak.models import ZGWApiGroupConfig
@@ -29,6 +30,9 @@ from open_inwoner.openzaak.tests.shared import (
     DOCUMENTEN_ROOT,
     ZAKEN_ROOT,
 )
+from open_inwoner.utils.test import ClearCachesMixin
+
+from .helpers import generate_oas_component_cached
 
 
 class ClientFactoryTestCase(TestCase):
@@ -74,6 +78,92 @@ class ClientFactoryTestCase(TestCase):
                     self.assertEqual(client.configured_from.api_type, api_type)
 
 
+class ZgwClientPoolTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        zgw_client_pool.invalidate()
+        self.api_group = ZGWApiGroupConfigFactory()
+
+    def test_clients_are_reused(self):
+        client = self.api_group.zaken_client
+
+        self.assertTrue(client.pooled)
+        self.assertIs(self.api_group.zaken_client, client)
+        self.assertIs(
+            ZGWApiGroupConfig.objects.get(pk=self.api_group.pk).zaken_client, client
+        )
+        self.assertIsNot(self.api_group.catalogi_client, client)
+
+    def test_client_is_not_closed_by_context_manager(self):
+        client = self.api_group.zaken_client
+
+        with patch.object(client, "close") as close_mock:
+            with client:
+                pass
+
+        close_mock.assert_not_called()
+
+    @requests_mock.Mocker()
+    def test_client_is_not_closed_after_request(self, m):
+        client = self.api_group.zaken_client
+        m.get(f"{client.base_url}zaken", json={})
+
+        with patch.object(client, "close") as close_mock:
+            client.get("zaken")
+
+        close_mock.assert_not_called()
+
+    @requests_mock.Mocker()
+    def test_replaced_client_is_closed_after_requests_in_flight(self, m):
+        client = self.api_group.zaken_client
+
+        def replace_client(request, context):
+            closed = close_mock.call_count
+            if not client.retired:
+                with override_settings(ZGW_CLIENT_POOL_MAX_AGE=0):
+                    self.assertIsNot(self.api_group.zaken_client, client)
+            # not closed while the request is in flight
+            self.assertEqual(close_mock.call_count, closed)
+            return {}
+
+        m.get(f"{client.base_url}zaken", json=replace_client)
+
+        with patch.object(client, "close") as close_mock:
+            self.assertEqual(client.get("zaken").json(), {})
+            close_mock.assert_called_once()
+
+            # a thread that still holds the client can use it
+            self.assertEqual(client.get("zaken").json(), {})
+            self.assertEqual(close_mock.call_count, 2)
+
+        self.assertTrue(client.retired)
+
+    def test_idle_client_is_closed_when_invalidated(self):
+        client = self.api_group.zaken_client
+
+        with patch.object(client, "close") as close_mock:
+            zgw_client_pool.invalidate(self.api_group.zrc_service.pk)
+
+        close_mock.assert_called_once()
+
+    def test_client_is_replaced_when_service_is_edited(self):
+        client = self.api_group.zaken_client
+
+        self.api_group.zrc_service.api_root = "https://other.zaken.nl/api/v1/"
+        self.api_group.zrc_service.save()
+
+        new_client = self.api_group.zaken_client
+        self.assertIsNot(new_client, client)
+        self.assertEqual(new_client.base_url, "https://other.zaken.nl/api/v1/")
+
+    @override_settings(ZGW_CLIENT_POOL_MAX_AGE=0)
+    def test_client_is_replaced_after_max_age(self):
+        client = self.api_group.zaken_client
+
+        self.assertIsNot(self.api_group.zaken_client, client)
+
+
 class ZGWApiGroupConfigFilterTests(TestCase):
     def setUp(self):
         self.api_groups = [
@@ -243,6 +333,82 @@ class ZGWApiGroupConfigFilterTests(TestCase):
             )
 
 
+@requests_mock.Mocker()
+class PaginationTestCase(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.zaken_client = ZGWApiGroupConfigFactory(
+            zrc_service__api_root=ZAKEN_ROOT
+        ).zaken_client
+        self.case_url = f"{ZAKEN_ROOT}zaken/d8bbdeb7-770f-4ca9-b1ea-77b4730bf67d"
+        self.statuses = [
+            generate_oas_component_cached(
+                "zrc",
+                "schemas/Status",
+                url=f"{ZAKEN_ROOT}statussen/{i}",
+                zaak=self.case_url,
+            )
+            for i in range(7)
+        ]
+        self.list_url = f"{ZAKEN_ROOT}statussen?zaak={self.case_url}"
+
+    def _page(self, page: int, count: int | None = 7) -> dict:
+        # pages of 2 statuses
+        data = {
+            "previous": None,
+            "next": (
+                f"{self.list_url}&page={page + 1}"
+                if page * 2 < len(self.statuses)
+                else None
+            ),
+            "results": self.statuses[(page - 1) * 2 : page * 2],
+        }
+        if count is not None:
+            data["count"] = count
+        return data
+
+    def test_remaining_pages_are_derived_from_count(self, m):
+        m.get(self.list_url, json=self._page(1), complete_qs=True)
+        page_matchers = [
+            m.get(f"{self.list_url}&page={page}", json=self._page(page))
+            for page in (2, 3, 4)
+        ]
+
+        statuses = self.zaken_client.fetch_status_history_no_cache(self.case_url)
+
+        self.assertEqual(
+            [status.url for status in statuses],
+            [status["url"] for status in self.statuses],
+        )
+        for matcher in page_matchers:
+            self.assertEqual(matcher.call_count, 1)
+
+    def test_next_links_are_followed_without_count(self, m):
+        m.get(self.list_url, json=self._page(1, count=None), complete_qs=True)
+        for page in (2, 3, 4):
+            m.get(f"{self.list_url}&page={page}", json=self._page(page, count=None))
+
+        statuses = self.zaken_client.fetch_status_history_no_cache(self.case_url)
+
+        self.assertEqual(len(statuses), 7)
+        self.assertEqual(len(m.request_history), 4)
+
+    def test_pages_added_in_the_meantime_are_followed(self, m):
+        # the count of the first page is outdated: it only accounts for 3 pages
+        m.get(self.list_url, json=self._page(1, count=5), complete_qs=True)
+        for page in (2, 3, 4):
+            m.get(f"{self.list_url}&page={page}", json=self._page(page))
+
+        statuses = self.zaken_client.fetch_status_history_no_cache(self.case_url)
+
+        self.assertEqual(
+            [status.url for status in statuses],
+            [status["url"] for status in self.statuses],
+        )
+        self.assertEqual(len(m.request_history), 4)
+
+
 @requests_mock.Mocker()
 class MultiZgwClientProxyTests(PlainTestCase):
     class SimpleClient:
@@ -0,0 +1,130 @@
+from django.db import transaction
+from django.test import TransactionTestCase
+
+from zgw_consumers.api_models.base import factory
+from zgw_consumers.test import generate_oas_component
+
+from open_inwoner.utils.test import ClearCachesMixin
+
+from ..api_models import ZaakType
+from ..config_registry import zgw_config_registry
+from .factories import (
+    ZaakTypeConfigFactory,
+    ZaakTypeInformatieObjectTypeConfigFactory,
+    ZaakTypeStatusTypeConfigFactory,
+)
+from .shared import CATALOGI_ROOT
+
+
+class ZGWConfigRegistryTestCase(ClearCachesMixin, TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+
+        zgw_config_registry.clear()
+
+        self.zaaktype_config = ZaakTypeConfigFactory(
+            catalogus__url=f"{CATALOGI_ROOT}catalogussen/1",
+            identificatie="ZAAKTYPE-2020-0000000001",
+        )
+        self.statustype_config = ZaakTypeStatusTypeConfigFactory(
+            zaaktype_config=self.zaaktype_config,
+            statustype_url=f"{CATALOGI_ROOT}statustypen/1",
+        )
+        self.case_type = factory(
+            ZaakType,
+            generate_oas_component(
+                "ztc",
+                "schemas/ZaakType",
+                url=f"{CATALOGI_ROOT}zaaktypen/1",
+                catalogus=self.zaaktype_config.catalogus.url,
+                identificatie=self.zaaktype_config.identificatie,
+            ),
+        )
+        self.info_type_config = ZaakTypeInformatieObjectTypeConfigFactory(
+            zaaktype_config=self.zaaktype_config,
+            informatieobjecttype_url=f"{CATALOGI_ROOT}informatieobjecttypen/1",
+            zaaktype_uuids=[self.case_type.uuid],
+            document_upload_enabled=True,
+        )
+
+    def test_lookups_do_not_query_after_loading(self):
+        # load
+        zgw_config_registry.get_zaaktype_config(self.case_type)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                zgw_config_registry.get_zaaktype_config(self.case_type),
+                self.zaaktype_config,
+            )
+            self.assertEqual(
+                zgw_config_registry.get_statustype_config(
+                    self.zaaktype_config, self.statustype_config.statustype_url
+                ),
+                self.statustype_config,
+            )
+            self.assertEqual(
+                zgw_config_registry.find_statustype_config(
+                    self.case_type, self.statustype_config.statustype_url
+                ),
+                self.statustype_config,
+            )
+            self.assertEqual(
+                zgw_config_registry.get_statustype_config_mapping(
+                    self.zaaktype_config.identificatie
+                ),
+                {self.statustype_config.statustype_url: self.statustype_config},
+            )
+            self.assertEqual(
+                zgw_config_registry.get_informatieobjecttype_config(
+                    self.case_type, self.info_type_config.informatieobjecttype_url
+                ),
+                self.info_type_config,
+            )
+            self.assertIsNone(
+                zgw_config_registry.get_statustype_config(
+                    self.zaaktype_config, f"{CATALOGI_ROOT}statustypen/unknown"
+                )
+            )
+
+    def test_changes_invalidate_registry(self):
+        self.assertIsNone(
+            zgw_config_registry.get_statustype_config(
+                self.zaaktype_config, f"{CATALOGI_ROOT}statustypen/2"
+            )
+        )
+
+        other_statustype_config = ZaakTypeStatusTypeConfigFactory(
+            zaaktype_config=self.zaaktype_config,
+            statustype_url=f"{CATALOGI_ROOT}statustypen/2",
+        )
+
+        self.assertEqual(
+            zgw_config_registry.get_statustype_config(
+                self.zaaktype_config, f"{CATALOGI_ROOT}statustypen/2"
+            ),
+            other_statustype_config,
+        )
+
+        other_statustype_config.delete()
+
+        self.assertIsNone(
+            zgw_config_registry.get_statustype_config(
+                self.zaaktype_config, f"{CATALOGI_ROOT}statustypen/2"
+            )
+        )
+
+    def test_registry_is_bypassed_in_transaction(self):
+        with transaction.atomic():
+            self.zaaktype_config.description = "uncommitted"
+            self.zaaktype_config.save()
+
+            self.assertEqual(
+                zgw_config_registry.get_zaaktype_config(self.case_type).description,
+                "uncommitted",
+            )
+            transaction.set_rollback(True)
+
+        self.assertNotEqual(
+            zgw_config_registry.get_zaaktype_config(self.case_type).description,
+            "uncommitted",
+        )
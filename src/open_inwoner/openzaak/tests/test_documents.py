@@ -368,6 +368,119 @@ class TestDocumentDownloadUpload(ClearCachesMixin, TransactionWebTest):
             response.headers["Content-Length"], str(len(self.informatie_object_content))
         )
 
+    def test_document_content_is_streamed(self, m):
+        self._setUpMocks(m)
+
+        response = self.app.get(self.informatie_object_file.url, user=self.user)
+
+        self.assertEqual(response.body, self.informatie_object_content)
+        # not advertised before the API has honoured a range
+        self.assertNotIn("Accept-Ranges", response.headers)
+        download_request = m.request_history[-1]
+        self.assertEqual(download_request.url, self.informatie_object["inhoud"])
+        self.assertTrue(download_request.stream)
+
+    def test_document_content_range_is_retrieved(self, m):
+        self._setUpMocks(m)
+        m.get(
+            self.informatie_object["inhoud"],
+            request_headers={"Range": "bytes=3-10"},
+            status_code=206,
+            headers={
+                "Content-Range": f"bytes 3-10/{len(self.informatie_object_content)}",
+                "Content-Length": "8",
+            },
+            content=self.informatie_object_content[3:11],
+        )
+
+        response = self.app.get(
+            self.informatie_object_file.url,
+            user=self.user,
+            headers={"Range": "bytes=3-10"},
+            status=206,
+        )
+
+        self.assertEqual(response.body, b"document")
+        self.assertEqual(
+            response.headers["Content-Range"],
+            f"bytes 3-10/{len(self.informatie_object_content)}",
+        )
+        self.assertEqual(response.headers["Content-Length"], "8")
+        self.assertEqual(response.headers["Accept-Ranges"], "bytes")
+
+    def test_document_content_range_changed_by_api_is_passed_on(self, m):
+        self._setUpMocks(m)
+        size = len(self.informatie_object_content)
+        m.get(
+            self.informatie_object["inhoud"],
+            request_headers={"Range": f"bytes=3-{size - 1}"},
+            status_code=206,
+            headers={"Content-Range": f"bytes 3-10/{size}", "Content-Length": "8"},
+            content=self.informatie_object_content[3:11],
+        )
+
+        response = self.app.get(
+            self.informatie_object_file.url,
+            user=self.user,
+            headers={"Range": "bytes=3-"},
+            status=206,
+        )
+
+        self.assertEqual(response.body, b"document")
+        self.assertEqual(response.headers["Content-Range"], f"bytes 3-10/{size}")
+        self.assertEqual(response.headers["Content-Length"], "8")
+
+    def test_document_content_range_without_content_range_returns_full_content(self, m):
+        self._setUpMocks(m)
+        m.get(
+            self.informatie_object["inhoud"],
+            request_headers={"Range": "bytes=3-10"},
+            status_code=206,
+            content=self.informatie_object_content[3:11],
+        )
+
+        response = self.app.get(
+            self.informatie_object_file.url,
+            user=self.user,
+            headers={"Range": "bytes=3-10"},
+            status=200,
+        )
+
+        self.assertEqual(response.body, self.informatie_object_content)
+        self.assertNotIn("Content-Range", response.headers)
+        self.assertNotIn("Accept-Ranges", response.headers)
+        self.assertNotIn("Range", m.request_history[-1].headers)
+
+    def test_document_content_range_ignored_by_api_returns_full_content(self, m):
+        self._setUpMocks(m)
+
+        response = self.app.get(
+            self.informatie_object_file.url,
+            user=self.user,
+            headers={"Range": "bytes=-8"},
+            status=200,
+        )
+
+        self.assertEqual(response.body, self.informatie_object_content)
+        self.assertNotIn("Content-Range", response.headers)
+        self.assertEqual(m.request_history[-1].headers["Range"], "bytes=11-18")
+
+    def test_document_content_range_not_satisfiable(self, m):
+        self._setUpMocks(m)
+
+        response = self.app.get(
+            self.informatie_object_file.url,
+            user=self.user,
+            headers={"Range": "bytes=100-"},
+            status=416,
+        )
+
+        self.assertEqual(
+            response.headers["Content-Range"],
+            f"bytes */{len(self.informatie_object_content)}",
+        )
+        self.assertNotEqual(m.request_history[-1].url, self.informatie_object["inhoud"])
+
     def test_document_retrieval_logs_case_identification_and_file(self, m):
         self._setUpMocks(m)
         url = reverse(
@@ -567,6 +680,142 @@ class TestDocumentDownloadUpload(ClearCachesMixin, TransactionWebTest):
 
         self.assertEqual(created_document, self.informatie_object)
 
+    @override_settings(ZGW_DOCUMENT_UPLOAD_IN_PARTS_THRESHOLD=5)
+    def test_large_document_is_uploaded_in_parts(self, m):
+        self._setUpMocks(m)
+        lock = "0c47fe5c7e4c4e4fb7a4f2cd4e4e4a30"
+        parts = [
+            {
+                "url": f"{DOCUMENTEN_ROOT}bestandsdelen/aaaaaaaa-aaaa-aaaa-aaaa-00000000000{i}",
+                "volgnummer": i + 1,
+                "omvang": omvang,
+                "voltooid": False,
+                "lock": lock,
+            }
+            for i, omvang in enumerate([8, 4])
+        ]
+        document = {**self.informatie_object, "bestandsdelen": parts, "lock": lock}
+        m.post(
+            f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten",
+            status_code=201,
+            json=document,
+        )
+        for part in parts:
+            m.put(part["url"], json={**part, "voltooid": True})
+        m.post(f"{self.informatie_object['url']}/unlock", status_code=204)
+
+        file = get_temporary_text_file()
+        created_document = build_documenten_client().upload_document(
+            self.user,
+            file,
+            "my_document",
+            self.informatie_object["informatieobjecttype"],
+            self.zaak["bronorganisatie"],
+        )
+
+        self.assertEqual(created_document, document)
+
+        create_request, *part_requests, unlock_request = m.request_history
+        self.assertIsNone(create_request.json()["inhoud"])
+        self.assertEqual(create_request.json()["bestandsomvang"], file.size)
+
+        self.assertEqual(
+            [request.url for request in part_requests],
+            [part["url"] for part in parts],
+        )
+        for request, content in zip(part_requests, [b"some con", b"tent"]):
+            body = b"".join(request.body)
+            self.assertIn(f'name="lock"\r\n\r\n{lock}\r\n'.encode(), body)
+            self.assertIn(b"Content-Type: application/octet-stream\r\n\r\n", body)
+            self.assertIn(b"\r\n\r\n" + content + b"\r\n--", body)
+            self.assertEqual(int(request.headers["Content-Length"]), len(body))
+
+        self.assertEqual(unlock_request.json(), {"lock": lock})
+
+    @override_settings(ZGW_DOCUMENT_UPLOAD_IN_PARTS_THRESHOLD=5)
+    def test_incomplete_document_is_discarded(self, m):
+        self._setUpMocks(m)
+        lock = "0c47fe5c7e4c4e4fb7a4f2cd4e4e4a30"
+        parts = [
+            {
+                "url": f"{DOCUMENTEN_ROOT}bestandsdelen/aaaaaaaa-aaaa-aaaa-aaaa-00000000000{i}",
+                "volgnummer": i + 1,
+                "omvang": omvang,
+                "voltooid": False,
+                "lock": lock,
+            }
+            for i, omvang in enumerate([8, 4])
+        ]
+        document = {**self.informatie_object, "bestandsdelen": parts, "lock": lock}
+        m.post(
+            f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten",
+            status_code=201,
+            json=document,
+        )
+        m.put(parts[0]["url"], json={**parts[0], "voltooid": True})
+        m.put(parts[1]["url"], status_code=500)
+        m.post(f"{self.informatie_object['url']}/unlock", status_code=204)
+        m.delete(self.informatie_object["url"], status_code=204)
+
+        created_document = build_documenten_client().upload_document(
+            self.user,
+            get_temporary_text_file(),
+            "my_document",
+            self.informatie_object["informatieobjecttype"],
+            self.zaak["bronorganisatie"],
+        )
+
+        self.assertIsNone(created_document)
+        *_, unlock_request, delete_request = m.request_history
+        self.assertEqual(unlock_request.json(), {"lock": lock})
+        self.assertEqual(delete_request.method, "DELETE")
+        self.assertEqual(delete_request.url, self.informatie_object["url"])
+
+    @override_settings(ZGW_DOCUMENT_UPLOAD_IN_PARTS_THRESHOLD=5)
+    def test_document_is_discarded_if_file_is_smaller_than_parts(self, m):
+        self._setUpMocks(m)
+        lock = "0c47fe5c7e4c4e4fb7a4f2cd4e4e4a30"
+        parts = [
+            {
+                "url": f"{DOCUMENTEN_ROOT}bestandsdelen/aaaaaaaa-aaaa-aaaa-aaaa-00000000000{i}",
+                "volgnummer": i + 1,
+                "omvang": 8,
+                "voltooid": False,
+                "lock": lock,
+            }
+            for i in range(2)
+        ]
+        document = {**self.informatie_object, "bestandsdelen": parts, "lock": lock}
+        m.post(
+            f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten",
+            status_code=201,
+            json=document,
+        )
+
+        def read_part(request, context):
+            # the body is read while it is sent
+            b"".join(request.body)
+            return {**parts[0], "voltooid": True}
+
+        for part in parts:
+            m.put(part["url"], json=read_part)
+        m.post(f"{self.informatie_object['url']}/unlock", status_code=204)
+        m.delete(self.informatie_object["url"], status_code=204)
+
+        created_document = build_documenten_client().upload_document(
+            self.user,
+            get_temporary_text_file(),
+            "my_document",
+            self.informatie_object["informatieobjecttype"],
+            self.zaak["bronorganisatie"],
+        )
+
+        self.assertIsNone(created_document)
+        *_, unlock_request, delete_request = m.request_history
+        self.assertEqual(unlock_request.json(), {"lock": lock})
+        self.assertEqual(delete_request.method, "DELETE")
+        self.assertEqual(delete_request.url, self.informatie_object["url"])
+
     def test_document_upload_multiple_backends(self, m):
         self._setUpMocks(m)
         self._setUpAdditionalMocks(m)
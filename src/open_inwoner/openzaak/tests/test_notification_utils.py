@@ -1,30 +1,40 @@
+from datetime import timedelta
 from unittest import mock
 
 from django.core import mail
 from django.test import TestCase
 from django.test.utils import override_settings
 from django.urls import reverse
+from django.utils import timezone
 
 from zgw_consumers.api_models.base import factory
 from zgw_consumers.api_models.constants import RolOmschrijving, RolTypes
 
 from open_inwoner.accounts.tests.factories import DigidUserFactory, UserFactory
 from open_inwoner.configurations.models import SiteConfiguration
+from open_inwoner.openzaak.models import PendingCaseUpdateEmail
 from open_inwoner.openzaak.notifications import (
     _get_initiator_users_from_roles,
     _get_np_initiator_bsns_from_roles,
+    get_stale_pending_case_update_emails,
+    queue_case_update_email,
     send_case_update_email,
+    send_pending_case_update_emails,
 )
+from open_inwoner.openzaak.tasks import send_stale_case_update_emails
 from open_inwoner.openzaak.tests.factories import ZGWApiGroupConfigFactory, generate_rol
 from open_inwoner.openzaak.tests.shared import ZAKEN_ROOT
+from open_inwoner.utils.test import ClearCachesMixin
 
 from ..api_models import Status, StatusType, Zaak, ZaakType
 from .test_notification_data import MockAPIData
 
 
 @override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
-class NotificationHandlerUtilsTestCase(TestCase):
+class NotificationHandlerUtilsTestCase(ClearCachesMixin, TestCase):
     def setUp(self):
+        super().setUp()
+
         self.api_group = ZGWApiGroupConfigFactory(
             zrc_service__api_root=ZAKEN_ROOT,
         )
@@ -107,6 +117,106 @@ class NotificationHandlerUtilsTestCase(TestCase):
         self.assertIn(case_url, body_html)
         self.assertIn(config.name, body_html)
 
+    @override_settings(ZGW_NOTIFICATIONS_COALESCE_WINDOW=60)
+    @mock.patch("open_inwoner.openzaak.tasks.send_case_update_emails.apply_async")
+    def test_case_update_emails_are_coalesced(self, mock_apply_async):
+        data = MockAPIData()
+        user = data.user_initiator
+
+        case = factory(Zaak, data.zaak)
+        case.zaaktype = factory(ZaakType, data.zaak_type)
+
+        status = factory(Status, data.status_final)
+        status.statustype = factory(StatusType, data.status_type_final)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_case_update_email(
+                user,
+                case,
+                "case_status_notification",
+                api_group=self.api_group,
+                status=status,
+            )
+            for _ in range(2):
+                queue_case_update_email(
+                    user, case, "case_document_notification", api_group=self.api_group
+                )
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(PendingCaseUpdateEmail.objects.count(), 3)
+        mock_apply_async.assert_called_once_with(
+            (user.pk, str(case.uuid)), countdown=60
+        )
+
+        send_pending_case_update_emails(user.pk, str(case.uuid))
+
+        self.assertEqual(len(mail.outbox), 1)
+        email = mail.outbox[0]
+        self.assertEqual(email.to, [user.email])
+
+        body_html = email.alternatives[0][0]
+        self.assertIn(case.identificatie, body_html)
+        self.assertIn(status.statustype.statustekst, body_html)
+        self.assertIn("Er zijn 2 documenten aan uw aanvraag toegevoegd", body_html)
+        self.assertFalse(PendingCaseUpdateEmail.objects.exists())
+
+        # nothing left to send
+        send_pending_case_update_emails(user.pk, str(case.uuid))
+
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(ZGW_NOTIFICATIONS_COALESCE_WINDOW=60)
+    @mock.patch("open_inwoner.openzaak.tasks.send_case_update_emails.apply_async")
+    def test_single_case_update_email_is_sent_unchanged(self, mock_apply_async):
+        data = MockAPIData()
+        user = data.user_initiator
+
+        case = factory(Zaak, data.zaak)
+        case.zaaktype = factory(ZaakType, data.zaak_type)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_case_update_email(
+                user, case, "case_document_notification", api_group=self.api_group
+            )
+
+        send_pending_case_update_emails(user.pk, str(case.uuid))
+
+        self.assertEqual(len(mail.outbox), 1)
+        body_html = mail.outbox[0].alternatives[0][0]
+        self.assertIn(
+            "Een of meer documenten zijn aan uw aanvraag toegevoegd", body_html
+        )
+
+    @override_settings(ZGW_NOTIFICATIONS_COALESCE_WINDOW=60)
+    @mock.patch("open_inwoner.openzaak.tasks.send_case_update_emails.apply_async")
+    def test_stale_case_update_emails_are_sent(self, mock_apply_async):
+        data = MockAPIData()
+        user = data.user_initiator
+
+        case = factory(Zaak, data.zaak)
+        case.zaaktype = factory(ZaakType, data.zaak_type)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_case_update_email(
+                user, case, "case_document_notification", api_group=self.api_group
+            )
+
+        # the scheduled task is still expected to send the email
+        self.assertEqual(get_stale_pending_case_update_emails(), [])
+
+        # ... but it was lost
+        PendingCaseUpdateEmail.objects.update(
+            created_on=timezone.now() - timedelta(minutes=5)
+        )
+        self.assertEqual(
+            get_stale_pending_case_update_emails(), [(user.pk, str(case.uuid))]
+        )
+
+        send_stale_case_update_emails()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(PendingCaseUpdateEmail.objects.exists())
+
     # TODO we're missing a similar test for get_nnp_initiator_nnp_id_from_roles()
     def test_get_np_initiator_bsns_from_roles(self):
         # roles we're interested in
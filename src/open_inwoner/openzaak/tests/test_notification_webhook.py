@@ -1,8 +1,10 @@
 import logging
+from datetime import timedelta
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse_lazy
+from django.utils import timezone
 
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -10,12 +12,19 @@ from zds_client import ClientAuth
 
 from open_inwoner.openzaak.api_models import Notification
 from open_inwoner.openzaak.auth import get_valid_subscriptions_from_bearer
+from open_inwoner.openzaak.constants import ReceivedNotificationStatus
 from open_inwoner.openzaak.exceptions import (
     InvalidAuth,
     InvalidAuthForClientID,
     NoSubscriptionForClientID,
 )
+from open_inwoner.openzaak.models import ReceivedNotification
+from open_inwoner.openzaak.notifications import (
+    claim_stale_received_notifications,
+    process_received_notification,
+)
 from open_inwoner.openzaak.tests.factories import SubscriptionFactory
+from open_inwoner.utils.test import ClearCachesMixin
 from open_inwoner.utils.tests.helpers import AssertTimelineLogMixin
 
 from .shared import CATALOGI_ROOT, ZAKEN_ROOT
@@ -259,3 +268,160 @@ class NotificationWebhookAPITestCase(AssertTimelineLogMixin, APITestCase):
             "notification channel 'not_webhook_kanaal' not acceptable by webhook",
             level=logging.ERROR,
         )
+
+
+@override_settings(ZGW_NOTIFICATIONS_ASYNC=True)
+@patch("open_inwoner.openzaak.api.views.handle_zaken_notification", autospec=True)
+@patch("open_inwoner.openzaak.tasks.process_zaken_notification.delay")
+class AsyncNotificationWebhookAPITestCase(ClearCachesMixin, APITestCase):
+    url = reverse_lazy("openzaak_api:notifications_webhook_zaken")
+
+    def setUp(self):
+        super().setUp()
+
+        SubscriptionFactory.create(client_id="foo", secret="password")
+        self.headers = {
+            "HTTP_AUTHORIZATION": generate_auth_header_value("foo", "password")
+        }
+        self.raw_notification = {
+            "kanaal": "zaken",
+            "hoofdObject": f"{ZAKEN_ROOT}/zaken/uuid-0001",
+            "resource": "status",
+            "resourceUrl": f"{ZAKEN_ROOT}/statussen/uuid-0001",
+            "actie": "create",
+            "aanmaakdatum": "2023-01-11T15:09:59.116815Z",
+            "kenmerken": {"bronorganisatie": "100000009"},
+        }
+
+    def post_notification(self, raw_notification):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url, raw_notification, **self.headers, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_notification_is_stored_and_enqueued(self, mock_delay, mock_handle):
+        self.post_notification(self.raw_notification)
+
+        received = ReceivedNotification.objects.get()
+        self.assertEqual(received.status, ReceivedNotificationStatus.pending)
+        self.assertEqual(received.resource_url, self.raw_notification["resourceUrl"])
+        self.assertEqual(received.kenmerken, self.raw_notification["kenmerken"])
+
+        mock_delay.assert_called_once_with(received.pk)
+        mock_handle.assert_not_called()
+
+    def test_identical_notifications_are_deduplicated(self, mock_delay, mock_handle):
+        self.post_notification(self.raw_notification)
+        self.post_notification(
+            {**self.raw_notification, "aanmaakdatum": "2023-01-11T15:10:59.116815Z"}
+        )
+
+        received = ReceivedNotification.objects.get()
+        self.assertEqual(received.deliveries, 2)
+        mock_delay.assert_called_once_with(received.pk)
+
+        self.post_notification(
+            {**self.raw_notification, "resourceUrl": f"{ZAKEN_ROOT}/statussen/uuid-2"}
+        )
+
+        self.assertEqual(ReceivedNotification.objects.count(), 2)
+        self.assertEqual(mock_delay.call_count, 2)
+
+    def test_notification_is_not_deduplicated_after_failing_to_enqueue(
+        self, mock_delay, mock_handle
+    ):
+        mock_delay.side_effect = ConnectionError("broker unavailable")
+
+        with self.assertRaises(ConnectionError):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(
+                    self.url, self.raw_notification, **self.headers, format="json"
+                )
+
+        self.assertFalse(ReceivedNotification.objects.exists())
+
+        # the redelivery is handled
+        mock_delay.side_effect = None
+        self.post_notification(self.raw_notification)
+
+        received = ReceivedNotification.objects.get()
+        self.assertEqual(received.deliveries, 1)
+        mock_delay.assert_called_with(received.pk)
+
+
+@patch("open_inwoner.openzaak.notifications.handle_zaken_notification", autospec=True)
+class ProcessReceivedNotificationTestCase(AssertTimelineLogMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.received = ReceivedNotification.objects.create(
+            kanaal="zaken",
+            hoofd_object=f"{ZAKEN_ROOT}/zaken/uuid-0001",
+            resource="status",
+            resource_url=f"{ZAKEN_ROOT}/statussen/uuid-0001",
+            actie="create",
+            aanmaakdatum="2023-01-11T15:09:59.116815Z",
+            deduplication_key="key",
+        )
+
+    def test_notification_is_processed_once(self, mock_handle):
+        process_received_notification(self.received.pk)
+        process_received_notification(self.received.pk)
+
+        mock_handle.assert_called_once()
+        notification = mock_handle.call_args.args[0]
+        self.assertIsInstance(notification, Notification)
+        self.assertEqual(notification.resource_url, self.received.resource_url)
+
+        self.received.refresh_from_db()
+        self.assertEqual(self.received.status, ReceivedNotificationStatus.processed)
+        self.assertIsNotNone(self.received.processed_on)
+
+    def test_failed_notification_can_be_processed_again(self, mock_handle):
+        mock_handle.side_effect = Exception("whoopsie")
+
+        process_received_notification(self.received.pk)
+
+        self.received.refresh_from_db()
+        self.assertEqual(self.received.status, ReceivedNotificationStatus.failed)
+        self.assertEqual(self.received.error, "whoopsie")
+        self.assertTimelineLog(
+            "error handling notification: whoopsie", level=logging.ERROR
+        )
+
+        mock_handle.side_effect = None
+        process_received_notification(self.received.pk)
+
+        self.received.refresh_from_db()
+        self.assertEqual(self.received.status, ReceivedNotificationStatus.processed)
+        self.assertEqual(self.received.error, "")
+
+    @override_settings(ZGW_NOTIFICATIONS_STALE_TIMEOUT=60)
+    def test_stale_notifications_are_claimed_again(self, mock_handle):
+        # the worker was killed while processing the notification
+        ReceivedNotification.objects.filter(pk=self.received.pk).update(
+            status=ReceivedNotificationStatus.processing,
+            attempted_on=timezone.now() - timedelta(minutes=5),
+        )
+        recent = ReceivedNotification.objects.create(
+            kanaal="zaken",
+            hoofd_object=f"{ZAKEN_ROOT}/zaken/uuid-0002",
+            resource="status",
+            resource_url=f"{ZAKEN_ROOT}/statussen/uuid-0002",
+            actie="create",
+            aanmaakdatum="2023-01-11T15:09:59.116815Z",
+            deduplication_key="other-key",
+        )
+
+        self.assertEqual(claim_stale_received_notifications(), [self.received.pk])
+        # the next attempt is only reclaimed after another timeout
+        self.assertEqual(claim_stale_received_notifications(), [])
+
+        process_received_notification(self.received.pk)
+
+        mock_handle.assert_called_once()
+        self.received.refresh_from_db()
+        self.assertEqual(self.received.status, ReceivedNotificationStatus.processed)
+        recent.refresh_from_db()
+        self.assertEqual(recent.status, ReceivedNotificationStatus.pending)
@@ -6,7 +6,11 @@ from django.test import RequestFactory, TestCase, override_settings
 import requests_mock
 from freezegun import freeze_time
 from zgw_consumers.api_models.base import factory
-from zgw_consumers.api_models.constants import VertrouwelijkheidsAanduidingen
+from zgw_consumers.api_models.constants import (
+    RolOmschrijving,
+    RolTypes,
+    VertrouwelijkheidsAanduidingen,
+)
 
 from open_inwoner.accounts.tests.factories import UserFactory
 from open_inwoner.configurations.models import SiteConfiguration
@@ -15,7 +19,7 @@ from open_inwoner.openzaak.notifications import (
     _handle_status_update,
     handle_zaken_notification,
 )
-from open_inwoner.utils.test import ClearCachesMixin
+from open_inwoner.utils.test import ClearCachesMixin, paginated_response
 from open_inwoner.utils.tests.helpers import AssertTimelineLogMixin, Lookups
 
 from ..api_models import Status, StatusType, Zaak, ZaakType
@@ -25,7 +29,8 @@ from .factories import (
     ZaakTypeConfigFactory,
     ZaakTypeStatusTypeConfigFactory,
 )
-from .helpers import copy_with_new_uuid
+from .helpers import copy_with_new_uuid, generate_oas_component_cached
+from .shared import ZAKEN_ROOT
 from .test_notification_data import MockAPIData, MockAPIDataAlt
 
 
@@ -172,6 +177,121 @@ class StatusNotificationHandlerTestCase(
 
         mock_handle.assert_not_called()
 
+    def test_notification_purges_cached_case_data(self, m, mock_handle: Mock):
+        data = MockAPIData().install_mocks(m)
+        m.get(
+            f"{ZAKEN_ROOT}zaken?rol__betrokkeneIdentificatie__natuurlijkPersoon__inpBsn={data.user_initiator.bsn}",
+            json=paginated_response([data.zaak]),
+        )
+        zaken_client = data.api_group.zaken_client
+        case_uuid = data.zaak["url"].rsplit("/", 1)[1]
+
+        with freeze_time("2024-01-01 10:00:00"):
+            zaken_client.fetch_cases_by_bsn(data.user_initiator.bsn)
+            zaken_client.fetch_single_case(case_uuid)
+
+        with freeze_time("2024-01-01 10:00:10"):
+            handle_zaken_notification(data.status_notification)
+
+        m.reset_mock()
+        with freeze_time("2024-01-01 10:00:20"):
+            zaken_client.fetch_cases_by_bsn(data.user_initiator.bsn)
+            zaken_client.fetch_single_case(case_uuid)
+            # cached again while handling the notification
+            zaken_client.fetch_case_roles(data.zaak["url"])
+
+        self.assertEqual(
+            [request.url.split("?")[0] for request in m.request_history],
+            [f"{ZAKEN_ROOT}zaken", data.zaak["url"]],
+        )
+
+    def test_notification_purges_cached_case_lists_of_vestigingen(
+        self, m, mock_handle: Mock
+    ):
+        data = MockAPIData()
+        data.case_roles.append(
+            generate_oas_component_cached(
+                "zrc",
+                "schemas/Rol",
+                url=f"{ZAKEN_ROOT}rollen/aaaaaaaa-0004-aaaa-aaaa-aaaaaaaaaaaa",
+                omschrijvingGeneriek=RolOmschrijving.belanghebbende,
+                betrokkeneType=RolTypes.vestiging,
+                betrokkeneIdentificatie={"vestigingsNummer": "1234"},
+            )
+        )
+        data.install_mocks(m)
+        m.get(f"{ZAKEN_ROOT}zaken", json=paginated_response([data.zaak]))
+        zaken_client = data.api_group.zaken_client
+
+        with freeze_time("2024-01-01 10:00:00"):
+            zaken_client.fetch_cases_by_kvk_or_rsin("12345678", vestigingsnummer="1234")
+
+        m.reset_mock()
+        with freeze_time("2024-01-01 10:00:10"):
+            handle_zaken_notification(data.status_notification)
+
+        # the roles are only retrieved once
+        self.assertEqual(
+            len([r for r in m.request_history if r.path.endswith("/rollen")]), 1
+        )
+
+        m.reset_mock()
+        with freeze_time("2024-01-01 10:00:20"):
+            zaken_client.fetch_cases_by_kvk_or_rsin("12345678", vestigingsnummer="1234")
+
+        self.assertEqual(
+            [request.url.split("?")[0] for request in m.request_history],
+            [f"{ZAKEN_ROOT}zaken"],
+        )
+
+    def test_rol_notification_purges_cached_case_lists_from_kenmerken(
+        self, m, mock_handle: Mock
+    ):
+        data = MockAPIData().install_mocks(m)
+        m.get(f"{ZAKEN_ROOT}zaken", json=paginated_response([data.zaak]))
+        zaken_client = data.api_group.zaken_client
+        notification = NotificationFactory(
+            resource="rol",
+            resource_url=f"{ZAKEN_ROOT}rollen/aaaaaaaa-0004-aaaa-aaaa-aaaaaaaaaaaa",
+            hoofd_object=data.zaak["url"],
+            actie="create",
+            kenmerken={
+                "betrokkene_type": RolTypes.natuurlijk_persoon,
+                "betrokkene_identificatie": {"inp_bsn": data.user_initiator.bsn},
+            },
+        )
+
+        with freeze_time("2024-01-01 10:00:00"):
+            zaken_client.fetch_cases_by_bsn(data.user_initiator.bsn)
+
+        m.reset_mock()
+        with freeze_time("2024-01-01 10:00:10"):
+            handle_zaken_notification(notification)
+
+        # no requests on the webhook path
+        self.assertEqual(m.request_history, [])
+
+        with freeze_time("2024-01-01 10:00:20"):
+            zaken_client.fetch_cases_by_bsn(data.user_initiator.bsn)
+
+        self.assertEqual(
+            [request.url.split("?")[0] for request in m.request_history],
+            [f"{ZAKEN_ROOT}zaken"],
+        )
+
+    def test_zaak_notification_does_not_retrieve_roles(self, m, mock_handle: Mock):
+        data = MockAPIData().install_mocks(m)
+        notification = NotificationFactory(
+            resource="zaak",
+            resource_url=data.zaak["url"],
+            hoofd_object=data.zaak["url"],
+        )
+
+        handle_zaken_notification(notification)
+
+        self.assertEqual(m.request_history, [])
+        mock_handle.assert_not_called()
+
     def test_status_bails_when_bad_notification_channel(self, m, mock_handle: Mock):
         notification = NotificationFactory(kanaal="not_zaken")
         with self.assertRaisesRegex(
@@ -16,7 +16,10 @@ from open_inwoner.openzaak.tests.factories import (
 from open_inwoner.openzaak.tests.helpers import generate_oas_component_cached
 from open_inwoner.openzaak.tests.shared import ANOTHER_CATALOGI_ROOT, CATALOGI_ROOT
 from open_inwoner.openzaak.zgw_imports import (
+    CatalogiSnapshot,
     import_zaaktype_informatieobjecttype_configs,
+    import_zaaktype_resultaattype_configs,
+    import_zaaktype_statustype_configs,
 )
 from open_inwoner.utils.test import ClearCachesMixin, paginated_response
 
@@ -399,6 +402,18 @@ class ZGWImportTest(ClearCachesMixin, TestCase):
         self.clear_caches()
 
         for root in self.roots:
+            m.get(
+                f"{root}zaaktypen",
+                json=paginated_response(
+                    [
+                        data[root].zaaktype_aaa_1,
+                        data[root].zaaktype_bbb,
+                        data[root].zaaktype_aaa_2,
+                        data[root].zaaktype_aaa_intern,
+                        data[root].extra_zaaktype_aaa,
+                    ]
+                ),
+            )
             m.get(
                 f"{root}zaaktypen?identificatie=AAA&catalogus={root}catalogussen/aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa",
                 json=paginated_response(
@@ -465,3 +480,81 @@ class ZGWImportTest(ClearCachesMixin, TestCase):
                     UUID(data[root].extra_zaaktype_aaa["uuid"]),
                 },
             )
+
+    def _create_configs(self):
+        for root in self.roots:
+            ZaakTypeConfigFactory(
+                catalogus=CatalogusConfigFactory(
+                    url=f"{root}catalogussen/aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa",
+                    service=self.api_groups_for_root[root].ztc_service,
+                ),
+                identificatie="AAA",
+            )
+            ZaakTypeConfigFactory(
+                catalogus=CatalogusConfigFactory(
+                    url=f"{root}catalogussen/bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb",
+                    service=self.api_groups_for_root[root].ztc_service,
+                ),
+                identificatie="BBB",
+            )
+
+    def test_import_shares_a_single_zaaktypen_listing(self, m):
+        data = {
+            root: InformationObjectTypeMockData(root).install_mocks(m)
+            for root in self.roots
+        }
+        self._create_configs()
+
+        snapshot = CatalogiSnapshot.fetch()
+        import_zaaktype_informatieobjecttype_configs(snapshot)
+        import_zaaktype_statustype_configs(snapshot)
+        import_zaaktype_resultaattype_configs(snapshot)
+
+        for root in self.roots:
+            listing_requests = [
+                request
+                for request in m.request_history
+                if request.url.startswith(f"{root}zaaktypen")
+            ]
+            self.assertEqual(len(listing_requests), 1)
+
+            # the informatieobjecttype shared by the zaaktypen is fetched once
+            io_type_requests = [
+                request
+                for request in m.request_history
+                if request.url == data[root].info_type_aaa_1["url"]
+            ]
+            self.assertEqual(len(io_type_requests), 1)
+
+    def test_import_skips_unchanged_zaaktypen(self, m):
+        data = {
+            root: InformationObjectTypeMockData(root).install_mocks(m)
+            for root in self.roots
+        }
+        self._create_configs()
+
+        res = import_zaaktype_informatieobjecttype_configs()
+        self.assertEqual(len(res), 4)
+
+        m.reset_mock()
+        res = import_zaaktype_informatieobjecttype_configs()
+
+        # only the zaaktypen were listed
+        self.assertEqual(len(res), 0)
+        self.assertEqual(
+            {request.url.split("?")[0] for request in m.request_history},
+            {f"{root}zaaktypen" for root in self.roots},
+        )
+
+        # a full import fetches everything again, without changes
+        m.reset_mock()
+        res = import_zaaktype_informatieobjecttype_configs(
+            CatalogiSnapshot.fetch(incremental=False)
+        )
+
+        self.assertEqual(len(res), 0)
+        self.assertIn(
+            data[CATALOGI_ROOT].info_type_aaa_1["url"],
+            {request.url for request in m.request_history},
+        )
+        self.assertEqual(ZaakTypeInformatieObjectTypeConfig.objects.count(), 6)
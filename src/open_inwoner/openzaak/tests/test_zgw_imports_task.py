@@ -3,7 +3,7 @@ from unittest.mock import Mock, patch
 from django.test import TestCase
 
 from open_inwoner.celery import app as celery_app
-from open_inwoner.openzaak.tasks import import_zgw_data
+from open_inwoner.openzaak.tasks import import_zgw_data, warm_up_zgw_caches
 from open_inwoner.utils.test import ClearCachesMixin
 
 
@@ -26,3 +26,10 @@ class ZGWImportTest(ClearCachesMixin, TestCase):
 
         mock_call.assert_called_once()
         self.assertEqual(mock_call.call_args.args, ("zgw_import_data",))
+
+    @patch("open_inwoner.openzaak.tasks.call_command")
+    def test_zgw_warm_up_caches_task_calls_command(self, mock_call: Mock):
+        warm_up_zgw_caches()
+
+        mock_call.assert_called_once()
+        self.assertEqual(mock_call.call_args.args, ("zgw_warm_up_caches",))
@@ -1,12 +1,20 @@
 import logging
+from typing import TYPE_CHECKING
+
+from django.http import HttpRequest
 
 from zgw_consumers.api_models.constants import RolTypes, VertrouwelijkheidsAanduidingen
 
 from open_inwoner.kvk.branches import get_kvk_branch_number
 from open_inwoner.openzaak.api_models import InformatieObject, Rol, Zaak, ZaakType
+from open_inwoner.utils.request_cache import get_request_cache
 
+from .config_registry import zgw_config_registry
 from .models import OpenZaakConfig, ZaakTypeConfig, ZaakTypeInformatieObjectTypeConfig
 
+if TYPE_CHECKING:
+    from .clients import MultiZgwClientProxyResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -107,10 +115,7 @@ def get_role_name_display(rol: Rol) -> str:
 
 
 def get_zaak_type_config(case_type: ZaakType) -> ZaakTypeConfig | None:
-    try:
-        return ZaakTypeConfig.objects.filter_case_type(case_type).get()
-    except ZaakTypeConfig.DoesNotExist:
-        return None
+    return zgw_config_registry.get_zaaktype_config(case_type)
 
 
 def get_zaak_type_info_object_type_config(
@@ -118,12 +123,9 @@ def get_zaak_type_info_object_type_config(
     info_object_type_url: str,
 ) -> ZaakTypeInformatieObjectTypeConfig | None:
     assert isinstance(info_object_type_url, str)
-    try:
-        return ZaakTypeInformatieObjectTypeConfig.objects.get_for_case_and_info_type(
-            case_type, info_object_type_url
-        )
-    except ZaakTypeInformatieObjectTypeConfig.DoesNotExist:
-        return None
+    return zgw_config_registry.get_informatieobjecttype_config(
+        case_type, info_object_type_url
+    )
 
 
 def get_user_fetch_parameters(request, check_rsin: bool = True) -> dict:
@@ -153,3 +155,25 @@ def get_user_fetch_parameters(request, check_rsin: bool = True) -> dict:
         return parameters
 
     return {}
+
+
+def fetch_cases_for_request(
+    request: HttpRequest, **kwargs
+) -> "MultiZgwClientProxyResult":
+    """
+    Fetch the cases of the request's user from all configured Zaken APIs
+
+    The result is memoized for the duration of the request, so repeated calls with the
+    same parameters (e.g. from multiple plugins on a page) only fetch once.
+    """
+    from .clients import MultiZgwClientProxy, build_zaken_clients
+
+    params = {**get_user_fetch_parameters(request), **kwargs}
+
+    def fetch_cases():
+        proxy = MultiZgwClientProxy(build_zaken_clients())
+        return proxy.fetch_cases(**params)
+
+    return get_request_cache(request).get_or_set(
+        ("zaken:fetch_cases", tuple(sorted(params.items()))), fetch_cases
+    )
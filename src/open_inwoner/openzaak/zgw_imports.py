@@ -1,21 +1,25 @@
+import hashlib
+import json
 import logging
 from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
 
-from django.db import transaction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
 
-from zgw_consumers.api_models.catalogi import (
-    InformatieObjectType,
-    ResultaatType,
-    StatusType,
-)
+from zgw_consumers.concurrent import parallel
 
 from open_inwoner.openzaak.api_models import ZaakType
 from open_inwoner.openzaak.clients import (
     CatalogiClient,
     MultiZgwClientProxy,
+    MultiZgwClientProxyResult,
     build_catalogi_clients,
-    build_zgw_client_from_service,
 )
+from open_inwoner.openzaak.config_registry import zgw_config_registry
 from open_inwoner.openzaak.models import (
     CatalogusConfig,
     ZaakTypeConfig,
@@ -31,19 +35,53 @@ def filter_zaaktypes(case_types: list[ZaakType]) -> list[ZaakType]:
     return [c for c in case_types if c.indicatie_intern_of_extern == "extern"]
 
 
-def get_configurable_zaaktypes(case_types: list[ZaakType]) -> list[ZaakType]:
-    case_types = filter_zaaktypes(case_types)
-    return case_types
+def _log_failing_responses(result: MultiZgwClientProxyResult):
+    for response in result.failing_responses:
+        logger.exception(
+            "Client %s encountered an exception. Import will continue, for any other configured clients",
+            response.client,
+            exc_info=response.exception,
+        )
+
+
+@dataclass
+class CatalogiSnapshot:
+    """
+    The zaaktypen of all catalogi services, fetched once (concurrently) and shared by
+    the phases of an import
 
+    With `incremental`, the sub-resource phases skip the ZaakTypeConfigs of which the
+    zaaktypen (by `versiedatum` and the hash of their data) and the imported configs
+    did not change since the previous import.
+    """
 
-def get_configurable_zaaktypes_by_identification(
-    client: CatalogiClient, identificatie, catalogus_url
-) -> list[ZaakType]:
-    case_types = client.fetch_case_types_by_identification_no_cache(
-        identificatie, catalogus_url
-    )
-    case_types = filter_zaaktypes(case_types)
-    return case_types
+    result: MultiZgwClientProxyResult
+    incremental: bool = True
+    clients: dict[int, CatalogiClient] = field(default_factory=dict)
+    zaak_types: dict[tuple[str, str], list[ZaakType]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for response in self.result.successful_responses:
+            self.clients[response.client.configured_from.pk] = response.client
+            for zaak_type in filter_zaaktypes(response.result):
+                key = (zaak_type.catalogus, zaak_type.identificatie)
+                self.zaak_types.setdefault(key, []).append(zaak_type)
+
+    @classmethod
+    def fetch(cls, incremental: bool = True) -> "CatalogiSnapshot":
+        proxy = MultiZgwClientProxy(build_catalogi_clients())
+        result = proxy.fetch_zaaktypes_no_cache()
+        _log_failing_responses(result)
+        return cls(result=result, incremental=incremental)
+
+    def get_zaak_types(self, ztc: ZaakTypeConfig) -> list[ZaakType]:
+        """
+        Return the (configurable) zaaktypen collapsed into the ZaakTypeConfig
+        """
+        return self.zaak_types.get((ztc.catalogus.url, ztc.identificatie), [])
+
+    def get_client(self, ztc: ZaakTypeConfig) -> CatalogiClient | None:
+        return self.clients.get(ztc.catalogus.service_id)
 
 
 def import_catalog_configs() -> list[CatalogusConfig]:
@@ -55,13 +93,7 @@ def import_catalog_configs() -> list[CatalogusConfig]:
     proxy = MultiZgwClientProxy(build_catalogi_clients())
     result = proxy.fetch_catalogs_no_cache()
 
-    if result.has_errors:
-        for response in result.failing_responses:
-            logger.exception(
-                "Client %s encountered an exception. Import will continue, for any other configured clients",
-                response.client,
-                exc_info=response.exception,
-            )
+    _log_failing_responses(result)
 
     if not result.join_results():
         return []
@@ -85,28 +117,22 @@ def import_catalog_configs() -> list[CatalogusConfig]:
 
         if create:
             CatalogusConfig.objects.bulk_create(create)
+            # bulk operations don't send the signals that invalidate the registry
+            transaction.on_commit(zgw_config_registry.invalidate)
 
     return create
 
 
-def import_zaaktype_configs() -> list[ZaakTypeConfig]:
+def import_zaaktype_configs(
+    snapshot: CatalogiSnapshot | None = None,
+) -> list[ZaakTypeConfig]:
     """
     generate a ZaakTypeConfig for every ZaakType.identificatie in the ZGW API
 
     this collapses individual ZaakType versions on their identificatie and catalog
     """
-    proxy = MultiZgwClientProxy(build_catalogi_clients())
-    result = proxy.fetch_zaaktypes_no_cache()
-
-    if result.has_errors:
-        for response in result.failing_responses:
-            logger.exception(
-                "Client %s encountered an exception. Import will continue, for any other configured clients",
-                response.client,
-                exc_info=response.exception,
-            )
-
-    zaak_types = filter_zaaktypes(result.join_results())
+    snapshot = snapshot or CatalogiSnapshot.fetch()
+    zaak_types = filter_zaaktypes(snapshot.result.join_results())
     create = {}
 
     with transaction.atomic():
@@ -140,268 +166,229 @@ def import_zaaktype_configs() -> list[ZaakTypeConfig]:
 
         if create:
             ZaakTypeConfig.objects.bulk_create(list(create.values()))
+            transaction.on_commit(zgw_config_registry.invalidate)
 
     return list((create or {}).values())
 
 
-def import_zaaktype_informatieobjecttype_configs() -> (
-    list[tuple[ZaakTypeConfig, InformatieObjectType]]
-):
+@dataclass(frozen=True)
+class SubResourceImport:
     """
-    generate ZaakTypeInformatieObjectTypeConfigs for all ZaakTypeConfig
+    The import of the configs for a type of sub-resource of the zaaktypen (e.g. the
+    statustypen)
     """
-    created = []
-    for ztc in ZaakTypeConfig.objects.all():
-        imported = import_zaaktype_informatieobjecttype_configs_for_type(ztc)
-        if imported:
-            created.append((ztc, imported))
-    return created
 
+    name: str
+    # the attribute of the ZaakType with the urls of the sub-resources
+    zaaktype_attr: str
+    model: type[models.Model]
+    url_field: str
+    fetch: Callable[[CatalogiClient, str], Any]
+    build: Callable[[ZaakTypeConfig, Any, list[ZaakType]], models.Model]
+
+
+INFORMATIEOBJECTTYPE_IMPORT = SubResourceImport(
+    name="informatieobjecttypen",
+    zaaktype_attr="informatieobjecttypen",
+    model=ZaakTypeInformatieObjectTypeConfig,
+    url_field="informatieobjecttype_url",
+    fetch=CatalogiClient.fetch_single_information_object_type,
+    build=lambda ztc, info_type, using_zaak_types: ZaakTypeInformatieObjectTypeConfig(
+        zaaktype_config=ztc,
+        informatieobjecttype_url=info_type.url,
+        omschrijving=info_type.omschrijving,
+        zaaktype_uuids=[zt.uuid for zt in using_zaak_types],
+    ),
+)
+STATUSTYPE_IMPORT = SubResourceImport(
+    name="statustypen",
+    zaaktype_attr="statustypen",
+    model=ZaakTypeStatusTypeConfig,
+    url_field="statustype_url",
+    fetch=CatalogiClient.fetch_single_status_type,
+    build=lambda ztc, status_type, using_zaak_types: ZaakTypeStatusTypeConfig(
+        zaaktype_config=ztc,
+        statustype_url=status_type.url,
+        omschrijving=status_type.omschrijving,
+        statustekst=status_type.statustekst,
+        zaaktype_uuids=[zt.uuid for zt in using_zaak_types],
+    ),
+)
+RESULTAATTYPE_IMPORT = SubResourceImport(
+    name="resultaattypen",
+    zaaktype_attr="resultaattypen",
+    model=ZaakTypeResultaatTypeConfig,
+    url_field="resultaattype_url",
+    fetch=CatalogiClient.fetch_single_resultaat_type,
+    build=lambda ztc, resultaat_type, using_zaak_types: ZaakTypeResultaatTypeConfig(
+        zaaktype_config=ztc,
+        resultaattype_url=resultaat_type.url,
+        omschrijving=resultaat_type.omschrijving,
+        zaaktype_uuids=[zt.uuid for zt in using_zaak_types],
+    ),
+)
 
-def import_zaaktype_statustype_configs() -> list[tuple[ZaakTypeConfig, StatusType]]:
-    """
-    generate ZaakTypeStatusTypeConfigs for all ZaakTypeConfig
-    """
-    created = []
-    for ztc in ZaakTypeConfig.objects.all():
-        imported = import_statustype_configs_for_type(ztc)
-        if imported:
-            created.append((ztc, imported))
-    return created
+# the fingerprints only skip work, so losing them to an eviction is harmless
+IMPORT_FINGERPRINT_TIMEOUT = 60 * 60 * 24 * 30
 
 
-def import_zaaktype_resultaattype_configs() -> (
-    list[tuple[ZaakTypeConfig, ResultaatType]]
-):
-    """
-    generate ZaakTypeResultaatTypeConfigs for all ZaakTypeConfig
-    """
-    created = []
-    for ztc in ZaakTypeConfig.objects.all():
-        imported = import_resultaattype_configs_for_type(ztc)
-        if imported:
-            created.append((ztc, imported))
-    return created
+def _get_fingerprint_cache_key(spec: SubResourceImport, ztc: ZaakTypeConfig) -> str:
+    return f"openzaak:import_fingerprint:{spec.name}:{ztc.pk}"
 
 
-def import_zaaktype_informatieobjecttype_configs_for_type(
-    ztc: ZaakTypeConfig,
-) -> list[ZaakTypeInformatieObjectTypeConfig]:
+def _get_fingerprint(zaak_types: list[ZaakType], configs: list[models.Model]) -> str:
     """
-    generate ZaakTypeInformatieObjectTypeConfigs for all InformationObjectTypes used by each ZaakTypeConfigs source ZaakTypes
-
-    this is a bit complicated because one ZaakTypeConfig can represent multiple ZaakTypes
+    Fingerprint of the zaaktypen (by `versiedatum` and the hash of their data) and the
+    existing configs of a ZaakTypeConfig
     """
-    client = build_zgw_client_from_service(ztc.catalogus.service)
-    if not client:
-        logger.warning(
-            "Not importing zaaktype-informatieobjecttype configs: could not build Catalogi API client"
-        )
-        return []
-
-    # grab actual ZaakTypes for this identificatie
-    zaak_types: list[ZaakType] = get_configurable_zaaktypes_by_identification(
-        client, ztc.identificatie, ztc.catalogus_url
-    )
-    if not zaak_types:
-        return []
-
-    create = []
-    update = []
-
-    with transaction.atomic():
-        # map existing config records by url
-        info_map = {
-            ztiotc.informatieobjecttype_url: ztiotc
-            for ztiotc in ztc.zaaktypeinformatieobjecttypeconfig_set.all()
-        }
-
-        # collect and implicitly de-duplicate informatieobjecttype url's and track which zaaktype used it
-        info_queue = defaultdict(list)
-        for zaak_type in zaak_types:
-            for url in zaak_type.informatieobjecttypen:
-                info_queue[url].append(zaak_type)
-
-        if info_queue:
-            # load urls and update/create records
-            for iot_url, using_zaak_types in info_queue.items():
-                info_type = client.fetch_single_information_object_type(iot_url)
-
-                ztiotc = info_map.get(info_type.url)
-                if ztiotc:
-                    # we got a record for this, see if we got data to update
-                    for using in using_zaak_types:
-                        # track which zaaktype UUID's are interested in this informationobjecttype
-                        if using.uuid not in ztiotc.zaaktype_uuids:
-                            ztiotc.zaaktype_uuids.append(using.uuid)
-                            if ztiotc not in create:
-                                update.append(ztiotc)
-                else:
-                    # new record
-                    ztiotc = ZaakTypeInformatieObjectTypeConfig(
-                        zaaktype_config=ztc,
-                        informatieobjecttype_url=info_type.url,
-                        omschrijving=info_type.omschrijving,
-                        zaaktype_uuids=[zt.uuid for zt in using_zaak_types],
-                    )
-                    create.append(ztiotc)
-                    # not strictly necessary but let's be accurate
-                    info_map[info_type.uuid] = ztiotc
-
-        if create:
-            ZaakTypeInformatieObjectTypeConfig.objects.bulk_create(create)
-        if update:
-            ZaakTypeInformatieObjectTypeConfig.objects.bulk_update(
-                update, ["zaaktype_uuids"]
+    data = [
+        sorted(
+            (
+                zaak_type.url,
+                str(zaak_type.versiedatum),
+                hashlib.sha256(repr(zaak_type).encode()).hexdigest(),
             )
-
-    return create
-
-
-def import_statustype_configs_for_type(
-    ztc: ZaakTypeConfig,
-) -> list[ZaakTypeStatusTypeConfig]:
+            for zaak_type in zaak_types
+        ),
+        sorted(
+            (config.pk, sorted(map(str, config.zaaktype_uuids))) for config in configs
+        ),
+    ]
+    return hashlib.sha256(json.dumps(data).encode()).hexdigest()
+
+
+def import_sub_resource_configs(
+    spec: SubResourceImport, snapshot: CatalogiSnapshot | None = None
+) -> list[tuple[ZaakTypeConfig, list[models.Model]]]:
     """
-    generate ZaakTypeStatusTypeConfigs for all StatusTypes used by each ZaakTypeConfigs source ZaakTypes
+    generate the configs of a type of sub-resource for all ZaakTypeConfigs
 
-    this is a bit complicated because one ZaakTypeConfig can represent multiple ZaakTypes
+    one ZaakTypeConfig can represent multiple ZaakTypes: the configs track the UUIDs
+    of the ZaakTypes using the sub-resource. The sub-resources of all ZaakTypeConfigs
+    are fetched concurrently.
     """
-    client = build_zgw_client_from_service(ztc.catalogus.service)
-    if not client:
-        logger.warning(
-            "Not importing statustype configs: could not build Catalogi API client"
-        )
-        return []
+    snapshot = snapshot or CatalogiSnapshot.fetch()
+
+    ztcs = list(ZaakTypeConfig.objects.select_related("catalogus"))
+    existing = defaultdict(dict)
+    for config in spec.model.objects.filter(zaaktype_config__in=ztcs):
+        existing[config.zaaktype_config_id][getattr(config, spec.url_field)] = config
+
+    # collect the (changed) ZaakTypeConfigs and de-duplicated sub-resource urls
+    queues: list[tuple[ZaakTypeConfig, dict[str, list[ZaakType]], str]] = []
+    fetch_urls: dict[str, CatalogiClient] = {}
+    for ztc in ztcs:
+        if not (zaak_types := snapshot.get_zaak_types(ztc)):
+            continue
+        if not (client := snapshot.get_client(ztc)):
+            logger.warning(
+                "Not importing zaaktype-%s configs for %s: could not build Catalogi API client",
+                spec.name,
+                ztc,
+            )
+            continue
 
-    # grab actual ZaakTypes for this identificatie
-    zaak_types: list[ZaakType] = get_configurable_zaaktypes_by_identification(
-        client, ztc.identificatie, ztc.catalogus_url
-    )
-    if not zaak_types:
-        return []
+        fingerprint = _get_fingerprint(zaak_types, existing[ztc.pk].values())
+        if (
+            snapshot.incremental
+            and cache.get(_get_fingerprint_cache_key(spec, ztc)) == fingerprint
+        ):
+            continue
 
-    create = []
-    update = []
+        # track which zaaktypen use each sub-resource
+        queue = defaultdict(list)
+        for zaak_type in zaak_types:
+            for url in getattr(zaak_type, spec.zaaktype_attr) or []:
+                queue[url].append(zaak_type)
+                fetch_urls[url] = client
+        queues.append((ztc, queue, fingerprint))
 
-    with transaction.atomic():
-        # map existing config records by url
+    def fetch(url: str):
+        return spec.fetch(fetch_urls[url], url)
 
-        info_map = {
-            zaaktype_statustype.statustype_url: zaaktype_statustype
-            for zaaktype_statustype in ztc.zaaktypestatustypeconfig_set.all()
-        }
+    with parallel(max_workers=settings.ZGW_IMPORT_MAX_CONCURRENCY) as executor:
+        resources = dict(zip(fetch_urls, executor.map(fetch, fetch_urls)))
 
-        # collect and implicitly de-duplicate statustype url's and track which zaaktype used it
-        info_queue = defaultdict(list)
-        for zaak_type in zaak_types:
-            for url in zaak_type.statustypen:
-                info_queue[url].append(zaak_type)
-
-        if info_queue:
-            # load urls and update/create records
-            for statustype_url, using_zaak_types in info_queue.items():
-                status_type = client.fetch_single_status_type(statustype_url)
-                if not status_type:  # Statustype isn't available anymore?
-                    continue
+    created = []
+    create = []
+    update = {}
+    fingerprints = {}
+    for ztc, queue, fingerprint in queues:
+        configs = existing[ztc.pk]
+        created_for_type = []
+        complete = True
+        for url, using_zaak_types in queue.items():
+            if not (resource := resources[url]):  # not available (anymore)?
+                complete = False
+                continue
+
+            if config := configs.get(resource.url):
+                # track which zaaktype UUID's are interested in this sub-resource
+                known_uuids = set(config.zaaktype_uuids)
+                for using in using_zaak_types:
+                    if using.uuid not in known_uuids:
+                        known_uuids.add(using.uuid)
+                        config.zaaktype_uuids.append(using.uuid)
+                        if config.pk:
+                            update[config.pk] = config
+            else:
+                config = configs[resource.url] = spec.build(
+                    ztc, resource, using_zaak_types
+                )
+                created_for_type.append(config)
 
-                zaaktype_statustype = info_map.get(status_type.url)
-                if zaaktype_statustype:
-                    # we got a record for this, see if we got data to update
-                    for using in using_zaak_types:
-                        # track which zaaktype UUID's are interested in this statustype
-                        if using.uuid not in zaaktype_statustype.zaaktype_uuids:
-                            zaaktype_statustype.zaaktype_uuids.append(using.uuid)
-                            if zaaktype_statustype not in create:
-                                update.append(zaaktype_statustype)
-                else:
-                    # new record
-                    zaaktype_statustype = ZaakTypeStatusTypeConfig(
-                        zaaktype_config=ztc,
-                        statustype_url=status_type.url,
-                        omschrijving=status_type.omschrijving,
-                        statustekst=status_type.statustekst,
-                        zaaktype_uuids=[zt.uuid for zt in using_zaak_types],
-                    )
-                    create.append(zaaktype_statustype)
-                    # not strictly necessary but let's be accurate
-                    info_map[status_type.uuid] = zaaktype_statustype
+        if created_for_type:
+            create += created_for_type
+            created.append((ztc, created_for_type))
+        # retry the sub-resources that could not be fetched on the next import
+        if complete:
+            fingerprints[ztc] = fingerprint
 
+    with transaction.atomic():
         if create:
-            ZaakTypeStatusTypeConfig.objects.bulk_create(create)
+            spec.model.objects.bulk_create(create)
         if update:
-            ZaakTypeStatusTypeConfig.objects.bulk_update(update, ["zaaktype_uuids"])
+            spec.model.objects.bulk_update(update.values(), ["zaaktype_uuids"])
+        if create or update:
+            transaction.on_commit(zgw_config_registry.invalidate)
+
+    # the fingerprints of the resulting state, so the next import skips them
+    for ztc, fingerprint in fingerprints.items():
+        if create or update:
+            fingerprint = _get_fingerprint(
+                snapshot.get_zaak_types(ztc), existing[ztc.pk].values()
+            )
+        cache.set(
+            _get_fingerprint_cache_key(spec, ztc),
+            fingerprint,
+            timeout=IMPORT_FINGERPRINT_TIMEOUT,
+        )
 
-    return create
+    return created
 
 
-def import_resultaattype_configs_for_type(
-    ztc: ZaakTypeConfig,
-) -> list[ZaakTypeResultaatTypeConfig]:
+def import_zaaktype_informatieobjecttype_configs(
+    snapshot: CatalogiSnapshot | None = None,
+) -> list[tuple[ZaakTypeConfig, list[ZaakTypeInformatieObjectTypeConfig]]]:
     """
-    generate ZaakTypeResultaatTypeConfigs for all ResultaatTypes used by each ZaakTypeConfigs source ZaakTypes
-
-    this is a bit complicated because one ZaakTypeConfig can represent multiple ZaakTypes
+    generate ZaakTypeInformatieObjectTypeConfigs for all ZaakTypeConfig
     """
-    client = build_zgw_client_from_service(ztc.catalogus.service)
-    if not client:
-        logger.warning(
-            "Not importing resultaattype configs: could not build Catalogi API client"
-        )
-        return []
+    return import_sub_resource_configs(INFORMATIEOBJECTTYPE_IMPORT, snapshot)
 
-    # grab actual ZaakTypes for this identificatie
-    zaak_types: list[ZaakType] = get_configurable_zaaktypes_by_identification(
-        client, ztc.identificatie, ztc.catalogus_url
-    )
-    if not zaak_types:
-        return []
 
-    create = []
-    update = []
-
-    with transaction.atomic():
-        # map existing config records by url
-
-        info_map = {
-            zaaktype_resultaattype.resultaattype_url: zaaktype_resultaattype
-            for zaaktype_resultaattype in ztc.zaaktyperesultaattypeconfig_set.all()
-        }
-
-        # collect and implicitly de-duplicate resultaattype url's and track which zaaktype used it
-        info_queue = defaultdict(list)
-        for zaak_type in zaak_types:
-            for url in zaak_type.resultaattypen:
-                info_queue[url].append(zaak_type)
-
-        if info_queue:
-            # load urls and update/create records
-            for resultaattype_url, using_zaak_types in info_queue.items():
-                resultaat_type = client.fetch_single_resultaat_type(resultaattype_url)
-
-                zaaktype_resultaattype = info_map.get(resultaat_type.url)
-                if zaaktype_resultaattype:
-                    # we got a record for this, see if we got data to update
-                    for using in using_zaak_types:
-                        # track which zaaktype UUID's are interested in this resultaattype
-                        if using.uuid not in zaaktype_resultaattype.zaaktype_uuids:
-                            zaaktype_resultaattype.zaaktype_uuids.append(using.uuid)
-                            if zaaktype_resultaattype not in create:
-                                update.append(zaaktype_resultaattype)
-                else:
-                    # new record
-                    zaaktype_resultaattype = ZaakTypeResultaatTypeConfig(
-                        zaaktype_config=ztc,
-                        resultaattype_url=resultaat_type.url,
-                        omschrijving=resultaat_type.omschrijving,
-                        zaaktype_uuids=[zt.uuid for zt in using_zaak_types],
-                    )
-                    create.append(zaaktype_resultaattype)
-                    # not strictly necessary but let's be accurate
-                    info_map[resultaat_type.uuid] = zaaktype_resultaattype
+def import_zaaktype_statustype_configs(
+    snapshot: CatalogiSnapshot | None = None,
+) -> list[tuple[ZaakTypeConfig, list[ZaakTypeStatusTypeConfig]]]:
+    """
+    generate ZaakTypeStatusTypeConfigs for all ZaakTypeConfig
+    """
+    return import_sub_resource_configs(STATUSTYPE_IMPORT, snapshot)
 
-        if create:
-            ZaakTypeResultaatTypeConfig.objects.bulk_create(create)
-        if update:
-            ZaakTypeResultaatTypeConfig.objects.bulk_update(update, ["zaaktype_uuids"])
 
-    return create
+def import_zaaktype_resultaattype_configs(
+    snapshot: CatalogiSnapshot | None = None,
+) -> list[tuple[ZaakTypeConfig, list[ZaakTypeResultaatTypeConfig]]]:
+    """
+    generate ZaakTypeResultaatTypeConfigs for all ZaakTypeConfig
+    """
+    return import_sub_resource_configs(RESULTAATTYPE_IMPORT, snapshot)
@@ -9,9 +9,8 @@ from treebeard.mp_tree import MP_NodeQuerySet
 from open_inwoner.accounts.models import User
 from open_inwoner.configurations.models import SiteConfiguration
 from open_inwoner.openzaak.api_models import Zaak
-from open_inwoner.openzaak.clients import MultiZgwClientProxy, build_zaken_clients
 from open_inwoner.openzaak.models import ZaakTypeConfig
-from open_inwoner.openzaak.utils import get_user_fetch_parameters
+from open_inwoner.openzaak.utils import fetch_cases_for_request
 
 
 class ProductQueryset(models.QuerySet):
@@ -54,9 +53,7 @@ class CategoryPublishedQueryset(MP_NodeQuerySet):
         if not request.user.bsn and not request.user.kvk:
             return self
 
-        clients = build_zaken_clients()
-        proxy_result = MultiZgwClientProxy(clients)
-        proxy_result = proxy_result.fetch_cases(**get_user_fetch_parameters(request))
+        proxy_result = fetch_cases_for_request(request)
         if proxy_result.has_errors:
             self.log_system_action("unable to retrieve cases", user=request.user)
 
@@ -11,9 +11,11 @@ from django.views.generic import FormView
 from furl import furl
 
 from open_inwoner.configurations.models import SiteConfiguration
-from open_inwoner.openzaak.clients import MultiZgwClientProxy, build_zaken_clients
 from open_inwoner.openzaak.models import ZGWApiGroupConfig
-from open_inwoner.openzaak.utils import get_user_fetch_parameters
+from open_inwoner.openzaak.utils import (
+    fetch_cases_for_request,
+    get_user_fetch_parameters,
+)
 from open_inwoner.utils.mixins import PaginationMixin
 from open_inwoner.utils.views import CommonPageMixin, LoginMaybeRequiredMixin, LogMixin
 
@@ -68,13 +70,8 @@ class SearchView(
             self.log_user_action(user, _("search query: {query}").format(query=query))
 
         # Check if the query exactly matches with a case that belongs to the user
-        if search_params := get_user_fetch_parameters(self.request):
-            clients = build_zaken_clients()
-            proxy_result = MultiZgwClientProxy(clients)
-            proxy_result = proxy_result.fetch_cases(
-                **search_params,
-                identificatie=query,
-            )
+        if get_user_fetch_parameters(self.request):
+            proxy_result = fetch_cases_for_request(self.request, identificatie=query)
             if proxy_result.has_errors:
                 self.log_system_action("unable to retrieve cases", user=user)
 
@@ -8,6 +8,7 @@ from django.utils.translation import gettext_lazy as _
 
 from open_inwoner.accounts.models import User
 from open_inwoner.openzaak.api_models import Status, Zaak
+from open_inwoner.openzaak.config_registry import zgw_config_registry
 from open_inwoner.openzaak.models import ZaakTypeStatusTypeConfig, ZGWApiGroupConfig
 from open_inwoner.userfeed.adapter import FeedItem
 from open_inwoner.userfeed.adapters import register_item_adapter
@@ -34,7 +35,9 @@ def case_status_notification_received(user: User, case: Zaak, status: Status):
     }
 
     action_required = False
-    status_config = ZaakTypeStatusTypeConfig.objects.find_for(case, status)
+    status_config = zgw_config_registry.find_statustype_config(
+        case.zaaktype, status.statustype.url
+    )
     if status_config:
         action_required = status_config.action_required
 
@@ -79,7 +82,7 @@ class CaseStatusUpdateFeedItem(FeedItem):
     def __init__(self, data: FeedItemData):
         super().__init__(data)
 
-        self.status_config = ZaakTypeStatusTypeConfig.objects.find_for_types_from_str(
+        self.status_config = zgw_config_registry.find_statustype_config_from_str(
             self.get_data("catalogus_url"),
             self.get_data("case_type_identificatie"),
             self.get_data("status_type_url"),
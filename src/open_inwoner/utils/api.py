@@ -1,10 +1,16 @@
 import logging
+import math
+import re
 from datetime import datetime
 from ipaddress import IPv4Address, IPv6Address
 from typing import Any
 
+from django.conf import settings
+
 import requests
+from ape_pie.client import APIClient
 from pydantic_core import Url
+from zgw_consumers.concurrent import parallel
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +37,107 @@ def get_json_response(response: requests.Response) -> dict | None:
     return response_json
 
 
+PAGE_NUMBER_RE = re.compile(r"(?<=[?&]page=)\d+")
+
+
+def get_page_urls(paginated_data: dict, max_requests: int | None = None) -> list[str]:
+    """
+    Derive the URLs of the remaining pages from the `count` and `next` link of the
+    first page of a (page number) paginated response
+
+    An empty list is returned if the URLs cannot be derived, e.g. when the API does
+    not return a `count`.
+    """
+    count = paginated_data.get("count")
+    page_size = len(paginated_data.get("results") or [])
+    next_url = paginated_data.get("next")
+    if not (next_url and count and page_size):
+        return []
+
+    if not (match := PAGE_NUMBER_RE.search(next_url)):
+        return []
+
+    pages = range(int(match.group()), math.ceil(count / page_size) + 1)
+    if max_requests:
+        pages = pages[:max_requests]
+
+    return [
+        PAGE_NUMBER_RE.sub(str(page), next_url, count=1) if index else next_url
+        for index, page in enumerate(pages)
+    ]
+
+
+def merge_page_results(results: list[dict], pages: list[dict]):
+    """
+    Add the results of the concurrently fetched `pages` to `results`
+
+    Results that moved to another page between the requests are added once.
+    """
+    seen_urls = {result.get("url") for result in results}
+    for page in pages:
+        for result in page["results"]:
+            url = result.get("url")
+            if url and url in seen_urls:
+                continue
+            seen_urls.add(url)
+            results.append(result)
+
+
+def _get_page(client: APIClient, url: str, **kwargs) -> dict:
+    response = client.get(url, **kwargs)
+    response.raise_for_status()
+    return response.json()
+
+
+def parallel_pagination_helper(
+    client: APIClient,
+    paginated_data: dict,
+    max_requests: int | None = None,
+    max_workers: int | None = None,
+    **kwargs,
+) -> list[dict]:
+    """
+    Fetch all results of a paginated API endpoint, like `zgw_consumers`'
+    `pagination_helper`, but request the remaining pages concurrently
+
+    The page URLs are derived from the `count` of the first page. If the API does not
+    return a `count`, or the results changed between requests so there are more pages
+    than expected, the `next` links are followed one after another. The number of
+    requests for the remaining pages can be limited with `max_requests`.
+    """
+    results = list(paginated_data["results"])
+    next_url = paginated_data.get("next")
+    num_requests = 0
+
+    if len(page_urls := get_page_urls(paginated_data, max_requests)) > 1:
+        with parallel(
+            max_workers=max_workers or settings.ZGW_PAGINATION_MAX_CONCURRENCY
+        ) as executor:
+            pages = list(
+                executor.map(lambda url: _get_page(client, url, **kwargs), page_urls)
+            )
+
+        merge_page_results(results, pages)
+
+        num_requests = len(page_urls)
+        next_url = pages[-1].get("next")
+
+    while next_url:
+        if max_requests and num_requests >= max_requests:
+            logger.info(
+                "Number of requests while retrieving paginated results reached "
+                "maximum of %s requests, returning results",
+                max_requests,
+            )
+            break
+        page = _get_page(client, next_url, **kwargs)
+        num_requests += 1
+        results.extend(page["results"])
+        next_url = page.get("next")
+
+    return results
+
+
 class JSONEncoderMixin:
     def model_dump(self, **kwargs):
         """
@@ -0,0 +1,59 @@
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+
+TAG_KEY_PREFIX = "cache_tag"
+
+
+@dataclass(frozen=True)
+class TaggedValue:
+    """
+    A cached value, with the time its computation started
+    """
+
+    created_at: float
+    value: Any
+
+
+def get_tag_key(tag: str) -> str:
+    return f"{TAG_KEY_PREFIX}:{tag}"
+
+
+def unpack_tagged_value(
+    values: dict, cache_key: str, tag_keys: list[str], default=None
+):
+    """
+    Return the value for `cache_key` from the result of `cache.get_many()`, or
+    `default` if it is missing or one of its tags was purged after it was computed
+    """
+    entry = values.get(cache_key)
+    if not isinstance(entry, TaggedValue):
+        return default
+
+    for tag_key in tag_keys:
+        purged_at = values.get(tag_key)
+        if purged_at is not None and purged_at > entry.created_at:
+            return default
+
+    return entry.value
+
+
+def purge_cache_tags(*tags: str, alias: str = "default"):
+    """
+    Invalidate all values cached with one of `tags` (see the `tags` argument of the
+    `open_inwoner.utils.decorators.cache` decorator)
+
+    Instead of tracking the keys for every tag, the time of the purge is stored: values
+    computed before it are ignored. The purge is kept for `settings.CACHE_TAG_TIMEOUT`
+    seconds, which should be at least the timeout of the tagged values.
+    """
+    if not tags:
+        return
+
+    now = time.time()
+    caches[alias].set_many(
+        {get_tag_key(tag): now for tag in tags}, timeout=settings.CACHE_TAG_TIMEOUT
+    )
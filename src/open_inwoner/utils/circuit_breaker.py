@@ -0,0 +1,221 @@
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models
+from django.utils.html import format_html_join
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy as _
+
+import httpx
+from asgiref.sync import sync_to_async
+from requests import ConnectionError, RequestException, Response
+from zgw_consumers.models import Service
+
+from .outbound import OutboundCapacityError
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(models.TextChoices):
+    closed = "closed", _("Closed (available)")
+    open = "open", _("Open (unavailable)")
+    half_open = "half_open", _("Half-open (testing availability)")
+
+
+class CircuitOpenError(ConnectionError):
+    """
+    The backend is considered unavailable, the request was not sent
+
+    Subclasses `requests.ConnectionError`, so it is handled like an unavailable backend.
+    """
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a backend, with the state shared between processes through
+    the cache
+
+    After `failure_threshold` consecutive failures (connection errors, timeouts and
+    5xx responses) the circuit opens, and requests fail immediately with a
+    `CircuitOpenError`. After `reset_timeout` seconds the circuit is half-open: a single
+    request (across processes) is let through to probe the backend, which closes the
+    circuit on success or opens it again on failure.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        failure_threshold: int,
+        reset_timeout: int,
+        alias: str = "default",
+    ):
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.alias = alias
+
+        self.failures_key = f"circuit_breaker:{key}:failures"
+        self.opened_at_key = f"circuit_breaker:{key}:opened_at"
+        self.probe_key = f"circuit_breaker:{key}:probe"
+
+    @classmethod
+    def for_service(cls, service: Service) -> "CircuitBreaker":
+        return cls(
+            f"service:{service.pk}",
+            failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=settings.CIRCUIT_BREAKER_RESET_TIMEOUT,
+        )
+
+    @property
+    def _cache(self):
+        return caches[self.alias]
+
+    def _get_state(self, opened_at: float | None) -> CircuitState:
+        if opened_at is None:
+            return CircuitState.closed
+        if time.time() - opened_at < self.reset_timeout:
+            return CircuitState.open
+        return CircuitState.half_open
+
+    def get_state(self) -> CircuitState:
+        return self._get_state(self._cache.get(self.opened_at_key))
+
+    def before_request(self) -> bool:
+        """
+        Raise `CircuitOpenError` if the request should not be sent
+
+        Returns whether the circuit had recorded failures, which have to be reset when
+        the request succeeds.
+        """
+        values = self._cache.get_many([self.failures_key, self.opened_at_key])
+        state = self._get_state(values.get(self.opened_at_key))
+
+        if state == CircuitState.open or (
+            state == CircuitState.half_open
+            # only one probe at a time
+            and not self._cache.add(self.probe_key, True, timeout=self.reset_timeout)
+        ):
+            raise CircuitOpenError(f"Circuit for {self.key} is open")
+
+        return state == CircuitState.half_open or bool(values.get(self.failures_key))
+
+    def record_success(self, had_failures: bool):
+        if not had_failures:
+            return
+
+        if self._cache.get(self.opened_at_key) is not None:
+            logger.info("Closing the circuit for %s", self.key)
+        self._cache.delete_many([self.failures_key, self.opened_at_key, self.probe_key])
+
+    def record_failure(self):
+        self._cache.add(self.failures_key, 0, timeout=None)
+        try:
+            failures = self._cache.incr(self.failures_key)
+        except ValueError:
+            # expired or evicted in the meantime
+            failures = 1
+            self._cache.set(self.failures_key, failures, timeout=None)
+
+        if failures >= self.failure_threshold:
+            if failures == self.failure_threshold:
+                logger.warning(
+                    "Opening the circuit for %s after %s failures", self.key, failures
+                )
+            self._cache.set(self.opened_at_key, time.time(), timeout=None)
+            self._cache.delete(self.probe_key)
+
+    def reset(self):
+        self._cache.delete_many([self.failures_key, self.opened_at_key, self.probe_key])
+
+
+def is_circuit_open(service: Service | None) -> bool:
+    """
+    Return whether requests to `service` are currently failing fast
+    """
+    if not service or not settings.CIRCUIT_BREAKER_ENABLED:
+        return False
+    return CircuitBreaker.for_service(service).get_state() == CircuitState.open
+
+
+def get_circuit_states_display(services: Iterable[Service | None]) -> str:
+    """
+    Render the circuit breaker state of each of `services` (for the admin)
+    """
+    if not settings.CIRCUIT_BREAKER_ENABLED:
+        return _("Disabled")
+
+    return format_html_join(
+        mark_safe("<br>"),
+        "{}: {}",
+        (
+            (service.label, CircuitBreaker.for_service(service).get_state().label)
+            for service in services
+            if service
+        ),
+    )
+
+
+class CircuitBreakerMixin:
+    """
+    Protect the requests of an `ape_pie.APIClient` with a `CircuitBreaker` for the
+    service it was configured from (`configured_from`)
+    """
+
+    configured_from: Service | None = None
+
+    def request(self, method, url, *args, **kwargs) -> Response:
+        service = self.configured_from
+        if not service or not service.pk or not settings.CIRCUIT_BREAKER_ENABLED:
+            return super().request(method, url, *args, **kwargs)
+
+        circuit_breaker = CircuitBreaker.for_service(service)
+        had_failures = circuit_breaker.before_request()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except OutboundCapacityError:
+            # the backend was not contacted
+            raise
+        except RequestException:
+            circuit_breaker.record_failure()
+            raise
+
+        if response.status_code >= 500:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success(had_failures)
+        return response
+
+
+async def asend_with_circuit_breaker(
+    service: Service | None, send_request: Callable[[], Awaitable[httpx.Response]]
+) -> httpx.Response:
+    """
+    Async equivalent of `CircuitBreakerMixin.request`, for httpx requests
+    """
+    if not service or not service.pk or not settings.CIRCUIT_BREAKER_ENABLED:
+        return await send_request()
+
+    circuit_breaker = CircuitBreaker.for_service(service)
+    # the circuit state is kept in the (synchronous) Django cache
+    had_failures = await sync_to_async(
+        circuit_breaker.before_request, thread_sensitive=False
+    )()
+    try:
+        response = await send_request()
+    except OutboundCapacityError:
+        raise
+    except httpx.TransportError:
+        await sync_to_async(circuit_breaker.record_failure, thread_sensitive=False)()
+        raise
+
+    if response.status_code >= 500:
+        await sync_to_async(circuit_breaker.record_failure, thread_sensitive=False)()
+    else:
+        await sync_to_async(circuit_breaker.record_success, thread_sensitive=False)(
+            had_failures
+        )
+    return response
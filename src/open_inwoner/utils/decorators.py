@@ -1,18 +1,35 @@
+import asyncio
 import inspect
 import logging
 import re
+import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from functools import wraps
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from django.core.cache import BaseCache, caches
+from django.db import connections
+
+from .cache_tags import TaggedValue, get_tag_key, unpack_tagged_value
+from .local_cache import LocalCache
 
 logger = logging.getLogger(__name__)
 
 
 RT = TypeVar("RT")
 
+_CACHE_MISS = object()
+
+# how long a last good value is served before the computation is retried
+LAST_GOOD_RETRY_INTERVAL = 30
+
+_refresh_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="cache-refresh"
+)
+
 
 def _map_cache_key_instance_attrs_to_placeholders(key):
     """Replace instance attribute references in a cache key with placeholders.
@@ -56,11 +73,326 @@ def _map_cache_key_instance_attrs_to_placeholders(key):
     return mapped_key, identifiers
 
 
+@dataclass(frozen=True)
+class _CacheOptions:
+    timeout: int
+    single_flight: bool
+    lock_timeout: int
+    soft_timeout: int | None
+    last_good_timeout: int | None
+    is_failure: Callable[[Any], bool] | None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(
+            self.single_flight
+            or self.soft_timeout is not None
+            or self.last_good_timeout is not None
+        )
+
+
+def _acquire_lock(_cache: BaseCache, lock_key: str, timeout: int) -> str | None:
+    token = str(uuid.uuid4())
+    # `add` only succeeds if the key does not exist, also for shared caches like redis
+    if _cache.add(lock_key, token, timeout=timeout):
+        return token
+    return None
+
+
+def _release_lock(_cache: BaseCache, lock_key: str, token: str):
+    # don't release a lock that expired and was acquired by another caller
+    if _cache.get(lock_key) == token:
+        _cache.delete(lock_key)
+
+
+def _get_stored_values(
+    cache_key: str, result, options: _CacheOptions
+) -> list[tuple[str, Any, int]]:
+    values = [(cache_key, result, options.timeout)]
+    if options.soft_timeout is not None:
+        values.append((f"{cache_key}:fresh", True, options.soft_timeout))
+    if options.last_good_timeout is not None:
+        values.append((f"{cache_key}:last_good", result, options.last_good_timeout))
+    return values
+
+
+def _get_last_good_values(
+    cache_key: str, last_good, options: _CacheOptions
+) -> list[tuple[str, Any, int]]:
+    values = [(cache_key, last_good, LAST_GOOD_RETRY_INTERVAL)]
+    if options.soft_timeout is not None:
+        values.append((f"{cache_key}:fresh", True, LAST_GOOD_RETRY_INTERVAL))
+    return values
+
+
+def _is_failure(result, options: _CacheOptions) -> bool:
+    return bool(options.is_failure and options.is_failure(result))
+
+
+def _store(_cache: BaseCache, cache_key: str, result, options: _CacheOptions):
+    for key, value, timeout in _get_stored_values(cache_key, result, options):
+        _cache.set(key, value, timeout=timeout)
+
+
+def _compute(
+    _cache: BaseCache,
+    cache_key: str,
+    compute: Callable[[], RT],
+    options: _CacheOptions,
+) -> RT:
+    """
+    Compute and store a value, falling back to the last good value on failure
+    """
+    error = None
+    try:
+        result = compute()
+    except Exception as exc:
+        if options.last_good_timeout is None:
+            raise
+        error = exc
+        failed = True
+    else:
+        failed = _is_failure(result, options)
+
+    if not failed:
+        _store(_cache, cache_key, result, options)
+        return result
+
+    if options.last_good_timeout is not None:
+        last_good = _cache.get(f"{cache_key}:last_good", _CACHE_MISS)
+        if last_good is not _CACHE_MISS:
+            logger.warning(
+                "Computing '%s' failed, serving last good value",
+                cache_key,
+                exc_info=error,
+            )
+            for key, value, timeout in _get_last_good_values(
+                cache_key, last_good, options
+            ):
+                _cache.set(key, value, timeout=timeout)
+            return last_good
+
+    if error:
+        raise error
+    _cache.set(cache_key, result, timeout=options.timeout)
+    return result
+
+
+def _refresh(
+    _cache: BaseCache,
+    cache_key: str,
+    compute: Callable[[], RT],
+    options: _CacheOptions,
+    lock_key: str,
+    token: str,
+):
+    try:
+        _compute(_cache, cache_key, compute, options)
+    except Exception:
+        logger.exception("Refreshing stale value for '%s' failed", cache_key)
+    finally:
+        _release_lock(_cache, lock_key, token)
+        # don't leak database connections in the executor threads
+        connections.close_all()
+
+
+def _get_or_compute(
+    _cache: BaseCache,
+    cache_key: str,
+    compute: Callable[[], RT],
+    options: _CacheOptions,
+) -> RT:
+    """
+    Cache lookup with single-flight computation and stale-while-revalidate
+    """
+    lock_key = f"{cache_key}:lock"
+
+    if options.soft_timeout is None:
+        result = _cache.get(cache_key, _CACHE_MISS)
+        fresh = True
+    else:
+        values = _cache.get_many([cache_key, f"{cache_key}:fresh"])
+        result = values.get(cache_key, _CACHE_MISS)
+        fresh = f"{cache_key}:fresh" in values
+
+    if result is not _CACHE_MISS:
+        if fresh:
+            logger.debug("Cache hit: '%s'", cache_key)
+            return result
+
+        # serve the stale value, and let one caller refresh it in the background
+        logger.debug("Cache hit (stale): '%s'", cache_key)
+        if token := _acquire_lock(_cache, lock_key, options.lock_timeout):
+            _refresh_executor.submit(
+                _refresh, _cache, cache_key, compute, options, lock_key, token
+            )
+        return result
+
+    logger.debug("Cache miss: '%s'", cache_key)
+    if not options.single_flight:
+        return _compute(_cache, cache_key, compute, options)
+
+    if token := _acquire_lock(_cache, lock_key, options.lock_timeout):
+        try:
+            return _compute(_cache, cache_key, compute, options)
+        finally:
+            _release_lock(_cache, lock_key, token)
+
+    # another caller is computing the value: wait for it
+    waited, delay = 0.0, 0.05
+    while waited < options.lock_timeout:
+        time.sleep(delay)
+        waited += delay
+        delay = min(delay * 2, 0.5)
+
+        result = _cache.get(cache_key, _CACHE_MISS)
+        if result is not _CACHE_MISS:
+            return result
+        if _cache.get(lock_key) is None:
+            # the other caller failed
+            break
+
+    logger.warning("Gave up waiting for the computation of '%s'", cache_key)
+    return _compute(_cache, cache_key, compute, options)
+
+
+async def _aacquire_lock(_cache: BaseCache, lock_key: str, timeout: int) -> str | None:
+    token = str(uuid.uuid4())
+    if await _cache.aadd(lock_key, token, timeout=timeout):
+        return token
+    return None
+
+
+async def _arelease_lock(_cache: BaseCache, lock_key: str, token: str):
+    if await _cache.aget(lock_key) == token:
+        await _cache.adelete(lock_key)
+
+
+async def _acompute(
+    _cache: BaseCache,
+    cache_key: str,
+    compute: Callable[[], Awaitable[RT]],
+    options: _CacheOptions,
+) -> RT:
+    """
+    Async equivalent of `_compute`
+    """
+    error = None
+    try:
+        result = await compute()
+    except Exception as exc:
+        if options.last_good_timeout is None:
+            raise
+        error = exc
+        failed = True
+    else:
+        failed = _is_failure(result, options)
+
+    if not failed:
+        for key, value, timeout in _get_stored_values(cache_key, result, options):
+            await _cache.aset(key, value, timeout=timeout)
+        return result
+
+    if options.last_good_timeout is not None:
+        last_good = await _cache.aget(f"{cache_key}:last_good", _CACHE_MISS)
+        if last_good is not _CACHE_MISS:
+            logger.warning(
+                "Computing '%s' failed, serving last good value",
+                cache_key,
+                exc_info=error,
+            )
+            for key, value, timeout in _get_last_good_values(
+                cache_key, last_good, options
+            ):
+                await _cache.aset(key, value, timeout=timeout)
+            return last_good
+
+    if error:
+        raise error
+    await _cache.aset(cache_key, result, timeout=options.timeout)
+    return result
+
+
+async def _aget_or_compute(
+    _cache: BaseCache,
+    cache_key: str,
+    compute: Callable[[], Awaitable[RT]],
+    options: _CacheOptions,
+) -> RT:
+    """
+    Async equivalent of `_get_or_compute`
+
+    The event loop does not outlive the caller, so a stale value is not refreshed in
+    the background: the caller that acquires the lock refreshes it, while the other
+    callers are served the stale value.
+    """
+    lock_key = f"{cache_key}:lock"
+
+    if options.soft_timeout is None:
+        result = await _cache.aget(cache_key, _CACHE_MISS)
+        fresh = True
+    else:
+        values = await _cache.aget_many([cache_key, f"{cache_key}:fresh"])
+        result = values.get(cache_key, _CACHE_MISS)
+        fresh = f"{cache_key}:fresh" in values
+
+    if result is not _CACHE_MISS:
+        if fresh:
+            logger.debug("Cache hit: '%s'", cache_key)
+            return result
+
+        logger.debug("Cache hit (stale): '%s'", cache_key)
+        if not (token := await _aacquire_lock(_cache, lock_key, options.lock_timeout)):
+            return result
+        try:
+            return await _acompute(_cache, cache_key, compute, options)
+        except Exception:
+            logger.exception("Refreshing stale value for '%s' failed", cache_key)
+            return result
+        finally:
+            await _arelease_lock(_cache, lock_key, token)
+
+    logger.debug("Cache miss: '%s'", cache_key)
+    if not options.single_flight:
+        return await _acompute(_cache, cache_key, compute, options)
+
+    if token := await _aacquire_lock(_cache, lock_key, options.lock_timeout):
+        try:
+            return await _acompute(_cache, cache_key, compute, options)
+        finally:
+            await _arelease_lock(_cache, lock_key, token)
+
+    # another caller is computing the value: wait for it
+    waited, delay = 0.0, 0.05
+    while waited < options.lock_timeout:
+        await asyncio.sleep(delay)
+        waited += delay
+        delay = min(delay * 2, 0.5)
+
+        result = await _cache.aget(cache_key, _CACHE_MISS)
+        if result is not _CACHE_MISS:
+            return result
+        if await _cache.aget(lock_key) is None:
+            # the other caller failed
+            break
+
+    logger.warning("Gave up waiting for the computation of '%s'", cache_key)
+    return await _acompute(_cache, cache_key, compute, options)
+
+
 def cache(
     key: str,
     alias: str = "default",
     *,
     timeout: int = 60,
+    single_flight: bool = False,
+    lock_timeout: int = 10,
+    soft_timeout: int | None = None,
+    last_good_timeout: int | None = None,
+    is_failure: Callable[[Any], bool] | None = None,
+    local_timeout: int | None = None,
+    local_maxsize: int = 256,
+    tags: Iterable[str] = (),
 ):
     """
     Decorator factory for updating the django low-level cache.
@@ -73,7 +405,42 @@ def cache(
     you can also include instance attributes using the `"cache:{self.attr}"` syntax.
     :param alias: the Django cache to use, defaults to "default"
     :param timeout: the timeout for the cache in seconds. Defaults to 60
+    :param single_flight: on a cache miss, only one caller (across processes) computes
+    the value, while the other callers wait for at most `lock_timeout` seconds
+    :param lock_timeout: the max. duration of a (background) computation in seconds
+    :param soft_timeout: after this many seconds, the value is stale: it is still served
+    (until `timeout`), while one caller refreshes it in the background
+    :param last_good_timeout: keep the last good value for this many seconds, and serve
+    it when computing the value fails (raises, or `is_failure(result)` is true)
+    :param is_failure: determine if a computed result is a failure
+    :param local_timeout: also keep the values in an in-process (L1) LRU cache for this
+    many seconds, in front of the Django cache (see `LocalCache`). The values are shared
+    between callers, so only use this for values that are not modified.
+    :param local_maxsize: the max. number of values in the local cache
+    :param tags: tags for the cached values, which can contain the same placeholders as
+    `key`. All values for a tag are invalidated by `purge_cache_tags()`. Tags are not
+    supported in combination with the other options.
+
+    Coroutine functions are supported as well, using the async cache API. Their stale
+    values are refreshed by the caller instead of in the background, see
+    `_aget_or_compute`.
+
+    The decorated (synchronous) function has a `prime(result, *args, **kwargs)`
+    attribute to store a result that was obtained otherwise (e.g. from a listing)
+    as the cached value for the arguments.
     """
+    tags = tuple(tags)
+    if tags and (single_flight or soft_timeout or last_good_timeout or local_timeout):
+        raise ValueError("Cache tags cannot be combined with the other cache options")
+
+    options = _CacheOptions(
+        timeout=timeout,
+        single_flight=single_flight,
+        lock_timeout=lock_timeout,
+        soft_timeout=soft_timeout,
+        last_good_timeout=last_good_timeout,
+        is_failure=is_failure,
+    )
 
     def decorator(func: Callable[..., RT]) -> Callable[..., RT]:
         argspec = inspect.getfullargspec(func)
@@ -84,8 +451,7 @@ def cache(
         else:
             defaults = {}
 
-        @wraps(func)
-        def wrapped(*args, **kwargs) -> RT:
+        def get_key_kwargs(args, kwargs) -> dict:
             key_kwargs = defaults.copy()
             named_args = dict(zip(argspec.args, args), **kwargs)
             key_kwargs.update(**named_args)
@@ -97,11 +463,13 @@ def cache(
                     if key not in argspec.args
                 }
                 key_kwargs[argspec.varkw] = var_kwargs
+            return key_kwargs
 
+        def format_key(template: str, key_kwargs: dict, args) -> str:
             (
-                cache_key_with_attr_placeholders,
+                template_with_attr_placeholders,
                 attr_mapping,
-            ) = _map_cache_key_instance_attrs_to_placeholders(key)
+            ) = _map_cache_key_instance_attrs_to_placeholders(template)
             if attr_mapping:
                 if len(args) == 0:
                     raise ValueError(
@@ -109,6 +477,7 @@ def cache(
                     )
 
                 bound_instance = args[0]
+                key_kwargs = key_kwargs.copy()
                 for mapped_attr, original_attr in attr_mapping.items():
                     try:
                         key_kwargs[mapped_attr] = getattr(bound_instance, original_attr)
@@ -118,11 +487,126 @@ def cache(
                         )
                         raise
 
-            cache_key = cache_key_with_attr_placeholders.format(**key_kwargs)
+            return template_with_attr_placeholders.format(**key_kwargs)
+
+        def get_cache_key(args, kwargs) -> str:
+            cache_key = format_key(key, get_key_kwargs(args, kwargs), args)
             logger.debug("Resolved cache_key `%s` to `%s`", key, cache_key)
+            return cache_key
+
+        def get_tag_keys(args, kwargs) -> list[str]:
+            key_kwargs = get_key_kwargs(args, kwargs)
+            return [get_tag_key(format_key(tag, key_kwargs, args)) for tag in tags]
+
+        local_cache = (
+            LocalCache(alias=alias, timeout=local_timeout, maxsize=local_maxsize)
+            if local_timeout
+            else None
+        )
+
+        def set_local(cache_key: str, result):
+            # don't keep failures around in every process
+            if not _is_failure(result, options):
+                local_cache.set(cache_key, result)
+
+        if inspect.iscoroutinefunction(func):
+
+            async def aget_or_set(cache_key: str, args, kwargs) -> RT:
+                _cache: BaseCache = caches[alias]
+
+                if tags:
+                    tag_keys = get_tag_keys(args, kwargs)
+                    values = await _cache.aget_many([cache_key, *tag_keys])
+                    result = unpack_tagged_value(
+                        values, cache_key, tag_keys, default=_CACHE_MISS
+                    )
+                    if result is not _CACHE_MISS:
+                        logger.debug("Cache hit: '%s'", cache_key)
+                        return result
 
+                    logger.debug("Cache miss: '%s'", cache_key)
+                    created_at = time.time()
+                    result = await func(*args, **kwargs)
+                    await _cache.aset(
+                        cache_key, TaggedValue(created_at, result), timeout=timeout
+                    )
+                    return result
+
+                if options.enabled:
+                    return await _aget_or_compute(
+                        _cache, cache_key, lambda: func(*args, **kwargs), options
+                    )
+
+                CACHE_MISS = object()
+                result = await _cache.aget(cache_key, default=CACHE_MISS)
+                if result is not CACHE_MISS:
+                    logger.debug("Cache hit: '%s'", cache_key)
+                    return result
+
+                logger.debug("Cache miss: '%s'", cache_key)
+                result = await func(*args, **kwargs)
+                await _cache.aset(cache_key, result, timeout=timeout)
+
+                return result
+
+            @wraps(func)
+            async def async_wrapped(*args, **kwargs) -> RT:
+                cache_key = get_cache_key(args, kwargs)
+                if local_cache is None:
+                    return await aget_or_set(cache_key, args, kwargs)
+
+                result = local_cache.get(cache_key, _CACHE_MISS)
+                if result is not _CACHE_MISS:
+                    logger.debug("Local cache hit: '%s'", cache_key)
+                    return result
+
+                result = await aget_or_set(cache_key, args, kwargs)
+                set_local(cache_key, result)
+                return result
+
+            async_wrapped.local_cache = local_cache
+            return async_wrapped
+
+        @wraps(func)
+        def wrapped(*args, **kwargs) -> RT:
+            cache_key = get_cache_key(args, kwargs)
+            if local_cache is None:
+                return get_or_set(cache_key, args, kwargs)
+
+            result = local_cache.get(cache_key, _CACHE_MISS)
+            if result is not _CACHE_MISS:
+                logger.debug("Local cache hit: '%s'", cache_key)
+                return result
+
+            result = get_or_set(cache_key, args, kwargs)
+            set_local(cache_key, result)
+            return result
+
+        def get_or_set(cache_key: str, args, kwargs) -> RT:
             _cache: BaseCache = caches[alias]
 
+            if tags:
+                tag_keys = get_tag_keys(args, kwargs)
+                values = _cache.get_many([cache_key, *tag_keys])
+                result = unpack_tagged_value(
+                    values, cache_key, tag_keys, default=_CACHE_MISS
+                )
+                if result is not _CACHE_MISS:
+                    logger.debug("Cache hit: '%s'", cache_key)
+                    return result
+
+                logger.debug("Cache miss: '%s'", cache_key)
+                # purges during the computation invalidate the result
+                created_at = time.time()
+                result = func(*args, **kwargs)
+                _cache.set(cache_key, TaggedValue(created_at, result), timeout=timeout)
+                return result
+
+            if options.enabled:
+                return _get_or_compute(
+                    _cache, cache_key, lambda: func(*args, **kwargs), options
+                )
+
             CACHE_MISS = object()
             result = _cache.get(cache_key, default=CACHE_MISS)
             if result is not CACHE_MISS:
@@ -136,6 +620,25 @@ def cache(
 
             return result
 
+        def prime(result: RT, *args, **kwargs) -> bool:
+            """
+            Store `result` as the cached value, and return if a value was cached
+            """
+            cache_key = get_cache_key(args, kwargs)
+            _cache: BaseCache = caches[alias]
+
+            was_cached = _cache.get(cache_key, _CACHE_MISS) is not _CACHE_MISS
+            if tags:
+                _cache.set(cache_key, TaggedValue(time.time(), result), timeout=timeout)
+            else:
+                _store(_cache, cache_key, result, options)
+            if local_cache is not None:
+                set_local(cache_key, result)
+
+            return was_cached
+
+        wrapped.local_cache = local_cache
+        wrapped.prime = prime
         return wrapped
 
     return decorator
@@ -0,0 +1,104 @@
+import concurrent.futures
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from zgw_consumers.concurrent import parallel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchNode:
+    name: str
+    func: Callable[..., Any]
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class FetchPlan:
+    """
+    Declarative set of (API) calls, executed concurrently where the dependencies allow
+
+    Every node is called with the results of the nodes it depends on as keyword
+    arguments, so the duration of `run()` is the duration of the slowest chain of
+    dependencies instead of the sum of all calls:
+
+        plan = FetchPlan()
+        plan.add("statuses", lambda: client.fetch_status_history(case.url))
+        plan.add(
+            "status_types",
+            lambda statuses: resolve_status_types(statuses),
+            depends_on=["statuses"],
+        )
+        results = plan.run()
+
+    The nodes run in a thread pool, so they should not access the database. The
+    duration of each node (in seconds) is available in `timings` after running.
+    """
+
+    max_workers: int | None = None
+    nodes: dict[str, FetchNode] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def add(
+        self, name: str, func: Callable[..., Any], depends_on: Iterable[str] = ()
+    ) -> "FetchPlan":
+        if name in self.nodes:
+            raise ValueError(f"Node {name!r} is already part of the plan")
+
+        depends_on = tuple(depends_on)
+        if unknown := [dep for dep in depends_on if dep not in self.nodes]:
+            # nodes must be added after their dependencies, which rules out cycles
+            raise ValueError(f"Node {name!r} depends on unknown nodes {unknown}")
+
+        self.nodes[name] = FetchNode(name=name, func=func, depends_on=depends_on)
+        return self
+
+    def _call(self, node: FetchNode, results: dict[str, Any]):
+        start = time.perf_counter()
+        try:
+            return node.func(**{dep: results[dep] for dep in node.depends_on})
+        finally:
+            self.timings[node.name] = time.perf_counter() - start
+
+    def run(self) -> dict[str, Any]:
+        """
+        Execute the plan and return the results by node name
+
+        The first exception raised by a node is re-raised, nodes that have not been
+        started yet are skipped.
+        """
+        start = time.perf_counter()
+        results: dict[str, Any] = {}
+        pending = dict(self.nodes)
+        running: dict[concurrent.futures.Future, FetchNode] = {}
+
+        with parallel(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for node in list(pending.values()):
+                    if all(dep in results for dep in node.depends_on):
+                        del pending[node.name]
+                        future = executor.submit(self._call, node, dict(results))
+                        running[future] = node
+
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    node = running.pop(future)
+                    try:
+                        results[node.name] = future.result()
+                    except Exception:
+                        for other in running:
+                            other.cancel()
+                        raise
+
+        logger.debug(
+            "Executed fetch plan in %.3fs: %s",
+            time.perf_counter() - start,
+            ", ".join(f"{name}={t:.3f}s" for name, t in self.timings.items()),
+        )
+        return results
@@ -1,3 +1,8 @@
+import io
+import uuid
+from collections.abc import Iterator
+from typing import IO
+
 from django.core.files.storage import FileSystemStorage
 
 
@@ -7,3 +12,78 @@ class OverwriteStorage(FileSystemStorage):
     def get_available_name(self, name, max_length=None):
         self.delete(name)
         return name
+
+
+class MultipartFileStream:
+    """
+    A `multipart/form-data` request body with (a part of) a file, that is read from the
+    file while the request is sent
+
+    `requests` builds the full body in memory for `files=...`, this can be passed as
+    `data=...` (with the `content_type` as Content-Type header) instead.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        fields: dict[str, str],
+        file_field: str,
+        file: IO[bytes],
+        *,
+        filename: str,
+        offset: int = 0,
+        length: int,
+        content_type: str = "application/octet-stream",
+    ):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        preamble = "".join(
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n"
+            for name, value in fields.items()
+        )
+        preamble += (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        self._preamble = io.BytesIO(preamble.encode("utf-8"))
+        self._epilogue = io.BytesIO(f"\r\n--{boundary}--\r\n".encode("utf-8"))
+
+        self._file = file
+        self._offset = offset
+        self._remaining = length
+        self._length = (
+            len(self._preamble.getvalue()) + length + len(self._epilogue.getvalue())
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self.read(self.chunk_size):
+            yield chunk
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length
+
+        data = self._preamble.read(size)
+
+        if len(data) < size and self._remaining:
+            # the file can be shared, so don't rely on its position
+            self._file.seek(self._offset)
+            chunk = self._file.read(min(size - len(data), self._remaining))
+            if not chunk:
+                raise ValueError("The file is smaller than the length of the part")
+            self._offset += len(chunk)
+            self._remaining -= len(chunk)
+            data += chunk
+
+        if len(data) < size and not self._remaining:
+            data += self._epilogue.read(size - len(data))
+
+        return data
@@ -0,0 +1,115 @@
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+
+LOCAL_CACHE_VERSION_KEY = "utils:local_cache:version"
+
+_UNSET = object()
+_local_caches: "weakref.WeakSet[LocalCache]" = weakref.WeakSet()
+
+
+def get_shared_version(key: str, alias: str = "default") -> str:
+    """
+    Return the version stored in the shared cache under `key`, initializing it if needed
+    """
+    cache = caches[alias]
+    version = cache.get(key)
+    if version is None:
+        # first process (or cache was cleared): initialize, but don't clobber a
+        # version set concurrently by another process
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key) or uuid.uuid4().hex
+    return version
+
+
+def bump_shared_version(key: str, alias: str = "default"):
+    caches[alias].set(key, uuid.uuid4().hex, timeout=None)
+
+
+class LocalCache:
+    """
+    Bounded, thread-safe in-process LRU cache, used in front of a shared Django cache.
+
+    Entries expire after `timeout` seconds. All local caches for a cache alias are
+    cleared when the shared version changes (by `invalidate_local_caches()` or by
+    clearing the shared cache), which is checked at most every
+    `settings.CACHE_LOCAL_VERSION_CHECK_INTERVAL` seconds.
+
+    Values are not copied, and should not be modified by the caller.
+    """
+
+    def __init__(self, *, alias: str = "default", timeout: int, maxsize: int):
+        self.alias = alias
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = _UNSET
+        self._next_version_check = 0.0
+        _local_caches.add(self)
+
+    def _check_version(self, now: float):
+        if now < self._next_version_check:
+            return
+
+        version = get_shared_version(LOCAL_CACHE_VERSION_KEY, self.alias)
+        with self._lock:
+            self._next_version_check = now + settings.CACHE_LOCAL_VERSION_CHECK_INTERVAL
+            if version != self._version:
+                self._data.clear()
+                self._version = version
+
+    def get(self, key: str, default=None):
+        now = time.monotonic()
+        self._check_version(now)
+
+        with self._lock:
+            try:
+                expires_at, value = self._data[key]
+            except KeyError:
+                return default
+            if expires_at <= now:
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+
+def invalidate_local_caches(alias: str = "default"):
+    """
+    Clear the local caches for `alias` in all processes
+    """
+    bump_shared_version(LOCAL_CACHE_VERSION_KEY, alias)
+    for local_cache in list(_local_caches):
+        if local_cache.alias == alias:
+            local_cache.clear()
+
+
+def clear_local_caches():
+    """
+    Clear all local caches in this process only (e.g. between tests)
+    """
+    for local_cache in list(_local_caches):
+        local_cache.clear()
@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+from requests import ConnectionError, Response
+
+logger = logging.getLogger(__name__)
+
+
+class OutboundCapacityError(ConnectionError):
+    """
+    No capacity for a request to a backend was available in time
+
+    Subclasses `requests.ConnectionError`, so it is handled like an unavailable backend.
+    """
+
+
+class BackendLimiter:
+    """
+    Limit the requests to a single backend
+
+    The number of concurrent requests is limited by an AIMD (additive increase,
+    multiplicative decrease) limit: every successful request increases the limit by
+    `1 / limit` (so by about one per "round" of requests), while a failed or slow
+    request (slower than `latency_target` seconds) multiplies it by `decrease_factor`.
+    The limit is decreased at most once per `latency_target` seconds, because the
+    requests in flight at the time of a decrease would otherwise compound it.
+
+    Optionally, the request rate is limited by a token bucket of `burst` tokens that
+    refills at `rate` tokens per second.
+    """
+
+    # seconds between the attempts of `aacquire()` while waiting for requests in flight
+    poll_interval = 0.01
+
+    def __init__(
+        self,
+        backend: str,
+        *,
+        max_limit: int,
+        min_limit: int = 1,
+        latency_target: float,
+        decrease_factor: float = 0.5,
+        rate: float = 0,
+        burst: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.backend = backend
+        self.max_limit = max_limit
+        self.min_limit = max(1, min_limit)
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.rate = rate
+        self.burst = burst or max(1, math.ceil(rate))
+        self.clock = clock
+
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self.tokens = float(self.burst)
+        self._last_refill = clock()
+        self._last_decrease = -math.inf
+        self._condition = threading.Condition()
+
+    def __repr__(self):
+        return (
+            f"<BackendLimiter {self.backend} limit={self.limit:.1f} "
+            f"in_flight={self.in_flight}>"
+        )
+
+    def _get_wait_time(self, now: float) -> float:
+        """
+        Return the time until a request can be started (`inf` if waiting for the
+        requests in flight)
+        """
+        if self.rate:
+            self.tokens = min(
+                self.burst, self.tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+
+        if self.in_flight >= int(self.limit):
+            return math.inf
+        if self.rate and self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+        return 0
+
+    def _get_capacity_error(self) -> OutboundCapacityError:
+        return OutboundCapacityError(
+            f"No capacity for a request to {self.backend} "
+            f"(limit {int(self.limit)}, {self.in_flight} in flight)"
+        )
+
+    def _take(self):
+        self.in_flight += 1
+        if self.rate:
+            self.tokens -= 1
+
+    def acquire(self, timeout: float):
+        deadline = self.clock() + timeout
+        with self._condition:
+            while wait_time := self._get_wait_time(now := self.clock()):
+                if (remaining := deadline - now) <= 0:
+                    raise self._get_capacity_error()
+                self._condition.wait(min(wait_time, remaining))
+
+            self._take()
+
+    def try_acquire(self) -> float:
+        """
+        Start a request if possible, without waiting
+
+        Returns 0 if the request was started, otherwise the time until it can be
+        started (`inf` if waiting for the requests in flight).
+        """
+        with self._condition:
+            if wait_time := self._get_wait_time(self.clock()):
+                return wait_time
+            self._take()
+            return 0
+
+    async def aacquire(self, timeout: float):
+        """
+        Async equivalent of `acquire()`, that waits on the event loop
+
+        A cancelled wait never holds a slot: a slot is only taken by `try_acquire()`,
+        which doesn't await.
+        """
+        deadline = self.clock() + timeout
+        while wait_time := self.try_acquire():
+            if (remaining := deadline - self.clock()) <= 0:
+                raise self._get_capacity_error()
+            await asyncio.sleep(min(wait_time, remaining, self.poll_interval))
+
+    def release(self, latency: float, failed: bool):
+        with self._condition:
+            self.in_flight -= 1
+
+            now = self.clock()
+            if failed or latency > self.latency_target:
+                if now - self._last_decrease >= self.latency_target:
+                    self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+                    self._last_decrease = now
+                    logger.info(
+                        "Decreased the concurrency limit for %s to %s",
+                        self.backend,
+                        int(self.limit),
+                    )
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+            self._condition.notify_all()
+
+
+def is_failed_response(response) -> bool:
+    # client errors are the caller's problem, not a sign of a degraded backend
+    return response.status_code >= 500 or response.status_code == 429
+
+
+class OutboundScheduler:
+    """
+    Process-wide scheduler for the requests to external services, with a
+    `BackendLimiter` per backend (scheme and host)
+
+    Requests that cannot start within `settings.OUTBOUND_ACQUIRE_TIMEOUT` seconds fail
+    with an `OutboundCapacityError`, so a degraded backend cannot tie up all threads.
+    """
+
+    def __init__(self):
+        self._limiters: dict[str, BackendLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get_limiter(self, url: str) -> BackendLimiter:
+        parts = urlsplit(url)
+        backend = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            if not (limiter := self._limiters.get(backend)):
+                limiter = self._limiters[backend] = BackendLimiter(
+                    backend,
+                    max_limit=settings.OUTBOUND_MAX_CONCURRENCY_PER_BACKEND,
+                    min_limit=settings.OUTBOUND_MIN_CONCURRENCY_PER_BACKEND,
+                    latency_target=settings.OUTBOUND_LATENCY_TARGET,
+                    rate=settings.OUTBOUND_RATE_PER_BACKEND,
+                    burst=settings.OUTBOUND_BURST_PER_BACKEND,
+                )
+            return limiter
+
+    def send(self, url: str, send_request: Callable[[], Response]) -> Response:
+        if not settings.OUTBOUND_SCHEDULER_ENABLED:
+            return send_request()
+
+        limiter = self.get_limiter(url)
+        limiter.acquire(timeout=settings.OUTBOUND_ACQUIRE_TIMEOUT)
+
+        start = time.monotonic()
+        failed = True
+        try:
+            response = send_request()
+            failed = is_failed_response(response)
+            return response
+        finally:
+            limiter.release(time.monotonic() - start, failed)
+
+    async def asend(self, url: str, send_request: Callable[[], Awaitable]):
+        """
+        Async equivalent of `send()` (e.g. for httpx requests)
+        """
+        if not settings.OUTBOUND_SCHEDULER_ENABLED:
+            return await send_request()
+
+        limiter = self.get_limiter(url)
+        await limiter.aacquire(timeout=settings.OUTBOUND_ACQUIRE_TIMEOUT)
+
+        start = time.monotonic()
+        failed = True
+        try:
+            response = await send_request()
+            failed = is_failed_response(response)
+            return response
+        finally:
+            limiter.release(time.monotonic() - start, failed)
+
+    def reset(self):
+        with self._lock:
+            self._limiters.clear()
+
+
+outbound_scheduler = OutboundScheduler()
+
+
+class ScheduledRequestsMixin:
+    """
+    Route the requests of an `ape_pie.APIClient` through the `outbound_scheduler`
+    """
+
+    def request(self, method, url, *args, **kwargs) -> Response:
+        return outbound_scheduler.send(
+            self.to_absolute_url(url),
+            lambda: super(ScheduledRequestsMixin, self).request(
+                method, url, *args, **kwargs
+            ),
+        )
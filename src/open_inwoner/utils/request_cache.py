@@ -0,0 +1,66 @@
+import threading
+from collections.abc import Callable, Hashable
+from typing import TypeVar
+
+from django.http import HttpRequest
+
+RT = TypeVar("RT")
+
+_REQUEST_ATTRIBUTE = "_open_inwoner_request_cache"
+_request_cache_lock = threading.Lock()
+
+
+class RequestCache:
+    """
+    Memoize results for the lifetime of a single request.
+
+    A computation for a key is performed only once, also when the store is
+    accessed concurrently (e.g. from a `parallel()` executor). Exceptions are
+    not stored, so a failing computation is retried by the next caller.
+    """
+
+    def __init__(self):
+        self._results: dict[Hashable, object] = {}
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._results
+
+    def get_or_set(self, key: Hashable, func: Callable[[], RT]) -> RT:
+        with self._lock:
+            if key in self._results:
+                return self._results[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # another thread may have computed the result while we were waiting
+            with self._lock:
+                if key in self._results:
+                    return self._results[key]
+
+            result = func()
+
+            with self._lock:
+                self._results[key] = result
+
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self._key_locks.clear()
+
+
+def get_request_cache(request: HttpRequest) -> RequestCache:
+    """
+    Return the `RequestCache` bound to `request`, creating it if needed
+    """
+    with _request_cache_lock:
+        try:
+            return getattr(request, _REQUEST_ATTRIBUTE)
+        except AttributeError:
+            request_cache = RequestCache()
+            setattr(request, _REQUEST_ATTRIBUTE, request_cache)
+            return request_cache
@@ -10,6 +10,7 @@ from django.core.cache import caches
 from django.test import override_settings
 
 from open_inwoner.kvk.branches import KVK_BRANCH_SESSION_VARIABLE
+from open_inwoner.utils.local_cache import clear_local_caches
 
 
 def temp_media_root():
@@ -33,6 +34,7 @@ class ClearCachesMixin:
     def clear_caches(self):
         for cache in caches.all():
             cache.clear()
+        clear_local_caches()
 
     def setUp(self):
         super().setUp()
@@ -40,6 +42,8 @@ class ClearCachesMixin:
         for cache in caches.all():
             cache.clear()
             self.addCleanup(cache.clear)
+        clear_local_caches()
+        self.addCleanup(clear_local_caches)
 
 
 class DisableRequestLogMixin:
@@ -0,0 +1,140 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+import httpx
+import requests_mock
+from ape_pie import APIClient
+from asgiref.sync import async_to_sync
+from requests import ConnectTimeout
+from zgw_consumers.models import Service
+
+from open_inwoner.utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerMixin,
+    CircuitOpenError,
+    CircuitState,
+    asend_with_circuit_breaker,
+    is_circuit_open,
+)
+from open_inwoner.utils.test import ClearCachesMixin
+
+
+class CircuitBreakerTestCase(ClearCachesMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.circuit_breaker = CircuitBreaker(
+            "zaken", failure_threshold=2, reset_timeout=30
+        )
+
+    def test_circuit_opens_after_consecutive_failures(self):
+        had_failures = self.circuit_breaker.before_request()
+        self.assertFalse(had_failures)
+        self.circuit_breaker.record_failure()
+        self.assertEqual(self.circuit_breaker.get_state(), CircuitState.closed)
+
+        # a success resets the failures
+        had_failures = self.circuit_breaker.before_request()
+        self.assertTrue(had_failures)
+        self.circuit_breaker.record_success(had_failures)
+        self.circuit_breaker.record_failure()
+        self.assertEqual(self.circuit_breaker.get_state(), CircuitState.closed)
+
+        self.circuit_breaker.record_failure()
+        self.assertEqual(self.circuit_breaker.get_state(), CircuitState.open)
+        with self.assertRaises(CircuitOpenError):
+            self.circuit_breaker.before_request()
+
+    def test_half_open_circuit_lets_a_single_probe_through(self):
+        with patch("open_inwoner.utils.circuit_breaker.time.time", return_value=1000):
+            self.circuit_breaker.record_failure()
+            self.circuit_breaker.record_failure()
+
+        with patch("open_inwoner.utils.circuit_breaker.time.time", return_value=1031):
+            self.assertEqual(self.circuit_breaker.get_state(), CircuitState.half_open)
+
+            # failed probe opens the circuit again
+            self.circuit_breaker.before_request()
+            with self.assertRaises(CircuitOpenError):
+                self.circuit_breaker.before_request()
+            self.circuit_breaker.record_failure()
+            self.assertEqual(self.circuit_breaker.get_state(), CircuitState.open)
+
+        with patch("open_inwoner.utils.circuit_breaker.time.time", return_value=1062):
+            had_failures = self.circuit_breaker.before_request()
+            self.circuit_breaker.record_success(had_failures)
+
+            self.assertEqual(self.circuit_breaker.get_state(), CircuitState.closed)
+            self.circuit_breaker.before_request()
+
+
+class CircuitBreakerClient(CircuitBreakerMixin, APIClient):
+    def __init__(self, *args, configured_from=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.configured_from = configured_from
+
+
+@override_settings(
+    CIRCUIT_BREAKER_ENABLED=True,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD=2,
+    CIRCUIT_BREAKER_RESET_TIMEOUT=30,
+)
+@requests_mock.Mocker()
+class CircuitBreakerMixinTestCase(ClearCachesMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.service = Service(pk=1, api_root="https://zaken.nl/api/v1/")
+        self.api_client = CircuitBreakerClient(
+            self.service.api_root, configured_from=self.service
+        )
+
+    def test_server_errors_open_the_circuit(self, m):
+        m.get("https://zaken.nl/api/v1/zaken", status_code=502)
+        m.get("https://zaken.nl/api/v1/statussen", exc=ConnectTimeout)
+
+        self.assertEqual(self.api_client.get("zaken").status_code, 502)
+        with self.assertRaises(ConnectTimeout):
+            self.api_client.get("statussen")
+
+        self.assertTrue(is_circuit_open(self.service))
+        with self.assertRaises(CircuitOpenError):
+            self.api_client.get("zaken")
+        self.assertEqual(m.call_count, 2)
+
+    def test_client_errors_do_not_open_the_circuit(self, m):
+        m.get("https://zaken.nl/api/v1/zaken", status_code=404)
+
+        for _ in range(3):
+            self.assertEqual(self.api_client.get("zaken").status_code, 404)
+
+        self.assertFalse(is_circuit_open(self.service))
+
+    @override_settings(CIRCUIT_BREAKER_ENABLED=False)
+    def test_disabled(self, m):
+        m.get("https://zaken.nl/api/v1/zaken", status_code=503)
+
+        for _ in range(3):
+            self.assertEqual(self.api_client.get("zaken").status_code, 503)
+
+        self.assertEqual(m.call_count, 3)
+
+    def test_async_requests_open_the_circuit(self, m):
+        calls = []
+
+        async def send_request():
+            calls.append(1)
+            if len(calls) == 1:
+                return httpx.Response(502)
+            raise httpx.ConnectTimeout("timeout")
+
+        send = async_to_sync(asend_with_circuit_breaker)
+        self.assertEqual(send(self.service, send_request).status_code, 502)
+        with self.assertRaises(httpx.ConnectTimeout):
+            send(self.service, send_request)
+
+        self.assertTrue(is_circuit_open(self.service))
+        with self.assertRaises(CircuitOpenError):
+            send(self.service, send_request)
+        self.assertEqual(len(calls), 2)
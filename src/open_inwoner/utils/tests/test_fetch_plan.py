@@ -0,0 +1,64 @@
+import threading
+
+from django.test import SimpleTestCase
+
+from open_inwoner.utils.fetch_plan import FetchPlan
+
+
+class FetchPlanTestCase(SimpleTestCase):
+    def test_results_are_passed_to_dependent_nodes(self):
+        plan = FetchPlan()
+        plan.add("case", lambda: "zaak")
+        plan.add("statuses", lambda case: [f"{case}-status"], depends_on=["case"])
+        plan.add(
+            "summary",
+            lambda case, statuses: (case, len(statuses)),
+            depends_on=["case", "statuses"],
+        )
+
+        results = plan.run()
+
+        self.assertEqual(
+            results,
+            {"case": "zaak", "statuses": ["zaak-status"], "summary": ("zaak", 1)},
+        )
+        self.assertEqual(set(plan.timings), {"case", "statuses", "summary"})
+
+    def test_independent_nodes_run_concurrently(self):
+        # both nodes have to be running at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        plan = FetchPlan(max_workers=2)
+        plan.add("documents", lambda: barrier.wait() is not None)
+        plan.add("statuses", lambda: barrier.wait() is not None)
+
+        self.assertEqual(plan.run(), {"documents": True, "statuses": True})
+
+    def test_errors_are_raised(self):
+        def fail():
+            raise ValueError("boom")
+
+        dependent_calls = []
+
+        plan = FetchPlan()
+        plan.add("statuses", fail)
+        plan.add(
+            "status_types",
+            lambda statuses: dependent_calls.append(statuses),
+            depends_on=["statuses"],
+        )
+
+        with self.assertRaisesMessage(ValueError, "boom"):
+            plan.run()
+
+        self.assertEqual(dependent_calls, [])
+        self.assertIn("statuses", plan.timings)
+
+    def test_nodes_are_validated(self):
+        plan = FetchPlan()
+        plan.add("case", lambda: None)
+
+        with self.assertRaises(ValueError):
+            plan.add("case", lambda: None)
+        with self.assertRaises(ValueError):
+            plan.add("statuses", lambda status_types: None, depends_on=["status_types"])
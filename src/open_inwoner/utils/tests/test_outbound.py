@@ -0,0 +1,205 @@
+import asyncio
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+
+import httpx
+import requests_mock
+from ape_pie import APIClient
+from asgiref.sync import async_to_sync
+
+from open_inwoner.utils.outbound import (
+    BackendLimiter,
+    OutboundCapacityError,
+    ScheduledRequestsMixin,
+    outbound_scheduler,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class BackendLimiterTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.clock = FakeClock()
+
+    def test_concurrency_is_limited(self):
+        limiter = BackendLimiter(
+            "https://zaken.nl", max_limit=2, latency_target=1, clock=self.clock
+        )
+
+        limiter.acquire(timeout=0)
+        limiter.acquire(timeout=0)
+        with self.assertRaises(OutboundCapacityError):
+            limiter.acquire(timeout=0)
+
+        limiter.release(latency=0.1, failed=False)
+        limiter.acquire(timeout=0)
+
+        self.assertEqual(limiter.in_flight, 2)
+
+    def test_limit_decreases_on_failures_and_recovers(self):
+        limiter = BackendLimiter(
+            "https://zaken.nl",
+            max_limit=8,
+            min_limit=2,
+            latency_target=1,
+            clock=self.clock,
+        )
+
+        limiter.acquire(timeout=0)
+        limiter.release(latency=0.1, failed=True)
+        self.assertEqual(limiter.limit, 4)
+
+        # decreased at most once per latency target
+        limiter.acquire(timeout=0)
+        limiter.release(latency=0.1, failed=True)
+        self.assertEqual(limiter.limit, 4)
+
+        # slow requests count as failures
+        self.clock.now += 1
+        limiter.acquire(timeout=0)
+        limiter.release(latency=1.5, failed=False)
+        self.assertEqual(limiter.limit, 2)
+
+        self.clock.now += 1
+        limiter.acquire(timeout=0)
+        limiter.release(latency=0.1, failed=True)
+        self.assertEqual(limiter.limit, 2)
+
+        for _ in range(20):
+            limiter.acquire(timeout=0)
+            limiter.release(latency=0.1, failed=False)
+        self.assertGreater(limiter.limit, 6)
+
+        for _ in range(50):
+            limiter.acquire(timeout=0)
+            limiter.release(latency=0.1, failed=False)
+        self.assertEqual(limiter.limit, 8)
+
+    def test_rate_is_limited(self):
+        limiter = BackendLimiter(
+            "https://zaken.nl",
+            max_limit=10,
+            latency_target=1,
+            rate=2,
+            burst=2,
+            clock=self.clock,
+        )
+
+        for _ in range(2):
+            limiter.acquire(timeout=0)
+            limiter.release(latency=0.1, failed=False)
+        with self.assertRaises(OutboundCapacityError):
+            limiter.acquire(timeout=0)
+
+        self.clock.now += 0.5
+        limiter.acquire(timeout=0)
+
+
+class ScheduledClient(ScheduledRequestsMixin, APIClient):
+    pass
+
+
+@override_settings(OUTBOUND_SCHEDULER_ENABLED=True)
+@requests_mock.Mocker()
+class OutboundSchedulerTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        outbound_scheduler.reset()
+        self.addCleanup(outbound_scheduler.reset)
+        self.api_client = ScheduledClient("https://zaken.nl/api/v1/")
+
+    @override_settings(OUTBOUND_MAX_CONCURRENCY_PER_BACKEND=8)
+    def test_requests_are_limited_per_backend(self, m):
+        m.get("https://zaken.nl/api/v1/zaken", status_code=503)
+
+        response = self.api_client.get("zaken")
+
+        self.assertEqual(response.status_code, 503)
+        limiter = outbound_scheduler.get_limiter("https://zaken.nl/api/v1/statussen")
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(outbound_scheduler.get_limiter("https://other.nl/").limit, 8)
+
+    @override_settings(OUTBOUND_ACQUIRE_TIMEOUT=0)
+    def test_request_fails_without_capacity(self, m):
+        m.get("https://zaken.nl/api/v1/zaken", json={})
+        limiter = outbound_scheduler.get_limiter("https://zaken.nl/")
+        limiter.limit = 1
+        limiter.acquire(timeout=0)
+
+        with self.assertRaises(OutboundCapacityError):
+            self.api_client.get("zaken")
+
+        self.assertFalse(m.called)
+
+    @override_settings(OUTBOUND_MAX_CONCURRENCY_PER_BACKEND=8)
+    def test_async_requests_are_limited_per_backend(self, m):
+        url = "https://zaken.nl/api/v1/zaken"
+
+        async def send_request():
+            return httpx.Response(503)
+
+        response = async_to_sync(outbound_scheduler.asend)(url, send_request)
+
+        self.assertEqual(response.status_code, 503)
+        limiter = outbound_scheduler.get_limiter(url)
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertEqual(limiter.limit, 4)
+
+    @override_settings(OUTBOUND_ACQUIRE_TIMEOUT=0.05)
+    def test_async_request_fails_without_capacity(self, m):
+        url = "https://zaken.nl/api/v1/zaken"
+        limiter = outbound_scheduler.get_limiter(url)
+        limiter.limit = 1
+        limiter.acquire(timeout=0)
+
+        async def send_request():
+            raise AssertionError("request was sent")
+
+        with self.assertRaises(OutboundCapacityError):
+            async_to_sync(outbound_scheduler.asend)(url, send_request)
+
+        self.assertEqual(limiter.in_flight, 1)
+
+    @override_settings(OUTBOUND_ACQUIRE_TIMEOUT=5)
+    def test_cancelled_async_request_does_not_hold_capacity(self, m):
+        url = "https://zaken.nl/api/v1/zaken"
+        limiter = outbound_scheduler.get_limiter(url)
+        limiter.limit = 1
+        limiter.acquire(timeout=0)
+
+        async def send_request():
+            return httpx.Response(200)
+
+        async def cancel_waiting_request():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    outbound_scheduler.asend(url, send_request), timeout=0.05
+                )
+            limiter.release(latency=0.1, failed=False)
+
+            return await outbound_scheduler.asend(url, send_request)
+
+        response = async_to_sync(cancel_waiting_request)()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(limiter.in_flight, 0)
+
+    @override_settings(OUTBOUND_SCHEDULER_ENABLED=False)
+    def test_disabled(self, m):
+        m.get("https://zaken.nl/api/v1/zaken", status_code=503)
+
+        self.assertEqual(self.api_client.get("zaken").status_code, 503)
+
+        limiter = outbound_scheduler.get_limiter("https://zaken.nl/")
+        self.assertEqual(limiter.limit, settings.OUTBOUND_MAX_CONCURRENCY_PER_BACKEND)
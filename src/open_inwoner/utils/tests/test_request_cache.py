@@ -0,0 +1,34 @@
+from unittest.mock import Mock
+
+from django.test import RequestFactory, SimpleTestCase
+
+from open_inwoner.utils.request_cache import RequestCache, get_request_cache
+
+
+class RequestCacheTestCase(SimpleTestCase):
+    def test_get_or_set_computes_once(self):
+        request_cache = RequestCache()
+        func = Mock(return_value=[1, 2, 3])
+
+        self.assertEqual(request_cache.get_or_set("key", func), [1, 2, 3])
+        self.assertEqual(request_cache.get_or_set("key", func), [1, 2, 3])
+        self.assertIn("key", request_cache)
+
+        func.assert_called_once()
+
+    def test_exceptions_are_not_stored(self):
+        request_cache = RequestCache()
+        func = Mock(side_effect=[ValueError, "result"])
+
+        with self.assertRaises(ValueError):
+            request_cache.get_or_set("key", func)
+
+        self.assertNotIn("key", request_cache)
+        self.assertEqual(request_cache.get_or_set("key", func), "result")
+
+    def test_get_request_cache_is_bound_to_request(self):
+        request = RequestFactory().get("/")
+        other_request = RequestFactory().get("/")
+
+        self.assertIs(get_request_cache(request), get_request_cache(request))
+        self.assertIsNot(get_request_cache(request), get_request_cache(other_request))
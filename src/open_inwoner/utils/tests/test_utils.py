@@ -3,11 +3,18 @@ from unittest import mock
 
 from django.core.cache import caches
 from django.core.cache.backends.dummy import DummyCache
-from django.test import TestCase as DjangoTestCase, override_settings
+from django.test import SimpleTestCase, TestCase as DjangoTestCase, override_settings
 
 import freezegun
+from asgiref.sync import async_to_sync
 
+from open_inwoner.utils.cache_tags import purge_cache_tags
 from open_inwoner.utils.decorators import cache
+from open_inwoner.utils.local_cache import (
+    LOCAL_CACHE_VERSION_KEY,
+    LocalCache,
+    invalidate_local_caches,
+)
 
 MockCache = mock.create_autospec(DummyCache)
 
@@ -217,3 +224,270 @@ class CacheBehaviorTest(DjangoTestCase):
         returns_none()
 
         m.assert_called_once()
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class CacheResilienceTest(SimpleTestCase):
+    def setUp(self):
+        caches["default"].clear()
+
+    def test_single_flight_waits_for_concurrent_computation(self):
+        m = mock.Mock(return_value=42)
+
+        @cache("single", single_flight=True)
+        def func():
+            return m()
+
+        # simulate another process computing the value
+        caches["default"].add("single:lock", "other", timeout=10)
+
+        def compute_elsewhere(delay):
+            caches["default"].set("single", 43)
+
+        with mock.patch(
+            "open_inwoner.utils.decorators.time.sleep", side_effect=compute_elsewhere
+        ):
+            self.assertEqual(func(), 43)
+
+        m.assert_not_called()
+
+    def test_single_flight_computes_when_lock_is_released_without_value(self):
+        m = mock.Mock(return_value=42)
+
+        @cache("single", single_flight=True)
+        def func():
+            return m()
+
+        caches["default"].add("single:lock", "other", timeout=10)
+
+        def fail_elsewhere(delay):
+            caches["default"].delete("single:lock")
+
+        with mock.patch(
+            "open_inwoner.utils.decorators.time.sleep", side_effect=fail_elsewhere
+        ):
+            self.assertEqual(func(), 42)
+
+        m.assert_called_once()
+        self.assertIsNone(caches["default"].get("single:lock"))
+
+    @freezegun.freeze_time("2024-05-31 12:00:00", as_kwarg="frozen_time")
+    def test_stale_value_is_served_while_refreshing(self, frozen_time):
+        m = mock.Mock(side_effect=[1, 2])
+
+        @cache("swr", timeout=10, soft_timeout=1)
+        def func():
+            return m()
+
+        self.assertEqual(func(), 1)
+
+        frozen_time.tick(delta=timedelta(seconds=2))
+        with mock.patch(
+            "open_inwoner.utils.decorators._refresh_executor"
+        ) as executor_mock:
+            # stale value, refresh is scheduled once
+            self.assertEqual(func(), 1)
+            self.assertEqual(func(), 1)
+
+        executor_mock.submit.assert_called_once()
+        refresh, *refresh_args = executor_mock.submit.call_args.args
+        refresh(*refresh_args)
+
+        self.assertEqual(func(), 2)
+        self.assertEqual(m.call_count, 2)
+
+    @freezegun.freeze_time("2024-05-31 12:00:00", as_kwarg="frozen_time")
+    def test_last_good_value_is_served_on_failure(self, frozen_time):
+        m = mock.Mock(side_effect=[1, None, RuntimeError, 2])
+
+        @cache(
+            "fallback",
+            timeout=1,
+            last_good_timeout=1000,
+            is_failure=lambda result: result is None,
+        )
+        def func():
+            return m()
+
+        results = [func()]
+        for _ in range(3):
+            frozen_time.tick(delta=timedelta(seconds=60))
+            results.append(func())
+
+        self.assertEqual(results, [1, 1, 1, 2])
+
+    def test_failure_without_last_good_value(self):
+        @cache("fallback", last_good_timeout=100)
+        def func():
+            raise RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            func()
+
+    @freezegun.freeze_time("2024-05-31 12:00:00", as_kwarg="frozen_time")
+    def test_coroutine_function_stale_value_is_refreshed(self, frozen_time):
+        m = mock.Mock(side_effect=[1, 2])
+
+        @cache("async_swr", timeout=10, soft_timeout=1, single_flight=True)
+        async def func():
+            return m()
+
+        self.assertEqual(async_to_sync(func)(), 1)
+        self.assertEqual(async_to_sync(func)(), 1)
+        # the same keys as a synchronous function
+        self.assertTrue(caches["default"].get("async_swr:fresh"))
+
+        frozen_time.tick(delta=timedelta(seconds=2))
+        self.assertEqual(async_to_sync(func)(), 2)
+        self.assertEqual(m.call_count, 2)
+
+    @freezegun.freeze_time("2024-05-31 12:00:00", as_kwarg="frozen_time")
+    def test_coroutine_function_last_good_value_is_served_on_failure(self, frozen_time):
+        m = mock.Mock(side_effect=[1, None, RuntimeError, 2])
+
+        @cache(
+            "async_fallback",
+            timeout=1,
+            last_good_timeout=1000,
+            is_failure=lambda result: result is None,
+        )
+        async def func():
+            return m()
+
+        results = [async_to_sync(func)()]
+        for _ in range(3):
+            frozen_time.tick(delta=timedelta(seconds=60))
+            results.append(async_to_sync(func)())
+
+        self.assertEqual(results, [1, 1, 1, 2])
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    CACHE_LOCAL_VERSION_CHECK_INTERVAL=60,
+)
+class LocalCacheTest(SimpleTestCase):
+    def setUp(self):
+        caches["default"].clear()
+
+    def test_local_cache_is_used_before_shared_cache(self):
+        m = mock.Mock(return_value=42)
+
+        @cache("local", local_timeout=10)
+        def func():
+            return m()
+
+        self.assertEqual(func(), 42)
+
+        with mock.patch.object(caches["default"], "get") as get_mock:
+            self.assertEqual(func(), 42)
+
+        get_mock.assert_not_called()
+        m.assert_called_once()
+
+    @freezegun.freeze_time("2024-05-31 12:00:00", as_kwarg="frozen_time")
+    def test_local_timeout_expires_value(self, frozen_time):
+        @cache("local", timeout=60, local_timeout=1)
+        def func():
+            return 42
+
+        func()
+        caches["default"].set("local", 43)
+
+        self.assertEqual(func(), 42)
+        frozen_time.tick(delta=timedelta(seconds=2))
+        self.assertEqual(func(), 43)
+
+    def test_local_maxsize_evicts_least_recently_used(self):
+        local_cache = LocalCache(timeout=10, maxsize=2)
+
+        local_cache.set("a", 1)
+        local_cache.set("b", 2)
+        local_cache.get("a")
+        local_cache.set("c", 3)
+
+        self.assertEqual(len(local_cache), 2)
+        self.assertEqual(local_cache.get("a"), 1)
+        self.assertIsNone(local_cache.get("b"))
+
+    def test_invalidate_local_caches(self):
+        local_cache = LocalCache(timeout=10, maxsize=2)
+        local_cache.set("a", 1)
+
+        invalidate_local_caches()
+
+        self.assertIsNone(local_cache.get("a"))
+
+    @freezegun.freeze_time("2024-05-31 12:00:00", as_kwarg="frozen_time")
+    def test_shared_version_change_clears_local_cache(self, frozen_time):
+        local_cache = LocalCache(timeout=600, maxsize=2)
+        local_cache.get("a")
+        local_cache.set("a", 1)
+
+        # another process invalidates
+        caches["default"].set(LOCAL_CACHE_VERSION_KEY, "other")
+        self.assertEqual(local_cache.get("a"), 1)
+
+        frozen_time.tick(delta=timedelta(seconds=61))
+        self.assertIsNone(local_cache.get("a"))
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class CacheTagsTest(SimpleTestCase):
+    def setUp(self):
+        caches["default"].clear()
+
+    @freezegun.freeze_time("2024-05-31 12:00:00", as_kwarg="frozen_time")
+    def test_purge_invalidates_tagged_values(self, frozen_time):
+        m = mock.Mock(side_effect=lambda case_url, bsn: f"{case_url}:{bsn}")
+
+        @cache("tagged:{case_url}:{bsn}", tags=["zaak:{case_url}", "bsn:{bsn}"])
+        def func(case_url, bsn):
+            return m(case_url, bsn)
+
+        func("zaak-1", "bsn-1")
+        func("zaak-2", "bsn-2")
+        self.assertEqual(m.call_count, 2)
+
+        frozen_time.tick()
+        purge_cache_tags("zaak:zaak-1")
+
+        self.assertEqual(func("zaak-1", "bsn-1"), "zaak-1:bsn-1")
+        self.assertEqual(func("zaak-2", "bsn-2"), "zaak-2:bsn-2")
+        self.assertEqual(m.call_count, 3)
+
+        frozen_time.tick()
+        purge_cache_tags("bsn:bsn-2")
+
+        func("zaak-1", "bsn-1")
+        func("zaak-2", "bsn-2")
+        self.assertEqual(m.call_count, 4)
+
+    @freezegun.freeze_time("2024-05-31 12:00:00", as_kwarg="frozen_time")
+    def test_purge_during_computation_invalidates_value(self, frozen_time):
+        def compute():
+            frozen_time.tick()
+            purge_cache_tags("tag")
+            return 42
+
+        m = mock.Mock(side_effect=compute)
+
+        @cache("tagged", tags=["tag"])
+        def func():
+            return m()
+
+        func()
+        frozen_time.tick()
+        func()
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_tags_cannot_be_combined_with_other_options(self):
+        with self.assertRaises(ValueError):
+            cache("tagged", tags=["tag"], single_flight=True)
+        with self.assertRaises(ValueError):
+            cache("tagged", tags=["tag"], local_timeout=10)
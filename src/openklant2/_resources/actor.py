@@ -18,11 +18,11 @@ class ActorResource(ResourceMixin):
         data: CreateActorData,
     ) -> Actor:
         response = self._post(self.base_path, data=data)
-        return cast(Actor, self.process_response(response))
+        return cast(Actor, self.process_response(response, Actor))
 
     def retrieve(self, /, uuid: str | uuid.UUID) -> Actor:
         response = self._get(f"{self.base_path}/{str(uuid)}")
-        return cast(Actor, self.process_response(response))
+        return cast(Actor, self.process_response(response, Actor))
 
     def list(
         self, *, params: ActorListParams | None = None
@@ -30,5 +30,5 @@ class ActorResource(ResourceMixin):
         response = self._get(f"{self.base_path}", params=params)
         return cast(
             PaginatedResponseBody[Actor],
-            self.process_response(response),
+            self.process_response(response, PaginatedResponseBody[Actor]),
         )
@@ -1,11 +1,14 @@
+import functools
 import json
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     Any,
     Callable,
     Dict,
     Generator,
     List,
+    Literal,
     Mapping,
     MutableMapping,
     Optional,
@@ -14,6 +17,7 @@ from typing import (
     TypeVar,
     Union,
     cast,
+    get_origin,
 )
 
 import pydantic
@@ -24,6 +28,7 @@ from openklant2.exceptions import (
     BadRequest,
     Forbidden,
     InvalidJSONResponse,
+    InvalidResponseBody,
     NonJSONResponse,
     NotFound,
     ResponseError,
@@ -48,15 +53,62 @@ JSONObject = Dict[str, JSONValue]
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# How the bodies of successful responses are validated against their resource types:
+# - off: not at all, the bodies are trusted
+# - lazy: like strict, except for the rows of list pages, which are only validated
+#   when they are iterated over with `list_iter()`
+# - strict: fully, including all rows of list pages
+ValidationMode = Literal["off", "lazy", "strict"]
+
+
+@functools.cache
+def get_type_adapter(response_type: Any) -> pydantic.TypeAdapter:
+    """Return the TypeAdapter for `response_type`, which is only built once per type."""
+    return pydantic.TypeAdapter(response_type)
+
 
 class ResourceMixin:
     http_client: APIClient
+    prefetch_pages: bool
+    max_page_requests: Optional[int]
+    validation_mode: ValidationMode
 
-    def __init__(self, http_client: APIClient):
+    def __init__(
+        self,
+        http_client: APIClient,
+        *,
+        prefetch_pages: bool = False,
+        max_page_requests: Optional[int] = None,
+        validation_mode: ValidationMode = "off",
+    ):
         self.http_client = http_client
+        self.prefetch_pages = prefetch_pages
+        self.max_page_requests = max_page_requests
+        self.validation_mode = validation_mode
+
+    def validate_response_data(self, data: Any, response_type: Any) -> None:
+        """Validate `data` against `response_type` according to the validation mode.
+
+        The data itself is returned to the caller as received in every mode, so the
+        mode does not change the values seen by the caller.
+        """
+        match self.validation_mode:
+            case "off":
+                return
+            case "lazy" if get_origin(response_type) is PaginatedResponseBody:
+                # The rows are validated by the paginator
+                response_type = PaginatedResponseBody[Any]
+            case _:
+                pass
 
-    @staticmethod
-    def process_response(response: requests.Response) -> TypeGuard[JSONValue]:
+        try:
+            get_type_adapter(response_type).validate_python(data)
+        except pydantic.ValidationError as exc:
+            raise InvalidResponseBody(exc) from exc
+
+    def process_response(
+        self, response: requests.Response, response_type: Any = None
+    ) -> TypeGuard[JSONValue]:
         response_data = None
         try:
             content_type = response.headers.get("Content-Type", "")
@@ -73,6 +125,8 @@ class ResourceMixin:
 
         match response.status_code:
             case code if code >= 200 and code < 300 and response_data:
+                if response_type is not None:
+                    self.validate_response_data(response_data, response_type)
                 return response_data
             case code if code >= 400 and code < 500 and response_data:
                 validator = ErrorResponseBodyValidator
@@ -116,34 +170,68 @@ class ResourceMixin:
 
         return transposed_params
 
+    def _fetch_page(self, url: str, row_type: Any = None) -> PaginatedResponseBody[T]:
+        response = self.http_client.get(url)
+        response.raise_for_status()
+        data = response.json()
+        if row_type is not None:
+            self.validate_response_data(data, PaginatedResponseBody[row_type])
+        return data
+
     def _paginator(
         self,
         paginated_data: PaginatedResponseBody[T],
         max_requests: Optional[int] = None,
+        prefetch: bool = False,
+        row_type: Any = None,
     ) -> Generator[T, Any, None]:
-        def row_iterator(
-            _data: PaginatedResponseBody[T], num_requests=0
-        ) -> Generator[T, Any, None]:
-            for result in _data["results"]:
-                yield cast(T, result)
-
-            if next_url := _data.get("next"):
-                if max_requests and num_requests >= max_requests:
+        """Iterate over the rows of all pages, following the `next` links.
+
+        :param max_requests: the maximum number of requests for the pages following
+            the first page
+        :param prefetch: request the next page in a worker thread while the rows of
+            the current page are consumed
+        :param row_type: the resource type of the rows, to validate the pages against
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        validate_rows = row_type is not None and self.validation_mode == "lazy"
+        data = paginated_data
+        num_requests = 0
+
+        try:
+            while True:
+                next_page: Union[Future, str, None] = data.get("next")
+                if next_page and max_requests and num_requests >= max_requests:
                     logger.info(
                         "Number of requests while retrieving paginated results reached "
                         "maximum of %s requests, returning results",
                         max_requests,
                     )
-                    return
+                    next_page = None
+
+                if next_page:
+                    num_requests += 1
+                    if executor:
+                        next_page = executor.submit(
+                            self._fetch_page, next_page, row_type
+                        )
 
-                response = self.http_client.get(next_url)
-                num_requests += 1
-                response.raise_for_status()
-                data = response.json()
+                for result in data["results"]:
+                    if validate_rows:
+                        self.validate_response_data(result, row_type)
+                    yield cast(T, result)
 
-                yield from row_iterator(data, num_requests)
+                if not next_page:
+                    return
 
-        return row_iterator(paginated_data)
+                data = (
+                    next_page.result()
+                    if isinstance(next_page, Future)
+                    else self._fetch_page(next_page, row_type)
+                )
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
 
     def _get(
         self,
@@ -224,11 +312,16 @@ class ResourceMixin:
         )
 
     def _make_list_iter(
-        self, f: Callable[P, PaginatedResponseBody[T]]
+        self, f: Callable[P, PaginatedResponseBody[T]], row_type: Any = None
     ) -> Callable[P, Generator[T, Any, Any]]:
         """Create a fully paginated iterator for the resource list() method."""
 
         def inner(*args: P.args, **kwargs: P.kwargs) -> Generator[T, Any, None]:
-            return self._paginator(f(*args, **kwargs))
+            return self._paginator(
+                f(*args, **kwargs),
+                max_requests=self.max_page_requests,
+                prefetch=self.prefetch_pages,
+                row_type=row_type,
+            )
 
         return inner
@@ -14,7 +14,7 @@ class BetrokkeneResource(ResourceMixin):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.list_iter = self._make_list_iter(self.list)
+        self.list_iter = self._make_list_iter(self.list, Betrokkene)
 
     def create(
         self,
@@ -22,15 +22,15 @@ class BetrokkeneResource(ResourceMixin):
         data: BetrokkeneCreateData,
     ) -> Betrokkene:
         response = self._post(self.base_path, data=data)
-        return cast(Betrokkene, self.process_response(response))
+        return cast(Betrokkene, self.process_response(response, Betrokkene))
 
     def retrieve(self, /, uuid: str | uuid.UUID) -> Betrokkene:
         response = self._get(f"{self.base_path}/{str(uuid)}")
-        return cast(Betrokkene, self.process_response(response))
+        return cast(Betrokkene, self.process_response(response, Betrokkene))
 
     def list(self) -> PaginatedResponseBody[Betrokkene]:
         response = self._get(f"{self.base_path}")
         return cast(
             PaginatedResponseBody[Betrokkene],
-            self.process_response(response),
+            self.process_response(response, PaginatedResponseBody[Betrokkene]),
         )
@@ -21,12 +21,13 @@ class DigitaalAdresResource(ResourceMixin):
     ) -> PaginatedResponseBody[DigitaalAdres]:
         response = self._get(self.base_path, params=params)
         return cast(
-            PaginatedResponseBody[DigitaalAdres], self.process_response(response)
+            PaginatedResponseBody[DigitaalAdres],
+            self.process_response(response, PaginatedResponseBody[DigitaalAdres]),
         )
 
     def retrieve(self, /, uuid: str | uuid.UUID) -> DigitaalAdres:
         response = self._get(f"{self.base_path}/{str(uuid)}")
-        return cast(DigitaalAdres, self.process_response(response))
+        return cast(DigitaalAdres, self.process_response(response, DigitaalAdres))
 
     def create(
         self,
@@ -34,4 +35,4 @@ class DigitaalAdresResource(ResourceMixin):
         data: CreateDigitaalAdresData,
     ) -> DigitaalAdres:
         response = self._post(self.base_path, data=data)
-        return cast(DigitaalAdres, self.process_response(response))
+        return cast(DigitaalAdres, self.process_response(response, DigitaalAdres))
@@ -14,7 +14,7 @@ class InterneTaakResource(ResourceMixin):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.list_iter = self._make_list_iter(self.list)
+        self.list_iter = self._make_list_iter(self.list, InterneTaak)
 
     def create(
         self,
@@ -22,15 +22,15 @@ class InterneTaakResource(ResourceMixin):
         data: CreateInterneTaakData,
     ) -> InterneTaak:
         response = self._post(self.base_path, data=data)
-        return cast(InterneTaak, self.process_response(response))
+        return cast(InterneTaak, self.process_response(response, InterneTaak))
 
     def retrieve(self, /, uuid: str | uuid.UUID) -> InterneTaak:
         response = self._get(f"{self.base_path}/{str(uuid)}")
-        return cast(InterneTaak, self.process_response(response))
+        return cast(InterneTaak, self.process_response(response, InterneTaak))
 
     def list(self) -> PaginatedResponseBody[InterneTaak]:
         response = self._get(f"{self.base_path}")
         return cast(
             PaginatedResponseBody[InterneTaak],
-            self.process_response(response),
+            self.process_response(response, PaginatedResponseBody[InterneTaak]),
         )
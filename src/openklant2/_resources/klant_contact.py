@@ -19,7 +19,7 @@ class KlantContactResource(ResourceMixin):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.list_iter = self._make_list_iter(self.list)
+        self.list_iter = self._make_list_iter(self.list, KlantContact)
 
     def create(
         self,
@@ -27,7 +27,7 @@ class KlantContactResource(ResourceMixin):
         data: CreateKlantContactData,
     ) -> KlantContact:
         response = self._post(self.base_path, data=data)
-        return cast(KlantContact, self.process_response(response))
+        return cast(KlantContact, self.process_response(response, KlantContact))
 
     def retrieve(
         self,
@@ -37,7 +37,7 @@ class KlantContactResource(ResourceMixin):
         params: RetrieveKlantContactParams | None = None,
     ) -> KlantContact:
         response = self._get(f"{self.base_path}/{str(uuid)}", params=params)
-        return cast(KlantContact, self.process_response(response))
+        return cast(KlantContact, self.process_response(response, KlantContact))
 
     def list(
         self, *, params: ListKlantContactParams | None = None
@@ -45,5 +45,5 @@ class KlantContactResource(ResourceMixin):
         response = self._get(f"{self.base_path}", params=params)
         return cast(
             PaginatedResponseBody[KlantContact],
-            self.process_response(response),
+            self.process_response(response, PaginatedResponseBody[KlantContact]),
         )
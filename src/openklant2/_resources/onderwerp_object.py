@@ -22,11 +22,11 @@ class OnderwerpObjectResource(ResourceMixin):
         data: CreateOnderwerpObjectData,
     ) -> OnderwerpObject:
         response = self._post(self.base_path, data=data)
-        return cast(OnderwerpObject, self.process_response(response))
+        return cast(OnderwerpObject, self.process_response(response, OnderwerpObject))
 
     def retrieve(self, /, uuid: str | uuid.UUID) -> OnderwerpObject:
         response = self._get(f"{self.base_path}/{str(uuid)}")
-        return cast(OnderwerpObject, self.process_response(response))
+        return cast(OnderwerpObject, self.process_response(response, OnderwerpObject))
 
     def list(
         self, *, params: OnderwerpobjectIdentificatorListParams | None = None
@@ -34,5 +34,5 @@ class OnderwerpObjectResource(ResourceMixin):
         response = self._get(f"{self.base_path}", params=params)
         return cast(
             PaginatedResponseBody[OnderwerpObject],
-            self.process_response(response),
+            self.process_response(response, PaginatedResponseBody[OnderwerpObject]),
         )
@@ -23,13 +23,16 @@ class PartijResource(ResourceMixin):
         self, *, params: PartijListParams | None = None
     ) -> PaginatedResponseBody[Partij]:
         response = self._get(self.base_path, params=params)
-        return cast(PaginatedResponseBody[Partij], self.process_response(response))
+        return cast(
+            PaginatedResponseBody[Partij],
+            self.process_response(response, PaginatedResponseBody[Partij]),
+        )
 
     def retrieve(
         self, /, uuid: str | uuid.UUID, *, params: Optional[PartijRetrieveParams] = None
     ) -> Partij:
         response = self._get(f"{self.base_path}/{str(uuid)}", params=params)
-        return cast(Partij, self.process_response(response))
+        return cast(Partij, self.process_response(response, Partij))
 
     # Partij is polymorphic on "soortPartij", with varying fields for Persoon, Organisatie and ContactPersoon
     def create_organisatie(self, *, data: CreatePartijOrganisatieData) -> Partij:
@@ -59,4 +62,4 @@ class PartijResource(ResourceMixin):
         ),
     ) -> Partij:
         response = self._post(self.base_path, data=data)
-        return cast(Partij, self.process_response(response))
+        return cast(Partij, self.process_response(response, Partij))
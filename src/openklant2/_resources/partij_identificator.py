@@ -21,12 +21,15 @@ class PartijIdentificatorResource(ResourceMixin):
     ) -> PaginatedResponseBody[PartijIdentificator]:
         response = self._get(self.base_path, params=params)
         return cast(
-            PaginatedResponseBody[PartijIdentificator], self.process_response(response)
+            PaginatedResponseBody[PartijIdentificator],
+            self.process_response(response, PaginatedResponseBody[PartijIdentificator]),
         )
 
     def retrieve(self, /, uuid: str | uuid.UUID) -> PartijIdentificator:
         response = self._get(f"{self.base_path}/{str(uuid)}")
-        return cast(PartijIdentificator, self.process_response(response))
+        return cast(
+            PartijIdentificator, self.process_response(response, PartijIdentificator)
+        )
 
     def create(
         self,
@@ -34,4 +37,6 @@ class PartijIdentificatorResource(ResourceMixin):
         data: CreatePartijIdentificatorData,
     ) -> PartijIdentificator:
         response = self._post(self.base_path, data=data)
-        return cast(PartijIdentificator, self.process_response(response))
+        return cast(
+            PartijIdentificator, self.process_response(response, PartijIdentificator)
+        )
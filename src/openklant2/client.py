@@ -1,6 +1,7 @@
 from ape_pie import APIClient
 
 from openklant2._resources.actor import ActorResource
+from openklant2._resources.base import ValidationMode
 from openklant2._resources.betrokkene import BetrokkeneResource
 from openklant2._resources.digitaal_adres import DigitaalAdresResource
 from openklant2._resources.interne_taak import InterneTaakResource
@@ -14,17 +15,42 @@ class OpenKlant2Client:
     http_client: APIClient
     partij: PartijResource
 
-    def __init__(self, token: str, api_root: str):
+    def __init__(
+        self,
+        token: str,
+        api_root: str,
+        *,
+        prefetch_pages: bool = False,
+        max_page_requests: int | None = None,
+        validation_mode: ValidationMode = "off",
+    ):
+        """
+        :param prefetch_pages: let `list_iter()` request the next page in a worker
+            thread while the rows of the current page are consumed
+        :param max_page_requests: the maximum number of requests for the pages
+            following the first page in `list_iter()`
+        :param validation_mode: how the bodies of successful responses are validated
+            against their resource types, see `ValidationMode`
+        """
         self.http_client = APIClient(
             request_kwargs={"headers": {"Authorization": f"Token {token}"}},
             base_url=api_root,
         )
 
-        self.partij = PartijResource(self.http_client)
-        self.partij_identificator = PartijIdentificatorResource(self.http_client)
-        self.digitaal_adres = DigitaalAdresResource(self.http_client)
-        self.klant_contact = KlantContactResource(self.http_client)
-        self.onderwerp_object = OnderwerpObjectResource(self.http_client)
-        self.actor = ActorResource(self.http_client)
-        self.interne_taak = InterneTaakResource(self.http_client)
-        self.betrokkene = BetrokkeneResource(self.http_client)
+        resource_kwargs = {
+            "prefetch_pages": prefetch_pages,
+            "max_page_requests": max_page_requests,
+            "validation_mode": validation_mode,
+        }
+        self.partij = PartijResource(self.http_client, **resource_kwargs)
+        self.partij_identificator = PartijIdentificatorResource(
+            self.http_client, **resource_kwargs
+        )
+        self.digitaal_adres = DigitaalAdresResource(self.http_client, **resource_kwargs)
+        self.klant_contact = KlantContactResource(self.http_client, **resource_kwargs)
+        self.onderwerp_object = OnderwerpObjectResource(
+            self.http_client, **resource_kwargs
+        )
+        self.actor = ActorResource(self.http_client, **resource_kwargs)
+        self.interne_taak = InterneTaakResource(self.http_client, **resource_kwargs)
+        self.betrokkene = BetrokkeneResource(self.http_client, **resource_kwargs)
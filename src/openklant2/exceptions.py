@@ -1,6 +1,7 @@
 import pprint
 from typing import Literal, cast
 
+from pydantic import ValidationError
 from requests import Response
 
 from openklant2.types.error import (
@@ -47,6 +48,16 @@ class InvalidJSONResponse(ResponseError):
         )
 
 
+class InvalidResponseBody(OpenKlant2Exception):
+    """A response body did not match the schema of the expected resource."""
+
+    def __init__(self, error: ValidationError):
+        self.error = error
+        super().__init__(
+            f"The response body did not match the expected schema: {error}"
+        )
+
+
 class StructuredErrorResponse(ResponseError):
     """An error response with a well-known JSON object describing the error."""
 
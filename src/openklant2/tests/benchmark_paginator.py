@@ -0,0 +1,92 @@
+"""
+Benchmark `_paginator()` with and without prefetching the next page, by replaying the
+list pages recorded in the VCR cassettes with a simulated latency per request.
+
+The cassettes don't record the response times, so the latency (and the time spent per
+row by the consumer) are arguments. Run from the `src` directory:
+
+    python -m openklant2.tests.benchmark_paginator --latency 0.1 --row-time 0.001
+"""
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import yaml
+
+from openklant2._resources.base import ResourceMixin
+
+CASSETTES_DIR = Path(__file__).parent / "cassettes"
+
+
+class ReplayHttpClient:
+    def __init__(self, pages: dict, latency: float):
+        self.pages = pages
+        self.latency = latency
+
+    def get(self, url):
+        time.sleep(self.latency)
+        return Mock(json=Mock(return_value=self.pages[url]))
+
+
+def load_listings() -> dict[str, tuple[str, dict]]:
+    """
+    Return the URL of the first page and the pages by URL of the recorded listings
+    with more than one page, by cassette
+    """
+    listings = {}
+    for path in sorted(CASSETTES_DIR.glob("*/*.yaml")):
+        pages = {}
+        for interaction in yaml.safe_load(path.read_text())["interactions"]:
+            if interaction["request"]["method"] != "GET":
+                continue
+            try:
+                data = json.loads(interaction["response"]["body"]["string"])
+            except ValueError:
+                continue
+            if isinstance(data, dict) and "results" in data:
+                pages[interaction["request"]["uri"]] = data
+
+        for url, page in pages.items():
+            if page["previous"] is None and page["next"] in pages:
+                listings[f"{path.parent.name}/{path.stem}"] = (url, pages)
+    return listings
+
+
+def run(first_url: str, pages: dict, prefetch: bool, args) -> float:
+    http_client = ReplayHttpClient(pages, args.latency)
+    resource = ResourceMixin(http_client)
+
+    start = time.perf_counter()
+    first_page = http_client.get(first_url).json()
+    for _ in resource._paginator(first_page, prefetch=prefetch):
+        time.sleep(args.row_time)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.1, help="seconds/request")
+    parser.add_argument("--row-time", type=float, default=0.001, help="seconds/row")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, (first_url, pages) in load_listings().items():
+        timings = {
+            prefetch: statistics.median(
+                run(first_url, pages, prefetch, args) for _ in range(args.repeat)
+            )
+            for prefetch in (False, True)
+        }
+        print(
+            f"{name} ({len(pages)} pages): "
+            f"{timings[False] * 1000:.0f} ms sequential, "
+            f"{timings[True] * 1000:.0f} ms with prefetch "
+            f"({1 - timings[True] / timings[False]:.0%} saved)"
+        )
+
+
+if __name__ == "__main__":
+    main()
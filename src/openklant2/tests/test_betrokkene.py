@@ -1,6 +1,8 @@
 import pytest
 from pydantic import TypeAdapter
 
+from openklant2._resources.betrokkene import BetrokkeneResource
+from openklant2.exceptions import InvalidResponseBody
 from openklant2.factories.betrokkene import BetrokkeneCreateDataFactory
 from openklant2.factories.klant_contact import CreateKlantContactDataFactory
 from openklant2.factories.partij import CreatePartijPersoonDataFactory
@@ -132,6 +134,28 @@ def test_retrieve_betrokkene(client, een_betrokkene):
     assert resp["uuid"] == een_betrokkene["uuid"]
 
 
+@pytest.mark.vcr
+def test_retrieve_betrokkene_with_strict_validation(client, een_betrokkene):
+    resource = BetrokkeneResource(client.http_client, validation_mode="strict")
+
+    resp = resource.retrieve(een_betrokkene["uuid"])
+
+    assert resp["uuid"] == een_betrokkene["uuid"]
+
+
+def test_lazy_validation_validates_rows_on_iteration(client):
+    page = {"count": 1, "next": None, "previous": None, "results": [{"uuid": "1"}]}
+    resource = BetrokkeneResource(client.http_client, validation_mode="lazy")
+
+    resource.validate_response_data(page, PaginatedResponseBody[Betrokkene])
+    with pytest.raises(InvalidResponseBody):
+        list(resource._paginator(page, row_type=Betrokkene))
+
+    resource.validation_mode = "strict"
+    with pytest.raises(InvalidResponseBody):
+        resource.validate_response_data(page, PaginatedResponseBody[Betrokkene])
+
+
 @pytest.mark.vcr
 def test_list_betrokkenen_as_pagination_iter(client, betrokkene_factory):
     # We can't specify the pagesize, so we have to use the default 100 to create more than 1 page of data
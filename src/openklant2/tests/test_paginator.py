@@ -0,0 +1,93 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from openklant2._resources.base import ResourceMixin
+
+
+def make_pages(num_pages: int, rows_per_page: int = 2) -> dict:
+    urls = [f"https://openklant.nl/api/v1/partijen?page={i}" for i in range(num_pages)]
+    return {
+        url: {
+            "count": num_pages * rows_per_page,
+            "next": urls[i + 1] if i + 1 < num_pages else None,
+            "previous": urls[i - 1] if i else None,
+            "results": [{"uuid": f"{i}-{j}"} for j in range(rows_per_page)],
+        }
+        for i, url in enumerate(urls)
+    }
+
+
+class StubHttpClient:
+    """Serve the pages by URL, and record the requested URLs"""
+
+    def __init__(self, pages: dict):
+        self.pages = pages
+        self.requested_urls = []
+        self.requested = threading.Event()
+
+    def get(self, url):
+        self.requested_urls.append(url)
+        self.requested.set()
+        return Mock(json=Mock(return_value=self.pages[url]))
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_paginator_follows_next_links(prefetch):
+    pages = make_pages(3)
+    first_url, *next_urls = pages
+    http_client = StubHttpClient(pages)
+    resource = ResourceMixin(http_client)
+
+    rows = list(resource._paginator(pages[first_url], prefetch=prefetch))
+
+    assert [row["uuid"] for row in rows] == [
+        "0-0",
+        "0-1",
+        "1-0",
+        "1-1",
+        "2-0",
+        "2-1",
+    ]
+    assert http_client.requested_urls == next_urls
+
+
+def test_paginator_prefetches_the_next_page():
+    pages = make_pages(2)
+    first_url, next_url = pages
+    http_client = StubHttpClient(pages)
+    resource = ResourceMixin(http_client)
+
+    rows = resource._paginator(pages[first_url], prefetch=True)
+    assert next(rows)["uuid"] == "0-0"
+
+    # requested while the rows of the first page are consumed
+    assert http_client.requested.wait(timeout=5)
+    assert http_client.requested_urls == [next_url]
+    assert len(list(rows)) == 3
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_paginator_honours_max_requests(prefetch):
+    pages = make_pages(4)
+    first_url, next_url, *_ = pages
+    http_client = StubHttpClient(pages)
+    resource = ResourceMixin(http_client)
+
+    rows = list(
+        resource._paginator(pages[first_url], max_requests=1, prefetch=prefetch)
+    )
+
+    assert len(rows) == 4
+    assert http_client.requested_urls == [next_url]
+
+
+def test_paginator_does_not_nest_generators_per_page():
+    pages = make_pages(2000, rows_per_page=1)
+    first_url = next(iter(pages))
+    resource = ResourceMixin(StubHttpClient(pages))
+
+    rows = list(resource._paginator(pages[first_url]))
+
+    assert len(rows) == 2000